@@ -32,11 +32,43 @@ class Option(Enum):
     K8S_KUBECONFIG_PATH = ("k8s", "kubeconfig_path")
     K8S_KUBECONFIG = ("k8s", "kubeconfig")
     K8S_CLIENT_CONFIGURATION = ("k8s", "client_configuration")
+    K8S_ASYNC_CLIENT_ENABLED = ("k8s", "async_client_enabled")
+    K8S_CONNECTION_POOL_MAXSIZE = ("k8s", "connection_pool_maxsize")
+    K8S_HTTP2_ENABLED = ("k8s", "http2_enabled")
 
     OFFLOADING_NAMESPACE_PREFIX = ("offloading", "namespace_prefix")
     OFFLOADING_NAMESPACE_PREFIX_EXCLUSIONS = ("offloading", "namespace_prefix_exclusions")
     OFFLOADING_NODE_SELECTOR = ("offloading", "node_selector")
     OFFLOADING_NODE_TOLERATIONS = ("offloading", "node_tolerations")
+    OFFLOADING_PVC_CACHE_TTL_SECONDS = ("offloading", "pvc_cache_ttl_seconds")
+    OFFLOADING_STATUS_STRATEGY = ("offloading", "status_strategy")
+    OFFLOADING_STATUS_NAMESPACE_BATCH_MIN_PODS = ("offloading", "status_namespace_batch_min_pods")
+    OFFLOADING_STATUS_CONCURRENCY = ("offloading", "status_concurrency")
+    OFFLOADING_STATUS_RAW_JSON = ("offloading", "status_raw_json")
+    OFFLOADING_STATUS_CACHE_TTL_SECONDS = ("offloading", "status_cache_ttl_seconds")
+    OFFLOADING_STATUS_CACHE_MAX_ENTRIES = ("offloading", "status_cache_max_entries")
+    OFFLOADING_STATUS_CACHE_MAX_BYTES = ("offloading", "status_cache_max_bytes")
+    OFFLOADING_CREATE_RAW_JSON = ("offloading", "create_raw_json")
+    OFFLOADING_SINGLE_FLIGHT_ENABLED = ("offloading", "single_flight_enabled")
+    OFFLOADING_LOG_FOLLOW_MAX_STREAMS = ("offloading", "log_follow_max_streams")
+    OFFLOADING_POD_INFORMER_ENABLED = ("offloading", "pod_informer_enabled")
+    OFFLOADING_POD_INFORMER_RESYNC_SECONDS = ("offloading", "pod_informer_resync_seconds")
+    OFFLOADING_POD_INFORMER_MAX_STALENESS_SECONDS = ("offloading", "pod_informer_max_staleness_seconds")
+    OFFLOADING_DELETE_QUEUE_ENABLED = ("offloading", "delete_queue_enabled")
+    OFFLOADING_DELETE_QUEUE_WORKERS = ("offloading", "delete_queue_workers")
+    OFFLOADING_DELETE_QUEUE_MAX_TRIES = ("offloading", "delete_queue_max_tries")
+    OFFLOADING_RECONCILER_ENABLED = ("offloading", "reconciler_enabled")
+    OFFLOADING_RECONCILER_DRY_RUN = ("offloading", "reconciler_dry_run")
+    OFFLOADING_RECONCILER_INTERVAL_SECONDS = ("offloading", "reconciler_interval_seconds")
+    OFFLOADING_RECONCILER_GRACE_PERIOD_SECONDS = ("offloading", "reconciler_grace_period_seconds")
+    OFFLOADING_RECONCILER_BATCH_SIZE = ("offloading", "reconciler_batch_size")
+    OFFLOADING_RECONCILER_BATCH_INTERVAL_SECONDS = ("offloading", "reconciler_batch_interval_seconds")
+    OFFLOADING_RECONCILER_MAX_RELEASES = ("offloading", "reconciler_max_releases")
+    OFFLOADING_NAMESPACE_REAPER_ENABLED = ("offloading", "namespace_reaper_enabled")
+    OFFLOADING_NAMESPACE_REAPER_INTERVAL_SECONDS = ("offloading", "namespace_reaper_interval_seconds")
+    OFFLOADING_NAMESPACE_REAPER_GRACE_PERIOD_SECONDS = ("offloading", "namespace_reaper_grace_period_seconds")
+    OFFLOADING_REMOTE_INDEX_ENABLED = ("offloading", "remote_index_enabled")
+    OFFLOADING_REMOTE_INDEX_RESYNC_SECONDS = ("offloading", "remote_index_resync_seconds")
 
     MESH_INIT_CONTAINER = ("mesh", "init_container")
     MESH_STARTUP_PROBE = ("mesh", "startup_probe")
@@ -75,6 +75,18 @@ class MissingPropertiesError(ApplicationError):
     template = "The following properties are missing for {object_name}: {missing}"
 
 
+class TooManyRequestsError(ApplicationError):
+    """
+    The request was rejected because too many similar requests are already being served.
+
+    :ivar what: The kind of requests being served.
+    :ivar limit: The max number of such requests served at once.
+    """
+
+    template = "Too many {what}, at most {limit} are served at once"
+    status_code = HTTPStatus.TOO_MANY_REQUESTS.value
+
+
 class ValidationError(ApplicationError):
     """
     An exception occurred validating parameters.
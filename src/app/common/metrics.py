@@ -0,0 +1,23 @@
+"""
+In-process metrics (counters and gauges), exposed as JSON by the `/metrics` endpoint
+"""
+
+from typing import Callable
+
+_counters: dict[str, float] = {}
+_gauges: dict[str, Callable[[], float]] = {}
+
+
+def increment(name: str, value: float = 1) -> None:
+    """Increment the counter `name` by `value`, starting from 0"""
+    _counters[name] = _counters.get(name, 0) + value
+
+
+def register_gauge(name: str, read: Callable[[], float]) -> None:
+    """Register the gauge `name`, whose current value is returned by `read`"""
+    _gauges[name] = read
+
+
+def snapshot() -> dict[str, float]:
+    """Current value of all counters and gauges, by name"""
+    return {**_counters, **{name: read() for name, read in _gauges.items()}}
@@ -0,0 +1,76 @@
+"""
+Classes to model API responses
+"""
+
+from functools import lru_cache
+from http import HTTPStatus
+from typing import Any, AsyncIterable
+
+from fastapi.responses import Response, StreamingResponse
+from pydantic import TypeAdapter
+
+from app.controllers.common.dto import ApiErrorResponseDto
+
+COMMON_ERROR_RESPONSES: dict[int | str, dict[str, Any]] = {
+    # 401
+    str(HTTPStatus.UNAUTHORIZED.value): {
+        "model": ApiErrorResponseDto,
+        "description": HTTPStatus.UNAUTHORIZED.phrase,
+    },
+    # 403
+    str(HTTPStatus.FORBIDDEN.value): {
+        "model": ApiErrorResponseDto,
+        "description": HTTPStatus.FORBIDDEN.phrase,
+    },
+    # 422 - raised by Pydantic on validation error
+    str(HTTPStatus.UNPROCESSABLE_ENTITY.value): {
+        "model": ApiErrorResponseDto,
+        "description": HTTPStatus.UNPROCESSABLE_ENTITY.phrase,
+    },
+    # 500
+    str(HTTPStatus.INTERNAL_SERVER_ERROR.value): {
+        "model": ApiErrorResponseDto,
+        "description": HTTPStatus.INTERNAL_SERVER_ERROR.phrase,
+    },
+}
+
+
+@lru_cache(maxsize=None)
+def _type_adapter(content_type: Any) -> TypeAdapter:
+    return TypeAdapter(content_type)
+
+
+class PydanticJSONResponse(Response):
+    """JSON response rendering already validated pydantic models (of type `content_type`) by alias, straight to bytes.
+
+    FastAPI would otherwise validate the returned models against the response model, convert them to Python objects
+    (`jsonable_encoder`) and dump them with `json.dumps`. Declare `response_model` on the route to keep the OpenAPI
+    schema, since it is not inferred from the endpoint signature when returning a response.
+    """
+
+    media_type = "application/json"
+
+    def __init__(self, content: Any, content_type: Any, status_code: int = HTTPStatus.OK.value, **kwargs):
+        self._type_adapter = _type_adapter(content_type)
+        super().__init__(content, status_code, **kwargs)
+
+    def render(self, content: Any) -> bytes:
+        return self._type_adapter.dump_json(content, by_alias=True)
+
+
+class PydanticNDJSONResponse(StreamingResponse):
+    """Newline-delimited JSON response streaming pydantic models (of type `content_type`) by alias, one per line,
+    as they are yielded by `content`"""
+
+    media_type = "application/x-ndjson"
+
+    def __init__(
+        self, content: AsyncIterable[Any], content_type: Any, status_code: int = HTTPStatus.OK.value, **kwargs
+    ):
+        type_adapter = _type_adapter(content_type)
+
+        async def render_lines():
+            async for item in content:
+                yield type_adapter.dump_json(item, by_alias=True) + b"\n"
+
+        super().__init__(render_lines(), status_code, **kwargs)
@@ -3,36 +3,26 @@ from typing import Any
 
 import interlink as i
 from fastapi import APIRouter, Depends
-from fastapi.responses import PlainTextResponse
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
 from fastapi_router_controller import Controller
+from starlette.background import BackgroundTask
 
+from app.common import metrics
 from app.controllers.common.dto import ApiErrorResponseDto
+from app.controllers.common.responses import COMMON_ERROR_RESPONSES, PydanticJSONResponse
 from app.dependencies import get_kubernetes_plugin_service
+from app.entities.pod_status_request import PodStatusRequest
 from app.services.kubernetes_plugin_service import KubernetesPluginService
 
 router = APIRouter()  # APIRouter(prefix="/api/v1/pod", tags=["V1Pod"])
 controller = Controller(router, openapi_tag={"name": "Kubernetes Plugin Controller Api"})
 
-COMMON_ERROR_RESPONSES: dict[int | str, dict[str, Any]] = {
-    # 401
-    str(HTTPStatus.UNAUTHORIZED.value): {
+_LOGS_RESPONSES: dict[int | str, dict[str, Any]] = {
+    **COMMON_ERROR_RESPONSES,
+    # 429 - too many followed logs
+    str(HTTPStatus.TOO_MANY_REQUESTS.value): {
         "model": ApiErrorResponseDto,
-        "description": HTTPStatus.UNAUTHORIZED.phrase,
-    },
-    # 403
-    str(HTTPStatus.FORBIDDEN.value): {
-        "model": ApiErrorResponseDto,
-        "description": HTTPStatus.FORBIDDEN.phrase,
-    },
-    # 422 - raised by Pydantic on validation error
-    str(HTTPStatus.UNPROCESSABLE_ENTITY.value): {
-        "model": ApiErrorResponseDto,
-        "description": HTTPStatus.UNPROCESSABLE_ENTITY.phrase,
-    },
-    # 500
-    str(HTTPStatus.INTERNAL_SERVER_ERROR.value): {
-        "model": ApiErrorResponseDto,
-        "description": HTTPStatus.INTERNAL_SERVER_ERROR.phrase,
+        "description": HTTPStatus.TOO_MANY_REQUESTS.phrase,
     },
 }
 
@@ -41,53 +31,62 @@ COMMON_ERROR_RESPONSES: dict[int | str, dict[str, Any]] = {
 @controller.resource()
 class KubernetesPluginController:
     @controller.route.get(
-        "/status", summary="Get status", response_model_by_alias=True, responses=COMMON_ERROR_RESPONSES
+        "/status",
+        summary="Get status",
+        response_model=list[i.PodStatus],
+        response_model_by_alias=True,
+        responses=COMMON_ERROR_RESPONSES,
     )
     async def get_status(
         self,
-        i_pods: list[i.PodRequest],
+        i_pods: list[PodStatusRequest],
         k_service: KubernetesPluginService = Depends(get_kubernetes_plugin_service),
-    ) -> list[i.PodStatus]:
-        return await k_service.get_status(i_pods)
+    ) -> PydanticJSONResponse:
+        return PydanticJSONResponse(await k_service.get_status(i_pods), list[i.PodStatus])
 
     @controller.route.post(
         "/status",
         summary="Get status (POST compatibility)",
+        response_model=list[i.PodStatus],
         response_model_by_alias=True,
         responses=COMMON_ERROR_RESPONSES,
     )
     async def post_status(
         self,
-        i_pods: list[i.PodRequest],
+        i_pods: list[PodStatusRequest],
         k_service: KubernetesPluginService = Depends(get_kubernetes_plugin_service),
-    ) -> list[i.PodStatus]:
-        return await k_service.get_status(i_pods)
+    ) -> PydanticJSONResponse:
+        return PydanticJSONResponse(await k_service.get_status(i_pods), list[i.PodStatus])
 
-    @controller.route.get("/getLogs", summary="Get logs", responses=COMMON_ERROR_RESPONSES)
+    @controller.route.get("/getLogs", summary="Get logs", responses=_LOGS_RESPONSES)
     async def get_logs(
         self,
         i_log_req: i.LogRequest,
         k_service: KubernetesPluginService = Depends(get_kubernetes_plugin_service),
-    ) -> PlainTextResponse:
-        return PlainTextResponse(await k_service.get_logs(i_log_req))
+    ) -> Response:
+        return await _logs_response(i_log_req, k_service)
 
-    @controller.route.post("/getLogs", summary="Get logs (POST compatibility)", responses=COMMON_ERROR_RESPONSES)
+    @controller.route.post("/getLogs", summary="Get logs (POST compatibility)", responses=_LOGS_RESPONSES)
     async def post_logs(
         self,
         i_log_req: i.LogRequest,
         k_service: KubernetesPluginService = Depends(get_kubernetes_plugin_service),
-    ) -> PlainTextResponse:
-        return PlainTextResponse(await k_service.get_logs(i_log_req))
+    ) -> Response:
+        return await _logs_response(i_log_req, k_service)
 
     @controller.route.post(
-        "/create", summary="Create Pod", response_model_by_alias=True, responses=COMMON_ERROR_RESPONSES
+        "/create",
+        summary="Create Pod",
+        response_model=i.CreateStruct,
+        response_model_by_alias=True,
+        responses=COMMON_ERROR_RESPONSES,
     )
     async def create_pod(
         self,
         i_pod_with_volumes: i.Pod,
         k_service: KubernetesPluginService = Depends(get_kubernetes_plugin_service),
-    ) -> i.CreateStruct:
-        return await k_service.create_pod(i_pod_with_volumes)
+    ) -> PydanticJSONResponse:
+        return PydanticJSONResponse(await k_service.create_pod(i_pod_with_volumes), i.CreateStruct)
 
     @controller.route.post("/delete", summary="Delete Pod", responses=COMMON_ERROR_RESPONSES)
     async def delete_pod(
@@ -96,3 +95,16 @@ class KubernetesPluginController:
         k_service: KubernetesPluginService = Depends(get_kubernetes_plugin_service),
     ) -> str:
         return await k_service.delete_pod(i_pod)
+
+    @controller.route.get("/metrics", summary="Get metrics", responses=COMMON_ERROR_RESPONSES)
+    async def get_metrics(self) -> dict[str, float]:
+        return metrics.snapshot()
+
+
+async def _logs_response(i_log_req: i.LogRequest, k_service: KubernetesPluginService) -> Response:
+    """Plain text logs, or followed logs streamed as they are written if `opts.follow` is set"""
+    if i_log_req.opts.follow:
+        log_stream = await k_service.follow_logs(i_log_req)
+        # Closed once the response is over, even if the body was never sent (e.g., the client disconnected)
+        return StreamingResponse(log_stream, media_type="text/plain", background=BackgroundTask(log_stream.aclose))
+    return PlainTextResponse(await k_service.get_logs(i_log_req))
@@ -0,0 +1,5 @@
+from .status_changes_dto import StatusChangesDto
+
+__all__ = [
+    "StatusChangesDto",
+]
@@ -0,0 +1,19 @@
+"""
+Classes to model status changes
+"""
+
+import interlink as i
+from pydantic import BaseModel, Field  # pylint: disable=no-name-in-module
+
+
+class StatusChangesDto(BaseModel):
+    cursor: str = Field(..., description="Cursor to pass on the next request, to get only the later changes")
+    pods: list[i.PodStatus] = Field(..., description="Status of the pods changed since the requested cursor")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "cursor": "3f2a9c1b7e4d-42",
+                "pods": [],
+            }
+        }
@@ -0,0 +1,93 @@
+from http import HTTPStatus
+from typing import Any
+
+import interlink as i
+from fastapi import APIRouter, Depends, Query
+from fastapi_router_controller import Controller
+
+from app.controllers.common.responses import COMMON_ERROR_RESPONSES, PydanticJSONResponse, PydanticNDJSONResponse
+from app.controllers.v2.dto import StatusChangesDto
+from app.dependencies import get_kubernetes_plugin_service
+from app.entities.pod_status_request import PodStatusRequest
+from app.services.kubernetes_plugin_service import KubernetesPluginService
+
+router = APIRouter(prefix="/v2")
+controller = Controller(router, openapi_tag={"name": "Kubernetes Plugin Controller Api v2"})
+
+_NDJSON_STATUS_RESPONSES: dict[int | str, dict[str, Any]] = {
+    # 200
+    str(HTTPStatus.OK.value): {
+        "model": i.PodStatus,
+        "description": "One PodStatus per line (newline-delimited JSON), in order of availability",
+    },
+    **COMMON_ERROR_RESPONSES,
+}
+
+_CURSOR_QUERY = Query(None, description="Cursor returned by the previous request, omit to get the status of all pods")
+_TIMEOUT_SECONDS_QUERY = Query(
+    0, ge=0, le=300, description="If no pod changed, wait up to the given seconds for a change (long polling)"
+)
+
+
+@controller.use()
+@controller.resource()
+class KubernetesPluginController:
+    """Status endpoints for very large batches; see the v1 controller for the other endpoints"""
+
+    @controller.route.get(
+        "/status",
+        summary="Stream status",
+        response_class=PydanticNDJSONResponse,
+        responses=_NDJSON_STATUS_RESPONSES,
+    )
+    async def get_status(
+        self,
+        i_pods: list[PodStatusRequest],
+        k_service: KubernetesPluginService = Depends(get_kubernetes_plugin_service),
+    ) -> PydanticNDJSONResponse:
+        return PydanticNDJSONResponse(k_service.iter_status(i_pods), i.PodStatus)
+
+    @controller.route.post(
+        "/status",
+        summary="Stream status (POST compatibility)",
+        response_class=PydanticNDJSONResponse,
+        responses=_NDJSON_STATUS_RESPONSES,
+    )
+    async def post_status(
+        self,
+        i_pods: list[PodStatusRequest],
+        k_service: KubernetesPluginService = Depends(get_kubernetes_plugin_service),
+    ) -> PydanticNDJSONResponse:
+        return PydanticNDJSONResponse(k_service.iter_status(i_pods), i.PodStatus)
+
+    @controller.route.get(
+        "/status/changes",
+        summary="Get status changes",
+        response_model=StatusChangesDto,
+        responses=COMMON_ERROR_RESPONSES,
+    )
+    async def get_status_changes(
+        self,
+        i_pods: list[PodStatusRequest],
+        cursor: str | None = _CURSOR_QUERY,
+        timeout_seconds: float = _TIMEOUT_SECONDS_QUERY,
+        k_service: KubernetesPluginService = Depends(get_kubernetes_plugin_service),
+    ) -> PydanticJSONResponse:
+        next_cursor, pods_status = await k_service.get_status_changes(i_pods, cursor, timeout_seconds)
+        return PydanticJSONResponse(StatusChangesDto(cursor=next_cursor, pods=pods_status), StatusChangesDto)
+
+    @controller.route.post(
+        "/status/changes",
+        summary="Get status changes (POST compatibility)",
+        response_model=StatusChangesDto,
+        responses=COMMON_ERROR_RESPONSES,
+    )
+    async def post_status_changes(
+        self,
+        i_pods: list[PodStatusRequest],
+        cursor: str | None = _CURSOR_QUERY,
+        timeout_seconds: float = _TIMEOUT_SECONDS_QUERY,
+        k_service: KubernetesPluginService = Depends(get_kubernetes_plugin_service),
+    ) -> PydanticJSONResponse:
+        next_cursor, pods_status = await k_service.get_status_changes(i_pods, cursor, timeout_seconds)
+        return PydanticJSONResponse(StatusChangesDto(cursor=next_cursor, pods=pods_status), StatusChangesDto)
@@ -5,12 +5,14 @@ Configure Dependency Injection
 import json
 import logging
 import pathlib
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import AbstractAsyncContextManager
 from typing import Any
 
 from injector import Injector, Module, provider, singleton
 from kubernetes import client as k
 from kubernetes.client.api import CoreV1Api
+from kubernetes.client.api_client import ApiClient
 from kubernetes.client.configuration import Configuration as KClientConfiguration
 from kubernetes.config import kube_config as k_config
 from pyhelm3 import Client as HelmClient
@@ -20,6 +22,7 @@ from app.common.config import Config, Option
 from app.common.logger_manager import LoggerManager
 from app.entities.kubernetes_plugin_configuration import KubernetesPluginConfiguration
 from app.services.kubernetes_plugin_service import KubernetesPluginService
+from app.utilities.kubernetes_async_client import AsyncCoreV1Api
 
 
 # region Configure Injector Module
@@ -111,7 +114,27 @@ class InjectorModule(Module):
                 config_dict=kubeconfig_dict, client_configuration=kubernetes_plugin_configuration.client_configuration
             )
 
-        return CoreV1Api()  # Kubernetes Core client to manage core resources (e.g., pods, services, namespaces)
+        # Notice that `load_kube_config` only sets the default configuration if no client configuration is given
+        client_configuration = (
+            kubernetes_plugin_configuration.client_configuration or KClientConfiguration.get_default_copy()
+        )
+        # Keep-alive connections to the API server, i.e. the number of requests that can be issued in parallel
+        if config.get(Option.K8S_CONNECTION_POOL_MAXSIZE):
+            client_configuration.connection_pool_maxsize = int(config.get(Option.K8S_CONNECTION_POOL_MAXSIZE))
+
+        # Kubernetes Core client to manage core resources (e.g., pods, services, namespaces)
+        return CoreV1Api(ApiClient(client_configuration))
+
+    @singleton
+    @provider
+    def provide_kubernetes_async_core_api(self, config: Config, k_api: k.CoreV1Api) -> AsyncCoreV1Api:
+        executor: ThreadPoolExecutor | None = None
+        if str(config.get(Option.K8S_ASYNC_CLIENT_ENABLED, "True")).lower() == "true":
+            # One worker per pooled connection
+            executor = ThreadPoolExecutor(
+                max_workers=k_api.api_client.configuration.connection_pool_maxsize, thread_name_prefix="k8s-client"
+            )
+        return AsyncCoreV1Api(k_api, executor)
 
     @singleton
     @provider
@@ -121,9 +144,9 @@ class InjectorModule(Module):
     @singleton
     @provider
     def provide_kubernetes_plugin_service(
-        self, config: Config, logger: logging.Logger, k_api: k.CoreV1Api, h_client: HelmClient
+        self, config: Config, logger: logging.Logger, k_async_api: AsyncCoreV1Api, h_client: HelmClient
     ) -> KubernetesPluginService:
-        return KubernetesPluginService(config, logger, k_api, h_client)
+        return KubernetesPluginService(config, logger, k_async_api, h_client)
 
 
 _injector = Injector([InjectorModule()])
@@ -144,7 +167,9 @@ def get_kubernetes_plugin_service() -> KubernetesPluginService:
 
 
 def get_lifespan_async_context_managers() -> list[AbstractAsyncContextManager]:
-    return []
+    # KubernetesPluginService runs its background tasks (e.g., the pod informer) within the app lifespan,
+    # managers are exited in reverse order, i.e. the Kubernetes client is closed last
+    return [_injector.get(AsyncCoreV1Api), get_kubernetes_plugin_service()]
 
 
 def preload_dependencies() -> None:
@@ -1,11 +1,14 @@
-from typing import Any, TypeVar
+from functools import lru_cache
+from typing import Any, Callable, Final, TypeVar
 
 import kubernetes.client.api_client as k_api_client
+import kubernetes.client.models as k_models
 from pydantic import BaseModel
 
 KApiClient = k_api_client.ApiClient
 
 T = TypeVar("T")
+M = TypeVar("M", bound=BaseModel)
 
 
 def serialize_k_model_to_dict(api_client: KApiClient, model: Any) -> dict:
@@ -21,7 +24,8 @@ def deserialize_dict_to_k_model(api_client: KApiClient, data: dict, k_ref_type:
     # objects recursively, while the following won't work for nested properties:
     # pod = V1Pod(**dict_to_snake(data))
     # type(pod.spec) == dict  # we don't get V1PodSpec
-    return api_client._ApiClient__deserialize_model(data, k_ref_type)  # type: ignore # pylint: disable=protected-access
+    # The compiled deserializers (see below) do the same, without rediscovering the model structure on every call.
+    return _K_DESERIALIZERS[k_ref_type](data, api_client)
 
 
 def map_i_model_to_k_model(api_client: KApiClient, model: BaseModel, k_ref_type: type[T]) -> T:
@@ -31,5 +35,194 @@ def map_i_model_to_k_model(api_client: KApiClient, model: BaseModel, k_ref_type:
 
 def map_k_model_to_i_model(api_client: KApiClient, model: Any, i_ref_type: type[T]) -> T:
     """Converts a Kubernetes (OpenAPI) model to an Interlink model"""
-    dikt = serialize_k_model_to_dict(api_client, model.to_dict())
+    dikt = _K_SERIALIZERS[type(model)](model, api_client)
     return i_ref_type(**dikt)
+
+
+def prune_dict_to_k_model(data: dict, k_ref_type: type) -> dict:
+    """Drop the keys of a Kubernetes object in dict representation (camelCase keys) that are not declared by the
+    model type, recursively, as converting it to a Kubernetes model would (see `deserialize_dict_to_k_model`).
+    Useful to send Interlink models dumped as dicts, since they may have keys outside of the Kubernetes schema."""
+    return _prune_value(data, k_ref_type.__name__)
+
+
+def map_k_dict_to_i_model(data: dict, i_ref_type: type[M]) -> M:
+    """Converts a Kubernetes object in dict representation (e.g., parsed from raw JSON) to an Interlink model.
+    Expects property names in camelCase, as sent by the API server."""
+    return i_ref_type.model_validate(data)
+
+
+# region Compiled mappers
+# The generic conversions provided by ApiClient walk `openapi_types` and `attribute_map` of every (nested) model
+# on every call. The following compile, on first use, one straight-line function per Kubernetes model type:
+# - deserializer, i.e. `(dict in camelCase, api_client) -> model`, equivalent to `ApiClient.__deserialize_model`
+#   (models are created with the `api_client` configuration, instead of a new default configuration each);
+# - serializer, i.e. `(model, api_client) -> dict in snake_case`, equivalent to `sanitize(model.to_dict())`.
+# The Interlink (pydantic) side of the conversion is already compiled by pydantic-core.
+# Container types are declared in `openapi_types` as `list[T]` / `dict(str, T)` (kubernetes client <= 34)
+# or `List[T]` / `Dict[str, T]` (newer clients); models declaring any other unknown type are not compiled,
+# i.e. they are mapped by the generic conversions.
+
+_PRIMITIVE_TYPES: Final = ("str", "int", "float", "bool")
+
+
+def _deserialize_primitive(value: Any, klass: type) -> Any:
+    """Same as `ApiClient.__deserialize_primitive`"""
+    try:
+        return klass(value)
+    except UnicodeEncodeError:
+        return str(value)
+    except TypeError:
+        return value
+
+
+class _UnsupportedTypeError(Exception):
+    """Type declared in `openapi_types` not supported by the compiled mappers"""
+
+
+def _parse_container_type(attr_type: str) -> tuple[str, str] | None:
+    """Return `("list", item type)` or `("dict", value type)` for container types, `None` otherwise"""
+    if attr_type.startswith(("list[", "List[")) and attr_type.endswith("]"):
+        return ("list", attr_type[5:-1])
+    if (attr_type.startswith("dict(") and attr_type.endswith(")")) or (
+        attr_type.startswith("Dict[") and attr_type.endswith("]")
+    ):
+        key_and_value_types = attr_type[5:-1].split(", ", 1)
+        if len(key_and_value_types) != 2:
+            raise _UnsupportedTypeError(attr_type)
+        return ("dict", key_and_value_types[1])
+    return None
+
+
+def _compile_value_expr(value_expr: str, attr_type: str, convert_expr: Callable[[str, str], str]) -> str:
+    """Return an expression converting the (non-None) value of `value_expr`, declared as `attr_type`
+    in `openapi_types`; `convert_expr(type, value_expr)` returns the expression converting non-container values,
+    or raises `_UnsupportedTypeError`"""
+    container_type = _parse_container_type(attr_type)
+    if container_type and container_type[0] == "list":
+        item_expr = _compile_value_expr("x", container_type[1], convert_expr)
+        return f"[None if x is None else {item_expr} for x in {value_expr}]"
+    if container_type:
+        item_expr = _compile_value_expr("x", container_type[1], convert_expr)
+        return f"{{key: None if x is None else {item_expr} for key, x in {value_expr}.items()}}"
+    return convert_expr(attr_type, value_expr)
+
+
+def _compile(name: str, body_lines: list[str], namespace: dict[str, Any]) -> Callable:
+    """Compile the function `name(value, api_client)` with the given body"""
+    source = "\n".join([f"def {name}(value, api_client):", *[f"    {line}" for line in body_lines]])
+    exec(compile(source, f"<compiled mapper {name}>", "exec"), namespace)  # pylint: disable=exec-used
+    return namespace[name]
+
+
+def _generic_k_deserializer(k_ref_type: type) -> Callable[[Any, KApiClient], Any]:
+    return lambda data, api_client: api_client._ApiClient__deserialize_model(data, k_ref_type)
+
+
+def _compile_k_deserializer(k_ref_type: type) -> Callable[[Any, KApiClient], Any]:
+    if not k_ref_type.openapi_types:  # type: ignore
+        return lambda data, _api_client: data
+
+    def convert_expr(attr_type: str, value_expr: str) -> str:
+        if attr_type in _PRIMITIVE_TYPES:
+            return (
+                f"({value_expr} if {value_expr}.__class__ is {attr_type} "
+                f"else deserialize_primitive({value_expr}, {attr_type}))"
+            )
+        if attr_type == "object":
+            return value_expr
+        if attr_type in ("date", "datetime"):
+            return f"api_client._ApiClient__deserialize({value_expr}, {attr_type!r})"
+        if not isinstance(getattr(k_models, attr_type, None), type):
+            raise _UnsupportedTypeError(attr_type)
+        return f"deserializers[k_models.{attr_type}]({value_expr}, api_client)"
+
+    lines = [
+        "if value.__class__ is not dict:",
+        "    return api_client._ApiClient__deserialize_model(value, k_ref_type)",
+        "get = value.get",
+        "return k_ref_type(",
+    ]
+    for attr, attr_type in k_ref_type.openapi_types.items():  # type: ignore
+        key = k_ref_type.attribute_map[attr]  # type: ignore
+        try:
+            value_expr = _compile_value_expr("v", attr_type, convert_expr)
+        except _UnsupportedTypeError:
+            return _generic_k_deserializer(k_ref_type)
+        lines.append(f"    {attr}=None if (v := get({key!r})) is None else {value_expr},")
+    lines.append("    local_vars_configuration=api_client.configuration,")
+    lines.append(")")
+    return _compile(
+        f"deserialize_{k_ref_type.__name__}",
+        lines,
+        {
+            "k_ref_type": k_ref_type,
+            "k_models": k_models,
+            "deserializers": _K_DESERIALIZERS,
+            "deserialize_primitive": _deserialize_primitive,
+        },
+    )
+
+
+def _compile_k_serializer(k_ref_type: type) -> Callable[[Any, KApiClient], Any]:
+    if not getattr(k_ref_type, "openapi_types", None):
+        return lambda value, api_client: api_client.sanitize_for_serialization(value)
+
+    def convert_expr(attr_type: str, value_expr: str) -> str:
+        if attr_type in _PRIMITIVE_TYPES:
+            return value_expr
+        if attr_type in ("object", "date", "datetime"):
+            return f"api_client.sanitize_for_serialization({value_expr})"
+        if not isinstance(getattr(k_models, attr_type, None), type):
+            raise _UnsupportedTypeError(attr_type)
+        return f"serializers[{value_expr}.__class__]({value_expr}, api_client)"
+
+    lines = ["return {"]
+    for attr, attr_type in k_ref_type.openapi_types.items():  # type: ignore
+        try:
+            value_expr = _compile_value_expr("v", attr_type, convert_expr)
+        except _UnsupportedTypeError:
+            return lambda value, api_client: api_client.sanitize_for_serialization(value.to_dict())
+        lines.append(f"    {attr!r}: None if (v := value.{attr}) is None else {value_expr},")
+    lines.append("}")
+    return _compile(f"serialize_{k_ref_type.__name__}", lines, {"serializers": _K_SERIALIZERS})
+
+
+class _CompiledMappers(dict):
+    """Compiled mappers by Kubernetes model type, compiled on first lookup"""
+
+    def __init__(self, compile_mapper: Callable[[type], Callable]):
+        super().__init__()
+        self._compile_mapper = compile_mapper
+
+    def __missing__(self, k_ref_type: type) -> Callable:
+        mapper = self[k_ref_type] = self._compile_mapper(k_ref_type)
+        return mapper
+
+
+_K_DESERIALIZERS: Final = _CompiledMappers(_compile_k_deserializer)
+_K_SERIALIZERS: Final = _CompiledMappers(_compile_k_serializer)
+# endregion
+
+
+@lru_cache(maxsize=None)
+def _k_model_keys(k_ref_type: type) -> dict[str, str]:
+    """Attribute types of the Kubernetes model type by key in dict representation (camelCase)"""
+    return {k_ref_type.attribute_map[attr]: attr_type for attr, attr_type in k_ref_type.openapi_types.items()}
+
+
+def _prune_value(value: Any, attr_type: str) -> Any:
+    """See `prune_dict_to_k_model`; values of unknown types are kept as they are"""
+    try:
+        container_type = _parse_container_type(attr_type)
+    except _UnsupportedTypeError:
+        return value
+    if container_type and container_type[0] == "list" and isinstance(value, list):
+        return [_prune_value(item, container_type[1]) for item in value]
+    if container_type and container_type[0] == "dict" and isinstance(value, dict):
+        return {key: _prune_value(item, container_type[1]) for key, item in value.items()}
+    k_ref_type = getattr(k_models, attr_type, None)
+    if container_type or not isinstance(value, dict) or not getattr(k_ref_type, "openapi_types", None):
+        return value
+    keys = _k_model_keys(k_ref_type)
+    return {key: _prune_value(item, keys[key]) for key, item in value.items() if key in keys and item is not None}
@@ -0,0 +1,18 @@
+from pydantic import BaseModel, ConfigDict
+
+
+class PodStatusRequestMetadata(BaseModel):
+    name: str | None = None
+    namespace: str | None = None
+    uid: str | None = None
+
+    model_config = ConfigDict(extra="ignore")
+
+
+class PodStatusRequest(BaseModel):
+    """Slim counterpart of `interlink.PodRequest` for status requests: only the metadata fields used to look up
+    the remote pod are validated, while the pod spec and any other field are ignored (neither validated nor kept)"""
+
+    metadata: PodStatusRequestMetadata
+
+    model_config = ConfigDict(extra="ignore")
@@ -0,0 +1,100 @@
+from datetime import datetime
+from typing import Any, Final
+
+import interlink as i
+from kubernetes import client as k
+
+STARTED_AT_FORMAT: Final = "%Y-%m-%dT%H:%M:%SZ"  # format of running containers' started_at
+
+
+class RemoteContainerState:
+    """Compact state of a remote container: the fields of `V1ContainerStatus` mapped to `interlink.ContainerStatus`"""
+
+    __slots__ = (
+        "name",
+        "ready",
+        "restart_count",
+        "state",
+        "reason",
+        "message",
+        "exit_code",
+        "started_at",
+        "finished_at",
+    )
+
+    name: str
+    ready: bool | None
+    restart_count: int | None
+    state: str | None  # "running", "waiting", "terminated", or None if unknown
+    reason: str | None  # waiting or terminated
+    message: str | None  # waiting or terminated
+    exit_code: int | None  # terminated
+    started_at: datetime | None  # running or terminated
+    finished_at: datetime | None  # terminated
+
+    def __init__(self, cs: k.V1ContainerStatus):
+        self.name = cs.name
+        self.ready = cs.ready
+        self.restart_count = cs.restart_count
+        self.state = self.reason = self.message = self.exit_code = self.started_at = self.finished_at = None
+        if not cs.state:
+            return
+        if cs.state.running:
+            self.state = "running"
+            self.started_at = cs.state.running.started_at
+        elif cs.state.terminated:
+            self.state = "terminated"
+            self.reason = cs.state.terminated.reason
+            self.message = cs.state.terminated.message
+            self.exit_code = cs.state.terminated.exit_code
+            self.started_at = cs.state.terminated.started_at
+            self.finished_at = cs.state.terminated.finished_at
+        elif cs.state.waiting:
+            self.state = "waiting"
+            self.reason = cs.state.waiting.reason
+            self.message = cs.state.waiting.message
+
+    def to_i_container_status(self) -> i.ContainerStatus:
+        """Same as mapping the source `V1ContainerStatus` (see `mappers.map_k_model_to_i_model`), with the
+        running container's `started_at` formatted as `STARTED_AT_FORMAT`"""
+        state: dict[str, Any] = {}
+        if self.state == "running":
+            state["running"] = {"started_at": self.started_at.strftime(STARTED_AT_FORMAT) if self.started_at else None}
+        elif self.state == "terminated":
+            state["terminated"] = {
+                "exit_code": self.exit_code,
+                "reason": self.reason,
+                "message": self.message,
+                "started_at": self.started_at.isoformat() if self.started_at else None,
+                "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            }
+        elif self.state == "waiting":
+            state["waiting"] = {"reason": self.reason, "message": self.message}
+        return i.ContainerStatus(name=self.name, state=state, ready=self.ready, restart_count=self.restart_count)
+
+
+class RemotePodState:
+    """Compact state of a remote pod, holding only what is needed to answer status and delete requests,
+    instead of the whole `V1Pod` object graph (spec, managed fields, conditions, etc.)"""
+
+    __slots__ = ("namespace", "name", "uid", "source_pod_uid", "creation_timestamp", "start_time", "containers")
+
+    namespace: str
+    name: str
+    uid: str  # i.e., the JID
+    source_pod_uid: str
+    creation_timestamp: datetime | None
+    start_time: datetime | None
+    containers: tuple[RemoteContainerState, ...]
+
+    def __init__(self, pod: k.V1Pod, source_pod_uid: str):
+        assert pod.metadata
+        self.namespace = pod.metadata.namespace
+        self.name = pod.metadata.name
+        self.uid = pod.metadata.uid
+        self.source_pod_uid = source_pod_uid
+        self.creation_timestamp = pod.metadata.creation_timestamp
+        self.start_time = pod.status.start_time if pod.status else None
+        self.containers = tuple(
+            RemoteContainerState(cs) for cs in (pod.status.container_statuses if pod.status else None) or []
+        )
@@ -25,6 +25,21 @@ logger = get_logger()
 templates = Jinja2Templates(directory="app/templates")
 
 
+# region HTTP/2
+if config.get(Option.K8S_HTTP2_ENABLED, "False").lower() == "true":
+    # Experimental in urllib3 v2, requires package h2.
+    # Notice that urllib3 switches to HTTP/2 process-wide (its connection class and TLS ALPN protocols are globals),
+    # i.e. for the Kubernetes client as well as any other urllib3 user: done once, before any client is created.
+    try:
+        from urllib3.http2 import inject_into_urllib3  # pylint: disable=import-outside-toplevel
+
+        inject_into_urllib3()
+        logger.info("HTTP/2 enabled for all urllib3 connections")
+    except ImportError as exc:
+        logger.warning("HTTP/2 not available, fallback to HTTP/1.1: %s", exc)
+# endregion / HTTP/2
+
+
 @asynccontextmanager
 async def lifespan(_app: FastAPI):
     async with manage_contexts(get_lifespan_async_context_managers()):
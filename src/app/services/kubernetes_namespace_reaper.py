@@ -0,0 +1,152 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from http import HTTPStatus
+from logging import Logger
+from typing import AsyncIterator, Callable, Final
+
+import kubernetes.client.exceptions as k_exceptions
+from kubernetes import client as k
+
+from app.common import metrics
+from app.utilities.kubernetes_async_client import AsyncCoreV1Api, list_all
+
+_DELETION_POLL_SECONDS: Final = 2
+_DELETION_TIMEOUT_SECONDS: Final = 300
+
+
+class KubernetesNamespaceReaper:
+    """Delete offloading namespaces (i.e., matching `label_selector`) without offloaded pods for `grace_period_seconds`.
+
+    Pod creations must run within `guard(namespace)`: a namespace is never reaped while a pod is being created in it,
+    nor if a creation started while its pods were being listed, and creations wait for an ongoing reaping of their
+    namespace to complete, i.e. until the namespace is gone.
+    Namespaces holding PersistentVolumeClaims (e.g., retained by the "retain" PVC retention policy) are never reaped.
+    `forget_namespace` is called before deleting a namespace, e.g. to evict it from a registry of known namespaces.
+    """
+
+    _logger: Logger
+    _k_core_client: AsyncCoreV1Api
+    _label_selector: str
+    _grace_period_seconds: float
+    _forget_namespace: Callable[[str], None]
+
+    _creations: dict[str, int]  # number of in-flight pod creations by namespace
+    _creations_started_at: dict[str, float]  # monotonic time of the last pod creation started by namespace
+    _reapings: dict[str, asyncio.Event]  # namespaces being deleted, the event is set once deleted
+    _empty_since: dict[str, float]  # monotonic time since namespaces were first seen without pods
+
+    def __init__(
+        self,
+        logger: Logger,
+        k_core_client: AsyncCoreV1Api,
+        *,
+        label_selector: str,
+        grace_period_seconds: float,
+        forget_namespace: Callable[[str], None],
+    ):
+        self._logger = logger
+        self._k_core_client = k_core_client
+        self._label_selector = label_selector
+        self._grace_period_seconds = grace_period_seconds
+        self._forget_namespace = forget_namespace
+
+        self._creations = {}
+        self._creations_started_at = {}
+        self._reapings = {}
+        self._empty_since = {}
+
+    @asynccontextmanager
+    async def guard(self, namespace: str) -> AsyncIterator[None]:
+        """Prevent the namespace from being reaped, after waiting for an ongoing reaping to complete"""
+        self._creations[namespace] = self._creations.get(namespace, 0) + 1
+        self._creations_started_at[namespace] = time.monotonic()
+        try:
+            if reaping := self._reapings.get(namespace):
+                self._logger.info("Namespace '%s' is being deleted, wait for it", namespace)
+                await reaping.wait()
+            yield
+        finally:
+            self._creations[namespace] -= 1
+            if not self._creations[namespace]:
+                del self._creations[namespace]
+
+    async def reap(self) -> list[str]:
+        """Delete namespaces without pods nor PVCs for the grace period, return their names"""
+        # Pods created in a namespace after this snapshot may be missing from the listed pods
+        snapshot = time.monotonic()
+        namespaces: list[k.V1Namespace] = await list_all(
+            self._k_core_client.list_namespace, label_selector=self._label_selector
+        )
+        remote_pods: list[k.V1Pod] = await list_all(
+            self._k_core_client.list_pod_for_all_namespaces, label_selector=self._label_selector
+        )
+        busy_namespaces = {pod.metadata.namespace for pod in remote_pods}
+
+        now = time.monotonic()
+        candidates: list[str] = []
+        for namespace in namespaces:
+            name: str = namespace.metadata.name
+            if name in busy_namespaces or self._is_guarded(name, since=snapshot) or name in self._reapings:
+                self._empty_since.pop(name, None)
+                continue
+            if now - self._empty_since.setdefault(name, now) >= self._grace_period_seconds:
+                candidates.append(name)
+        # Forget namespaces that no longer exist, and creations that started before the snapshot
+        listed = {namespace.metadata.name for namespace in namespaces}
+        for name in [name for name in self._empty_since if name not in listed]:
+            del self._empty_since[name]
+        for name in [name for name, started_at in self._creations_started_at.items() if started_at < snapshot]:
+            del self._creations_started_at[name]
+
+        holding_pvcs = await asyncio.gather(*[self._holds_pvcs(name) for name in candidates])
+        # Creations may have started while PVCs were being listed: check again, with no await until marked as reaping
+        to_be_reaped = [
+            name
+            for name, holds_pvcs in zip(candidates, holding_pvcs)
+            if not holds_pvcs and not self._is_guarded(name, since=snapshot)
+        ]
+        for name in to_be_reaped:
+            self._reapings[name] = asyncio.Event()
+            self._empty_since.pop(name, None)
+            self._forget_namespace(name)
+        await asyncio.gather(*[self._delete_namespace(name) for name in to_be_reaped])
+
+        if to_be_reaped:
+            metrics.increment("namespace_reaper_deleted", len(to_be_reaped))
+            self._logger.info("Reaped %d empty namespaces: %s", len(to_be_reaped), to_be_reaped)
+        return to_be_reaped
+
+    def _is_guarded(self, name: str, since: float) -> bool:
+        """Whether a pod is being created in the namespace, or a creation started since the given monotonic time"""
+        return name in self._creations or self._creations_started_at.get(name, since - 1) >= since
+
+    async def _holds_pvcs(self, name: str) -> bool:
+        """Whether the namespace holds PVCs (or they could not be listed), which would be deleted with it"""
+        try:
+            pvcs: k.V1PersistentVolumeClaimList = await self._k_core_client.list_namespaced_persistent_volume_claim(
+                name, limit=1
+            )
+        except k_exceptions.ApiException as api_exception:
+            self._logger.error(f"{api_exception.status} {api_exception.reason}: {api_exception.body}")
+            return True
+        if pvcs.items:
+            self._logger.debug("Namespace '%s' holds PVCs, not deleted", name)
+            self._empty_since.pop(name, None)
+        return bool(pvcs.items)
+
+    async def _delete_namespace(self, name: str) -> None:
+        """Delete the namespace and wait until it is gone, then release the creations waiting for it"""
+        try:
+            self._logger.info("Delete empty namespace '%s'", name)
+            await self._k_core_client.delete_namespace(name)
+            deadline = time.monotonic() + _DELETION_TIMEOUT_SECONDS
+            while time.monotonic() < deadline:
+                await asyncio.sleep(_DELETION_POLL_SECONDS)
+                await self._k_core_client.read_namespace(name)
+            self._logger.warning("Namespace '%s' not deleted within %ds", name, _DELETION_TIMEOUT_SECONDS)
+        except k_exceptions.ApiException as api_exception:
+            if api_exception.status != HTTPStatus.NOT_FOUND:
+                self._logger.error(f"{api_exception.status} {api_exception.reason}: {api_exception.body}")
+        finally:
+            self._reapings.pop(name).set()
@@ -0,0 +1,187 @@
+import asyncio
+import itertools
+import re
+import time
+from datetime import datetime, timezone
+from logging import Logger
+from typing import Any, Awaitable, Callable, NamedTuple
+
+import kubernetes.client.exceptions as k_exceptions
+from kubernetes import client as k
+from pyhelm3 import Client as HelmClient
+from pyhelm3.errors import Error as HelmError
+
+from app.common import metrics
+from app.utilities.kubernetes_async_client import AsyncCoreV1Api, list_all
+
+_BASTION_REL_NAME_PATTERN = re.compile(r"^bastion-\d+-(?P<pod_uid>.+)$")  # see `_scope_bastion_rel_name`
+
+
+class _Orphan(NamedTuple):
+    kind: str  # K8s kind, or "HelmRelease"
+    name: str
+    namespace: str
+
+
+class KubernetesOrphanReconciler:
+    """Garbage-collect remote objects leaked by offloaded pods, e.g. if a rollback failed or a delete never arrived.
+
+    ConfigMaps, Secrets and Services matching `label_selector` are orphans if no remote Pod in the same namespace
+    has the same `<source_pod_uid_key>` label; Bastion releases in `bastion_namespace` (if any) are orphans
+    if no remote Pod has the source pod uid in their name (at most `max_releases` releases are listed).
+    Orphans are not deleted until older than `grace_period_seconds`, nor while `is_in_flight(source pod uid)`,
+    i.e. while their pod is being created. Remote objects are listed page by page, and orphans are deleted in
+    batches of `batch_size`, waiting `batch_interval_seconds` between batches. In dry-run mode, orphans are only logged.
+    """
+
+    _logger: Logger
+    _k_core_client: AsyncCoreV1Api
+    _h_client: HelmClient
+    _label_selector: str
+    _source_pod_uid_key: str
+    _bastion_namespace: str | None
+    _is_in_flight: Callable[[str], bool]
+    _grace_period_seconds: float
+    _dry_run: bool
+    _batch_size: int
+    _batch_interval_seconds: float
+    _max_releases: int
+
+    def __init__(
+        self,
+        logger: Logger,
+        k_core_client: AsyncCoreV1Api,
+        h_client: HelmClient,
+        *,
+        label_selector: str,
+        source_pod_uid_key: str,
+        bastion_namespace: str | None,
+        is_in_flight: Callable[[str], bool],
+        grace_period_seconds: float,
+        dry_run: bool,
+        batch_size: int,
+        batch_interval_seconds: float,
+        max_releases: int,
+    ):
+        self._logger = logger
+        self._k_core_client = k_core_client
+        self._h_client = h_client
+        self._label_selector = label_selector
+        self._source_pod_uid_key = source_pod_uid_key
+        self._bastion_namespace = bastion_namespace
+        self._is_in_flight = is_in_flight
+        self._grace_period_seconds = grace_period_seconds
+        self._dry_run = dry_run
+        self._batch_size = max(1, batch_size)
+        self._batch_interval_seconds = batch_interval_seconds
+        self._max_releases = max(1, max_releases)
+
+    async def reconcile(self) -> dict[str, int]:
+        """Find and delete orphans, return the number of reclaimed (or, in dry-run mode, found) orphans by kind"""
+        started_at = time.perf_counter()
+
+        # List pods first: objects of pods created afterwards are younger than the grace period, or in flight
+        remote_pods: list[k.V1Pod] = await list_all(
+            self._k_core_client.list_pod_for_all_namespaces, label_selector=self._label_selector
+        )
+        live_pods = {(pod.metadata.namespace, self._source_pod_uid(pod.metadata)) for pod in remote_pods}
+        live_pod_uids = {pod_uid for _namespace, pod_uid in live_pods}
+
+        orphans: list[_Orphan] = []
+        for kind, list_method in [
+            ("ConfigMap", self._k_core_client.list_config_map_for_all_namespaces),
+            ("Secret", self._k_core_client.list_secret_for_all_namespaces),
+            ("Service", self._k_core_client.list_service_for_all_namespaces),
+        ]:
+            for obj in await list_all(list_method, label_selector=self._label_selector):
+                metadata: k.V1ObjectMeta = obj.metadata
+                pod_uid = self._source_pod_uid(metadata)
+                if (
+                    pod_uid
+                    and (metadata.namespace, pod_uid) not in live_pods
+                    and not self._is_in_flight(pod_uid)
+                    and self._is_older_than_grace_period(metadata.creation_timestamp)
+                ):
+                    orphans.append(_Orphan(kind, metadata.name, metadata.namespace))
+
+        if self._bastion_namespace:
+            orphans.extend(await self._find_orphan_bastion_releases(self._bastion_namespace, live_pod_uids))
+
+        reclaimed: dict[str, int] = {}
+        for batch_number, batch in enumerate(itertools.batched(orphans, self._batch_size)):
+            if batch_number:
+                await asyncio.sleep(self._batch_interval_seconds)
+            deleted = await asyncio.gather(*[self._delete_orphan(orphan) for orphan in batch])
+            for orphan, is_deleted in zip(batch, deleted):
+                if is_deleted:
+                    reclaimed[orphan.kind] = reclaimed.get(orphan.kind, 0) + 1
+
+        for kind, count in reclaimed.items():
+            if not self._dry_run:
+                metrics.increment(f"reconciler_reclaimed_{kind.lower()}", count)
+        self._logger.info(
+            "Reconciler %s %d orphans in %.3fs (%d live pods): %s",
+            "found (dry-run)" if self._dry_run else "reclaimed",
+            sum(reclaimed.values()),
+            time.perf_counter() - started_at,
+            len(live_pods),
+            reclaimed,
+        )
+        return reclaimed
+
+    async def _find_orphan_bastion_releases(self, namespace: str, live_pod_uids: set[str]) -> list[_Orphan]:
+        orphans: list[_Orphan] = []
+        releases = list(
+            await self._h_client.list_releases(
+                namespace=namespace, include_failed=True, max_releases=self._max_releases
+            )
+        )
+        if len(releases) >= self._max_releases:
+            self._logger.warning(
+                "Listed %d Helm releases in '%s', orphans beyond that are not found: increase reconciler_max_releases",
+                len(releases),
+                namespace,
+            )
+        for release in releases:
+            if match := _BASTION_REL_NAME_PATTERN.match(release.name):
+                pod_uid = match.group("pod_uid")
+                # Release names are truncated, see `_scope_bastion_rel_name`
+                if any(live_pod_uid.startswith(pod_uid) for live_pod_uid in live_pod_uids) or self._is_in_flight(
+                    pod_uid
+                ):
+                    continue
+                revision = await release.current_revision()
+                if self._is_older_than_grace_period(revision.updated):
+                    orphans.append(_Orphan("HelmRelease", release.name, namespace))
+        return orphans
+
+    async def _delete_orphan(self, orphan: _Orphan) -> bool:
+        self._logger.info("%sDelete orphan %s '%s' in '%s'", "[dry-run] " if self._dry_run else "", *orphan)
+        if self._dry_run:
+            return True
+        delete_methods: dict[str, Callable[..., Awaitable[Any]]] = {
+            "ConfigMap": self._k_core_client.delete_namespaced_config_map,
+            "Secret": self._k_core_client.delete_namespaced_secret,
+            "Service": self._k_core_client.delete_namespaced_service,
+        }
+        try:
+            if orphan.kind == "HelmRelease":
+                await self._h_client.uninstall_release(orphan.name, namespace=orphan.namespace, wait=False)
+            else:
+                await delete_methods[orphan.kind](orphan.name, orphan.namespace)
+            return True
+        except k_exceptions.ApiException as api_exception:
+            self._logger.error(f"{api_exception.status} {api_exception.reason}: {api_exception.body}")
+        except HelmError as helm_error:
+            self._logger.error(helm_error)
+        return False
+
+    def _source_pod_uid(self, metadata: k.V1ObjectMeta) -> str | None:
+        return (metadata.labels or {}).get(self._source_pod_uid_key)
+
+    def _is_older_than_grace_period(self, created_at: datetime | None) -> bool:
+        if created_at is None:
+            return False
+        if created_at.tzinfo is None:
+            created_at = created_at.replace(tzinfo=timezone.utc)
+        return (datetime.now(timezone.utc) - created_at).total_seconds() >= self._grace_period_seconds
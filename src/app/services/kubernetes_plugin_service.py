@@ -1,24 +1,49 @@
+import asyncio
 import base64
 import json
 import re
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractAsyncContextManager, AsyncExitStack, contextmanager, nullcontext
+from datetime import datetime
+from http import HTTPStatus
 from logging import Logger
-from typing import Any, Final
+from typing import Any, AsyncIterator, Awaitable, Callable, Coroutine, Final, Iterator, NamedTuple, TypeVar
 
 import interlink as i
 import kubernetes.client.exceptions as k_exceptions
-import pydash as _
 from injector import inject
 from kubernetes import client as k
-from kubernetes.client.api import CoreV1Api
 from kubernetes.client.api_client import ApiClient
 from pyhelm3 import Client as HelmClient
 from pyhelm3.errors import Error as HelmError
 
+from app.common import metrics
 from app.common.config import Config, Option
+from app.common.error_types import TooManyRequestsError
 from app.entities import mappers
+from app.entities.pod_status_request import PodStatusRequest
+from app.entities.remote_pod_state import STARTED_AT_FORMAT, RemotePodState
+from app.utilities.async_utilities import (
+    PeriodicTask,
+    SingleFlight,
+    as_completed_with_concurrency,
+    gather_settled,
+    gather_with_concurrency,
+)
+from app.utilities.cache_utilities import TTLCache
+from app.utilities.kubernetes_async_client import AsyncCoreV1Api
+from app.utilities.revision_tracker import RevisionTracker
+from app.utilities.work_queue import KeyedWorkQueue
 
 from .base_service import BaseService
+from .kubernetes_namespace_reaper import KubernetesNamespaceReaper
+from .kubernetes_orphan_reconciler import KubernetesOrphanReconciler
+from .kubernetes_pod_informer import KubernetesPodInformer
+from .kubernetes_remote_index import KubernetesRemoteIndex
+
+T = TypeVar("T")
 
 _I_SRC_UID_KEY: Final = "interlink.io/source.uid"
 _I_SRC_POD_UID_KEY: Final = "interlink.io/source.pod_uid"
@@ -34,19 +59,111 @@ _MAX_HELM_RELEASE_NAME: Final = 53
 
 _INSTALL_WITH_PYHELM_CLIENT: Final = False
 
+_STATUS_STRATEGY_POD: Final = "pod"  # read status pod by pod
+_STATUS_STRATEGY_NAMESPACE: Final = "namespace"  # list pods namespace by namespace
+
+_STATUS_CHANGES_POLL_SECONDS: Final = 1  # first delay before reading status again while long-polling for changes
+_STATUS_CHANGES_MAX_POLL_SECONDS: Final = 16  # max delay, doubled after every read without changes
+_CREATED_PODS_TTL_SECONDS: Final = 600  # how long created pods are remembered, to answer retried creations
+_LOG_CHUNK_BYTES: Final = 16 * 1024  # max size of the chunks read from followed logs
+# Typical memory size of `interlink.PodStatus` objects, plus of each container status (measured with tracemalloc)
+_POD_STATUS_BYTES: Final = 1280
+_CONTAINER_STATUS_BYTES: Final = 1536
+
+
+def _sizeof_pod_status(pod_status: i.PodStatus) -> int:
+    """Rough size of the pod status in memory, estimated from its number of containers (without serializing it)"""
+    return _POD_STATUS_BYTES + _CONTAINER_STATUS_BYTES * len(pod_status.containers)
+
+
+class _CreatedObject(NamedTuple):
+    """Remote object created by a Pod creation attempt, to be deleted on rollback"""
+
+    kind: str  # K8s kind, or "HelmRelease"
+    name: str
+    namespace: str
+
+
+class LogStream:
+    """Followed logs of a remote container (see `KubernetesPluginService.follow_logs`), iterated as log chunks.
+    The stream holds a follow slot and a pooled connection until it completes or `aclose` is called:
+    `aclose` must be called even if the stream was never iterated (e.g., the client disconnected first)."""
+
+    _response: Any  # urllib3.HTTPResponse
+    _executor: ThreadPoolExecutor
+    _logger: Logger
+    _on_close: Callable[[], None]
+    _completed: bool
+    _closed: bool
+
+    def __init__(self, response: Any, executor: ThreadPoolExecutor, logger: Logger, on_close: Callable[[], None]):
+        self._response = response
+        self._executor = executor
+        self._logger = logger
+        self._on_close = on_close
+        self._completed = False
+        self._closed = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        """Yield the chunks as they are received. Chunks are read one at a time by a thread of the executor, only
+        when the consumer asks for the next one (i.e., the remote stream is read as fast as the client reads,
+        without buffering the logs)."""
+        chunks = self._response.stream(_LOG_CHUNK_BYTES)
+        try:
+            # Reads block until the container writes more logs: they run on the bounded log follow executor,
+            # separate from the API executor and the event loop's default executor, so as not to exhaust them
+            loop = asyncio.get_running_loop()
+            while not self._closed and (chunk := await loop.run_in_executor(self._executor, next, chunks, b"")):
+                yield chunk
+            self._completed = not self._closed
+        finally:
+            await self.aclose()
+
+    async def aclose(self) -> None:
+        """Release the connection if the stream completed, otherwise close it. Idempotent."""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            if self._completed:
+                self._response.release_conn()
+            else:
+                self._logger.debug("Log stream closed before completion")
+                if shutdown := getattr(self._response, "shutdown", None):
+                    shutdown()  # urllib3 >= 2.3: unblock the read pending in the worker thread, if any
+                self._response.close()
+        finally:
+            self._on_close()
+
 
 class KubernetesPluginService(BaseService):
 
-    _k_core_client: CoreV1Api  # Kubernetes Core client to manage core resources (e.g., pods, services, namespaces)
+    _k_core_client: AsyncCoreV1Api  # Kubernetes Core client to manage core resources (e.g., pods, services, ...)
     _k_api_client: ApiClient  # Just needed to (de)serialize dict to K8s model
     _h_client: HelmClient
     _offloading_params: dict[str, Any]
+    _pod_informer: KubernetesPodInformer | None  # In-memory index of remote pods, if enabled
+    _known_namespaces: set[str]  # Scoped namespaces known to exist in the remote cluster
+    _pvc_cache: TTLCache[tuple[str, str], k.V1PersistentVolumeClaim]  # Remote PVCs by (namespace, name)
+    _created_pods: TTLCache[tuple[str, str], i.CreateStruct]  # Creation results by (namespace, source pod uid)
+    _status_cache: TTLCache[str, i.PodStatus] | None  # Recently read pods status by source pod uid, if enabled
+    _status_revisions: RevisionTracker[str]  # Revisions of the pods status by source pod uid
+    _single_flight: SingleFlight | None  # Concurrent identical remote reads share one call, if enabled
+    _log_follow_executor: ThreadPoolExecutor  # Threads reading followed logs, one per stream
+    _log_follow_max_streams: int
+    _log_follow_streams: int  # Followed logs being streamed
+    _delete_queue: KeyedWorkQueue | None  # Background pod teardowns by (namespace, source pod uid), if enabled
+    _pods_in_flight: set[str]  # Source uids of the pods being created
+    _orphan_reconciler: KubernetesOrphanReconciler | None  # Garbage collector of leaked remote objects, if enabled
+    _namespace_reaper: KubernetesNamespaceReaper | None  # Garbage collector of empty namespaces, if enabled
+    _remote_index: KubernetesRemoteIndex | None  # Remote objects by source pod uid, rebuilt periodically if enabled
+    _exit_stack: AsyncExitStack
 
     @inject
-    def __init__(self, config: Config, logger: Logger, k_core_client: k.CoreV1Api, h_client: HelmClient):
+    def __init__(self, config: Config, logger: Logger, k_core_client: AsyncCoreV1Api, h_client: HelmClient):
         super().__init__(config, logger)
         self._k_core_client = k_core_client
-        self._k_api_client = k_core_client.api_client  # type: ignore
+        self._k_api_client = k_core_client.api_client
         self._h_client = h_client
 
         self._offloading_params = {
@@ -54,180 +171,663 @@ class KubernetesPluginService(BaseService):
             "namespace_prefix_exclusions": json.loads(config.get(Option.OFFLOADING_NAMESPACE_PREFIX_EXCLUSIONS, "[]")),
             "node_selector": None,
             "node_tolerations": None,
+            "status_strategy": config.get(Option.OFFLOADING_STATUS_STRATEGY, _STATUS_STRATEGY_POD).lower(),
+            "status_namespace_batch_min_pods": int(config.get(Option.OFFLOADING_STATUS_NAMESPACE_BATCH_MIN_PODS, "5")),
+            "status_concurrency": max(1, int(config.get(Option.OFFLOADING_STATUS_CONCURRENCY, "0"))),
+            "status_raw_json": str(config.get(Option.OFFLOADING_STATUS_RAW_JSON, "False")).lower() == "true",
+            "create_raw_json": str(config.get(Option.OFFLOADING_CREATE_RAW_JSON, "False")).lower() == "true",
         }
         if config.get(Option.OFFLOADING_NODE_SELECTOR):
             self._offloading_params["node_selector"] = json.loads(config.get(Option.OFFLOADING_NODE_SELECTOR))
         if config.get(Option.OFFLOADING_NODE_TOLERATIONS):
             self._offloading_params["node_tolerations"] = json.loads(config.get(Option.OFFLOADING_NODE_TOLERATIONS))
 
-    async def get_status(self, i_pods: list[i.PodRequest]) -> list[i.PodStatus]:
-        status: list[i.PodStatus] = []
-        for i_pod in i_pods:
+        self._pod_informer = None
+        if str(config.get(Option.OFFLOADING_POD_INFORMER_ENABLED, "False")).lower() == "true":
+            self._pod_informer = KubernetesPodInformer(
+                logger,
+                k_core_client.sync_client,  # the informer watches from its own thread
+                label_selector=self._label_selector(_I_COMMON_LABELS),
+                index_label_key=_I_SRC_POD_UID_KEY,
+                resync_seconds=float(config.get(Option.OFFLOADING_POD_INFORMER_RESYNC_SECONDS, "300")),
+                max_staleness_seconds=float(config.get(Option.OFFLOADING_POD_INFORMER_MAX_STALENESS_SECONDS, "30")),
+            )
+
+        self._known_namespaces = set()
+        self._pvc_cache = TTLCache(ttl_seconds=float(config.get(Option.OFFLOADING_PVC_CACHE_TTL_SECONDS, "10")))
+        self._created_pods = TTLCache(ttl_seconds=_CREATED_PODS_TTL_SECONDS)
+        self._status_cache = None
+        if float(config.get(Option.OFFLOADING_STATUS_CACHE_TTL_SECONDS, "0")) > 0:
+            status_cache = self._status_cache = TTLCache(
+                ttl_seconds=float(config.get(Option.OFFLOADING_STATUS_CACHE_TTL_SECONDS)),
+                maxsize=int(config.get(Option.OFFLOADING_STATUS_CACHE_MAX_ENTRIES, "10000")),
+                maxbytes=int(config.get(Option.OFFLOADING_STATUS_CACHE_MAX_BYTES, str(64 * 1024 * 1024))),
+                sizeof=_sizeof_pod_status,
+            )
+            metrics.register_gauge("status_cache_hits", lambda: status_cache.hits)
+            metrics.register_gauge("status_cache_misses", lambda: status_cache.misses)
+            metrics.register_gauge("status_cache_entries", status_cache.__len__)
+            metrics.register_gauge("status_cache_bytes", lambda: status_cache.nbytes)
+        self._status_revisions = RevisionTracker()
+        self._single_flight = None
+        if str(config.get(Option.OFFLOADING_SINGLE_FLIGHT_ENABLED, "False")).lower() == "true":
+            self._single_flight = SingleFlight(logger, name="single_flight")
+        self._log_follow_max_streams = max(1, int(config.get(Option.OFFLOADING_LOG_FOLLOW_MAX_STREAMS, "32")))
+        self._log_follow_executor = ThreadPoolExecutor(self._log_follow_max_streams, thread_name_prefix="log-follow")
+        self._log_follow_streams = 0
+        metrics.register_gauge("log_follow_streams", lambda: self._log_follow_streams)
+        self._delete_queue = None
+        if str(config.get(Option.OFFLOADING_DELETE_QUEUE_ENABLED, "False")).lower() == "true":
+            self._delete_queue = KeyedWorkQueue(
+                logger,
+                name="delete_queue",
+                workers=int(config.get(Option.OFFLOADING_DELETE_QUEUE_WORKERS, "8")),
+                max_tries=int(config.get(Option.OFFLOADING_DELETE_QUEUE_MAX_TRIES, "5")),
+            )
+        self._pods_in_flight = set()
+        self._orphan_reconciler = None
+        if str(config.get(Option.OFFLOADING_RECONCILER_ENABLED, "False")).lower() == "true":
+            self._orphan_reconciler = KubernetesOrphanReconciler(
+                logger,
+                k_core_client,
+                h_client,
+                label_selector=self._label_selector(_I_COMMON_LABELS),
+                source_pod_uid_key=_I_SRC_POD_UID_KEY,
+                bastion_namespace=(
+                    config.get(Option.TCP_TUNNEL_BASTION_NAMESPACE)
+                    if str(config.get(Option.TCP_TUNNEL_ENABLED, "False")).lower() == "true"
+                    else None
+                ),
+                is_in_flight=self._pods_in_flight.__contains__,
+                grace_period_seconds=float(config.get(Option.OFFLOADING_RECONCILER_GRACE_PERIOD_SECONDS, "600")),
+                dry_run=str(config.get(Option.OFFLOADING_RECONCILER_DRY_RUN, "False")).lower() == "true",
+                batch_size=int(config.get(Option.OFFLOADING_RECONCILER_BATCH_SIZE, "50")),
+                batch_interval_seconds=float(config.get(Option.OFFLOADING_RECONCILER_BATCH_INTERVAL_SECONDS, "1")),
+                max_releases=int(config.get(Option.OFFLOADING_RECONCILER_MAX_RELEASES, "10000")),
+            )
+        self._namespace_reaper = None
+        if str(config.get(Option.OFFLOADING_NAMESPACE_REAPER_ENABLED, "False")).lower() == "true":
+            self._namespace_reaper = KubernetesNamespaceReaper(
+                logger,
+                k_core_client,
+                label_selector=self._label_selector(_I_COMMON_LABELS),
+                grace_period_seconds=float(config.get(Option.OFFLOADING_NAMESPACE_REAPER_GRACE_PERIOD_SECONDS, "1800")),
+                forget_namespace=self._known_namespaces.discard,
+            )
+        self._remote_index = None
+        if str(config.get(Option.OFFLOADING_REMOTE_INDEX_ENABLED, "False")).lower() == "true":
+            self._remote_index = KubernetesRemoteIndex(
+                logger,
+                k_core_client,
+                label_selector=self._label_selector(_I_COMMON_LABELS),
+                source_pod_uid_key=_I_SRC_POD_UID_KEY,
+            )
+        self._exit_stack = AsyncExitStack()
+
+    async def __aenter__(self):
+        """Start background tasks, to be run within the app lifespan"""
+        if self._remote_index:
             try:
-                assert i_pod.metadata.name and i_pod.metadata.namespace and i_pod.metadata.uid
+                await self._remote_index.rebuild()
+            except k_exceptions.ApiException as api_exception:
+                # Lookups fall back to API calls, until the index is rebuilt by the periodic task below
+                self.logger.error(f"{api_exception.status} {api_exception.reason}: {api_exception.body}")
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                # E.g., the API server cannot be reached yet (urllib3 MaxRetryError): start anyway, as above
+                self.logger.error(f"Remote index not rebuilt: {exc}")
+            await self._exit_stack.enter_async_context(
+                PeriodicTask(
+                    self.logger,
+                    self._remote_index.rebuild,
+                    name="remote-index",
+                    interval_seconds=float(self.config.get(Option.OFFLOADING_REMOTE_INDEX_RESYNC_SECONDS, "300")),
+                )
+            )
+        if self._pod_informer:
+            await self._exit_stack.enter_async_context(self._pod_informer)
+        if self._delete_queue is not None:
+            await self._exit_stack.enter_async_context(self._delete_queue)
+        if self._orphan_reconciler:
+            await self._exit_stack.enter_async_context(
+                PeriodicTask(
+                    self.logger,
+                    self._orphan_reconciler.reconcile,
+                    name="orphan-reconciler",
+                    interval_seconds=float(self.config.get(Option.OFFLOADING_RECONCILER_INTERVAL_SECONDS, "600")),
+                )
+            )
+        if self._namespace_reaper:
+            await self._exit_stack.enter_async_context(
+                PeriodicTask(
+                    self.logger,
+                    self._namespace_reaper.reap,
+                    name="namespace-reaper",
+                    interval_seconds=float(self.config.get(Option.OFFLOADING_NAMESPACE_REAPER_INTERVAL_SECONDS, "600")),
+                )
+            )
+        return self
+
+    async def __aexit__(self, *_exc_info):
+        await self._exit_stack.aclose()
+        self._log_follow_executor.shutdown(wait=False, cancel_futures=True)
 
-                remote_pod: k.V1Pod = self._k_core_client.read_namespaced_pod_status(
-                    name=self._scope_obj_name(i_pod.metadata.name, pod_uid=i_pod.metadata.uid),
-                    namespace=self._scope_ns_name(i_pod.metadata.namespace),
+    async def get_status(self, i_pods: list[i.PodRequest] | list[PodStatusRequest]) -> list[i.PodStatus]:
+        listed_pods = await self._list_pods_for_status(i_pods)
+
+        # Read pods status with at most `offloading.status_concurrency` calls in flight
+        pods_status = await gather_with_concurrency(
+            self._offloading_params["status_concurrency"],
+            *[self._get_pod_status(i_pod, listed_pods) for i_pod in i_pods],
+        )
+        return [pod_status for pod_status in pods_status if pod_status]
+
+    async def iter_status(self, i_pods: list[i.PodRequest] | list[PodStatusRequest]) -> AsyncIterator[i.PodStatus]:
+        """Like `get_status`, but yield pods status as soon as they are available (in any order), keeping at most
+        `offloading.status_concurrency` of them in memory besides the pods listed by namespace, if any"""
+        listed_pods = await self._list_pods_for_status(i_pods)
+
+        async for pod_status in as_completed_with_concurrency(
+            self._offloading_params["status_concurrency"],
+            (self._get_pod_status(i_pod, listed_pods) for i_pod in i_pods),
+        ):
+            if pod_status:
+                yield pod_status
+
+    async def get_status_changes(
+        self, i_pods: list[i.PodRequest] | list[PodStatusRequest], cursor: str | None, timeout_seconds: float = 0
+    ) -> tuple[str, list[i.PodStatus]]:
+        """Return a new cursor and the status of the pods changed since `cursor`, i.e. of all pods if the cursor
+        is missing or unknown (e.g. issued before a restart). If no pod changed, wait until a pod changes or
+        `timeout_seconds` elapse (long polling): status is read again whenever the pod informer changes, if fresh,
+        otherwise from the API server with exponential backoff, so as not to read it more often than clients would.
+        Pods not found are omitted, as in `get_status`, and reported as changed once found again."""
+        since = self._status_revisions.parse_cursor(cursor)
+        deadline = time.monotonic() + timeout_seconds
+        poll_seconds: float = _STATUS_CHANGES_POLL_SECONDS
+        while True:
+            informer_changes = self._pod_informer.changes if self._pod_informer else 0
+            pods_status = await self.get_status(i_pods)
+            changed_pods_status = self._track_status_changes(i_pods, pods_status, since)
+            remaining_seconds = deadline - time.monotonic()
+            if changed_pods_status or remaining_seconds <= 0:
+                return self._status_revisions.cursor(), changed_pods_status
+            if self._pod_informer and self._pod_informer.is_fresh:
+                # Waiting at most the max poll delay, in case the informer gets stale meanwhile
+                await self._pod_informer.wait_for_change(
+                    informer_changes, min(_STATUS_CHANGES_MAX_POLL_SECONDS, remaining_seconds)
                 )
+            else:
+                await asyncio.sleep(min(poll_seconds, remaining_seconds))
+                poll_seconds = min(2 * poll_seconds, _STATUS_CHANGES_MAX_POLL_SECONDS)
 
-                assert remote_pod.metadata and remote_pod.status
-
-                remote_container_statuses: list[k.V1ContainerStatus] = remote_pod.status.container_statuses or []
-                i_container_statuses: list[i.ContainerStatus] = []
-                for cs in remote_container_statuses:
-                    i_cs = mappers.map_k_model_to_i_model(self._k_api_client, cs, i.ContainerStatus)
-                    if cs.state and cs.state.running and cs.state.running.started_at:
-                        assert i_cs.state.running
-                        i_cs.state.running.started_at = cs.state.running.started_at.strftime("%Y-%m-%dT%H:%M:%SZ")
-                    i_container_statuses.append(i_cs)
-
-                i_pod_status = i.PodStatus(
-                    uid=i_pod.metadata.uid,
-                    jid=remote_pod.metadata.uid,
-                    name=i_pod.metadata.name,
-                    namespace=i_pod.metadata.namespace,
-                    containers=i_container_statuses,
+    def _track_status_changes(
+        self,
+        i_pods: list[i.PodRequest] | list[PodStatusRequest],
+        pods_status: list[i.PodStatus],
+        since: int | None,
+    ) -> list[i.PodStatus]:
+        """Update the status revisions, return the pods status changed since the given revision"""
+        found_uids = {pod_status.uid for pod_status in pods_status}
+        for i_pod in i_pods:
+            if i_pod.metadata.uid and i_pod.metadata.uid not in found_uids:
+                self._status_revisions.forget(i_pod.metadata.uid)
+        changed_pods_status: list[i.PodStatus] = []
+        for pod_status in pods_status:
+            fingerprint = hash(pod_status.model_dump_json(by_alias=True))
+            revision = self._status_revisions.update(pod_status.uid, fingerprint)
+            if since is None or revision > since:
+                changed_pods_status.append(pod_status)
+        return changed_pods_status
+
+    async def _list_pods_for_status(
+        self, i_pods: list[i.PodRequest] | list[PodStatusRequest]
+    ) -> dict[str, dict[str, k.V1Pod]]:
+        if self._offloading_params["status_strategy"] == _STATUS_STRATEGY_NAMESPACE and not (
+            self._pod_informer and self._pod_informer.is_fresh
+        ):
+            if self._status_cache is not None:
+                # Cached pods are not looked up in the listed pods
+                i_pods = [i_pod for i_pod in i_pods if i_pod.metadata.uid not in self._status_cache]
+            return await self._list_pods_by_namespace(i_pods)
+        return {}
+
+    async def _list_pods_by_namespace(
+        self, i_pods: list[i.PodRequest] | list[PodStatusRequest]
+    ) -> dict[str, dict[str, k.V1Pod]]:
+        """List offloaded pods with one call per (scoped) namespace, for namespaces with at least
+        `offloading.status_namespace_batch_min_pods` requested pods.
+        Return a map from namespace to pods by source pod uid; namespaces that could not be listed are omitted."""
+        pods_per_namespace: dict[str, int] = {}
+        for i_pod in i_pods:
+            if i_pod.metadata.namespace:
+                pod_namespace = self._scope_ns_name(i_pod.metadata.namespace)
+                pods_per_namespace[pod_namespace] = pods_per_namespace.get(pod_namespace, 0) + 1
+        namespaces = [
+            namespace
+            for namespace, count in pods_per_namespace.items()
+            if count >= self._offloading_params["status_namespace_batch_min_pods"]
+        ]
+
+        pod_lists = await gather_with_concurrency(
+            self._offloading_params["status_concurrency"],
+            *[self._list_namespaced_pods(namespace) for namespace in namespaces],
+        )
+        return {namespace: pods for namespace, pods in zip(namespaces, pod_lists) if pods is not None}
+
+    async def _list_namespaced_pods(self, namespace: str) -> dict[str, k.V1Pod] | None:
+        """List offloaded pods in the given namespace by source pod uid, or `None` if they could not be listed"""
+        try:
+            remote_pods: k.V1PodList = await self._k_core_client.list_namespaced_pod(
+                namespace, label_selector=self._label_selector(_I_COMMON_LABELS)
+            )
+        except k_exceptions.ApiException as api_exception:
+            self.logger.error(f"{api_exception.status} {api_exception.reason}: {api_exception.body}")
+            return None
+        return {
+            remote_pod.metadata.labels[_I_SRC_POD_UID_KEY]: remote_pod
+            for remote_pod in remote_pods.items
+            if remote_pod.metadata and remote_pod.metadata.labels and _I_SRC_POD_UID_KEY in remote_pod.metadata.labels
+        }
+
+    async def _get_pod_status(
+        self, i_pod: i.PodRequest | PodStatusRequest, listed_pods: dict[str, dict[str, k.V1Pod]] | None = None
+    ) -> i.PodStatus | None:
+        """Get the status of the pod from the status cache, if enabled, or read it (see `_read_pod_status`)"""
+        if self._status_cache is None or not i_pod.metadata.uid:
+            return await self._read_pod_status(i_pod, listed_pods)
+        if (cached_pod_status := self._status_cache.get(i_pod.metadata.uid)) is not None:
+            return cached_pod_status
+        pod_status = await self._read_pod_status(i_pod, listed_pods)
+        if pod_status is not None:
+            self._status_cache.set(i_pod.metadata.uid, pod_status)
+        return pod_status
+
+    async def _read_pod_status(
+        self, i_pod: i.PodRequest | PodStatusRequest, listed_pods: dict[str, dict[str, k.V1Pod]] | None = None
+    ) -> i.PodStatus | None:
+        """Get the status of the remote pod, or `None` if it could not be read.
+        Look up `listed_pods` first (see `_list_pods_by_namespace`), then the pod informer, then read the pod."""
+        try:
+            assert i_pod.metadata.name and i_pod.metadata.namespace and i_pod.metadata.uid
+
+            pod_name = self._scope_obj_name(i_pod.metadata.name, pod_uid=i_pod.metadata.uid)
+            pod_namespace = self._scope_ns_name(i_pod.metadata.namespace)
+            remote_pod: k.V1Pod | None = None
+            if listed_pods and pod_namespace in listed_pods:
+                remote_pod = listed_pods[pod_namespace].get(i_pod.metadata.uid)
+                if remote_pod is None:
+                    self.logger.error("Pod '%s' in '%s' not found", pod_name, pod_namespace)
+                    return None
+            if remote_pod is None and self._pod_informer:
+                if remote_pod_state := self._pod_informer.get(pod_namespace, i_pod.metadata.uid):
+                    return self._map_remote_pod_state(i_pod, remote_pod_state)
+            if remote_pod is None and self._offloading_params["status_raw_json"]:
+                # The pod name is scoped by source pod uid: the same key always maps to the same source pod
+                return await self._read_coalesced(
+                    "read_raw_pod_status",
+                    (pod_namespace, pod_name),
+                    lambda: self._read_raw_pod_status(i_pod, pod_name, pod_namespace),
+                )
+            if remote_pod is None:
+                # Informer disabled, stale, or not yet notified about a just created pod
+                remote_pod = await self._read_coalesced(
+                    "read_pod_status",
+                    (pod_namespace, pod_name),
+                    lambda: self._k_core_client.read_namespaced_pod_status(name=pod_name, namespace=pod_namespace),
                 )
 
-                status.append(i_pod_status)
+            assert remote_pod.metadata and remote_pod.status
+
+            remote_container_statuses: list[k.V1ContainerStatus] = remote_pod.status.container_statuses or []
+            i_container_statuses: list[i.ContainerStatus] = []
+            for cs in remote_container_statuses:
+                i_cs = mappers.map_k_model_to_i_model(self._k_api_client, cs, i.ContainerStatus)
+                if cs.state and cs.state.running and cs.state.running.started_at:
+                    assert i_cs.state.running
+                    i_cs.state.running.started_at = cs.state.running.started_at.strftime(STARTED_AT_FORMAT)
+                i_container_statuses.append(i_cs)
+
+            i_pod_status = i.PodStatus(
+                uid=i_pod.metadata.uid,
+                jid=remote_pod.metadata.uid,
+                name=i_pod.metadata.name,
+                namespace=i_pod.metadata.namespace,
+                containers=i_container_statuses,
+            )
+
+            # self.logger.debug(
+            #     "Pod '%s' in '%s' status: %s",
+            #     remote_pod.metadata.name,
+            #     remote_pod.metadata.namespace,
+            #     str(i_pod_status.containers),
+            # )
+            return i_pod_status
+        except k_exceptions.ApiException as api_exception:
+            self.logger.error(f"{api_exception.status} {api_exception.reason}: {api_exception.body}")
+            return None
 
-                # self.logger.debug(
-                #     "Pod '%s' in '%s' status: %s",
-                #     remote_pod.metadata.name,
-                #     remote_pod.metadata.namespace,
-                #     str(i_pod_status.containers),
-                # )
-            except k_exceptions.ApiException as api_exception:
-                self.logger.error(f"{api_exception.status} {api_exception.reason}: {api_exception.body}")
-        return status
+    def _map_remote_pod_state(
+        self, i_pod: i.PodRequest | PodStatusRequest, remote_pod_state: RemotePodState
+    ) -> i.PodStatus:
+        """Map the compact state of the remote pod kept by the pod informer, without any remote call"""
+        assert i_pod.metadata.name and i_pod.metadata.namespace and i_pod.metadata.uid
+        return i.PodStatus(
+            uid=i_pod.metadata.uid,
+            jid=remote_pod_state.uid,
+            name=i_pod.metadata.name,
+            namespace=i_pod.metadata.namespace,
+            containers=[cs.to_i_container_status() for cs in remote_pod_state.containers],
+        )
+
+    async def _read_raw_pod_status(
+        self, i_pod: i.PodRequest | PodStatusRequest, pod_name: str, pod_namespace: str
+    ) -> i.PodStatus:
+        """Read the status of the remote pod as raw JSON, and map the needed fields straight into Interlink models,
+        i.e. without deserializing the whole `V1Pod` object graph"""
+        assert i_pod.metadata.name and i_pod.metadata.namespace and i_pod.metadata.uid
+
+        response = await self._k_core_client.read_namespaced_pod_status(
+            name=pod_name, namespace=pod_namespace, _preload_content=False
+        )
+        try:
+            raw_pod: dict[str, Any] = json.loads(response.data)
+        finally:
+            response.release_conn()
+
+        i_container_statuses: list[i.ContainerStatus] = []
+        for raw_cs in (raw_pod.get("status") or {}).get("containerStatuses") or []:
+            running = (raw_cs.get("state") or {}).get("running")
+            if running and running.get("startedAt"):
+                running["startedAt"] = datetime.fromisoformat(running["startedAt"]).strftime(STARTED_AT_FORMAT)
+            i_container_statuses.append(mappers.map_k_dict_to_i_model(raw_cs, i.ContainerStatus))
+
+        return i.PodStatus(
+            uid=i_pod.metadata.uid,
+            jid=raw_pod["metadata"]["uid"],
+            name=i_pod.metadata.name,
+            namespace=i_pod.metadata.namespace,
+            containers=i_container_statuses,
+        )
 
     async def get_logs(self, i_log_req: i.LogRequest) -> str:
         """
         Logs are new-line separated strings, e.g.:
         '2024-09-20T09:26:33.653884634+02:00 Listening on port 8181.\n
          2024-09-20T09:31:26.751801413+02:00 {"name": "test"}\n
+        The `follow` option is ignored, see `follow_logs`.
         """
-        logs: str = self._k_core_client.read_namespaced_pod_log(
-            name=self._scope_obj_name(i_log_req.pod_name, pod_uid=i_log_req.pod_uid),
-            namespace=self._scope_ns_name(i_log_req.namespace),
-            timestamps=i_log_req.opts.timestamps,
-            previous=i_log_req.opts.previous,
-            follow=False,  # i_log_req.opts.follow,
-            _preload_content=True,  # not i_log_req.opts.follow
-            tail_lines=i_log_req.opts.tail or None,
-            limit_bytes=i_log_req.opts.limit_bytes or None,
-            since_seconds=i_log_req.opts.since_seconds or None,
+        pod_name = self._scope_obj_name(i_log_req.pod_name, pod_uid=i_log_req.pod_uid)
+        pod_namespace = self._scope_ns_name(i_log_req.namespace)
+        read_options = self._log_read_options(i_log_req)
+        logs: str = await self._read_coalesced(
+            "read_pod_log",
+            (pod_namespace, pod_name, *read_options.values()),
+            lambda: self._k_core_client.read_namespaced_pod_log(
+                name=pod_name, namespace=pod_namespace, follow=False, **read_options
+            ),
         )
+        return logs
 
-        # TODO if follow, you'll get a generator
-        # See also https://github.com/kubernetes-client/python/issues/199
+    async def follow_logs(self, i_log_req: i.LogRequest) -> LogStream:
+        """Open the log stream of the remote container, i.e. `get_logs` with `follow`, streaming the logs as they
+        are written by the container, until it terminates.
+        Errors opening the stream (e.g., pod not found) are raised here, as well as `TooManyRequestsError` if
+        `offloading.log_follow_max_streams` logs are already being streamed.
+        Followed logs are never shared with concurrent identical requests (see `offloading.single_flight_enabled`).
+        """
+        if self._log_follow_streams >= self._log_follow_max_streams:
+            raise TooManyRequestsError(what="followed logs", limit=self._log_follow_max_streams)
+        # The slot is taken before opening the stream, so that concurrent requests cannot exceed the limit
+        self._log_follow_streams += 1
+        try:
+            pod_name = self._scope_obj_name(i_log_req.pod_name, pod_uid=i_log_req.pod_uid)
+            pod_namespace = self._scope_ns_name(i_log_req.namespace)
+            response = await self._k_core_client.read_namespaced_pod_log(
+                name=pod_name,
+                namespace=pod_namespace,
+                follow=True,
+                _preload_content=False,
+                **self._log_read_options(i_log_req),
+            )
+        except BaseException:
+            self._release_log_follow_slot()
+            raise
+        return LogStream(response, self._log_follow_executor, self.logger, on_close=self._release_log_follow_slot)
+
+    def _release_log_follow_slot(self) -> None:
+        self._log_follow_streams -= 1
+
+    def _log_read_options(self, i_log_req: i.LogRequest) -> dict[str, Any]:
+        return {
+            "timestamps": i_log_req.opts.timestamps,
+            "previous": i_log_req.opts.previous,
+            "tail_lines": i_log_req.opts.tail or None,
+            "limit_bytes": i_log_req.opts.limit_bytes or None,
+            "since_seconds": i_log_req.opts.since_seconds or None,
+        }
 
-        return logs
+    async def _read_coalesced(self, operation: str, key: tuple, read: Callable[[], Awaitable[T]]) -> T:
+        """Run the remote read, sharing it with concurrent identical reads if single-flight is enabled"""
+        if self._single_flight is None:
+            return await read()
+        return await self._single_flight.run(operation, key, read)
 
     async def create_pod(self, i_pod_with_volumes: i.Pod) -> i.CreateStruct:
         self.logger.info("Creating Pod")
 
         result: i.CreateStruct
+        i_pod = i_pod_with_volumes.pod
+
+        # Virtual Kubelet could retry the creation of an already offloaded pod
+        if existing_result := await self._find_created_pod(i_pod):
+            self.logger.info("Pod already created, with result: %s", existing_result)
+            return existing_result
+
+        stage_timings: dict[str, float] = {}  # elapsed seconds by creation stage
+        created: list[_CreatedObject] = []  # transaction log of the objects created by this attempt
+        in_flight_uid = i_pod.metadata.uid or ""
 
         try:
-            # create namespace
-            assert i_pod_with_volumes.pod.metadata.namespace
-            self._create_offloading_namespace(i_pod_with_volumes.pod.metadata.namespace)
-
-            # create POD's volumes
-            for i_volume in i_pod_with_volumes.container:
-                assert i_pod_with_volumes.pod.metadata.uid
-                if i_volume.config_maps:
-                    self._create_config_maps(i_volume.config_maps, pod_uid=i_pod_with_volumes.pod.metadata.uid)
-                if i_volume.secrets:
-                    self._create_secrets(i_volume.secrets, pod_uid=i_pod_with_volumes.pod.metadata.uid)
-                if i_volume.persistent_volume_claims:
-                    self._create_pvcs(
-                        i_volume.persistent_volume_claims,
-                        pod_uid=i_pod_with_volumes.pod.metadata.uid,
-                        pod_metadata=i_pod_with_volumes.pod.metadata,
-                    )
-            # create POD
-            result = await self._create_pod(i_pod_with_volumes.pod)
+            assert i_pod.metadata.namespace and i_pod.metadata.uid
+            self._pods_in_flight.add(in_flight_uid)
+
+            # the namespace must not be reaped while creating the pod
+            async with self._guard_namespace(self._scope_ns_name(i_pod.metadata.namespace)):
+                # create namespace
+                with self._timed_stage(stage_timings, "namespace"):
+                    await self._create_offloading_namespace(i_pod.metadata.namespace)
+
+                # create POD's volumes (they are independent of each other)
+                with self._timed_stage(stage_timings, "volumes"):
+                    volume_creations: list[Coroutine[Any, Any, Any]] = []
+                    for i_volume in i_pod_with_volumes.container:
+                        for i_config_map in i_volume.config_maps or []:
+                            volume_creations.append(
+                                self._create_config_map(i_config_map, pod_uid=i_pod.metadata.uid, created=created)
+                            )
+                        for i_secret in i_volume.secrets or []:
+                            volume_creations.append(
+                                self._create_secret(i_secret, pod_uid=i_pod.metadata.uid, created=created)
+                            )
+                        for i_pvc in i_volume.persistent_volume_claims or []:
+                            volume_creations.append(
+                                self._create_pvc(
+                                    i_pvc, pod_uid=i_pod.metadata.uid, pod_metadata=i_pod.metadata, created=created
+                                )
+                            )
+                    await gather_settled(*volume_creations)
+
+                # create POD
+                with self._timed_stage(stage_timings, "pod"):
+                    result = await self._create_pod(i_pod, created=created)
+
+            if self._remote_index:
+                pod_namespace = self._scope_ns_name(i_pod.metadata.namespace)
+                pod_name = self._scope_obj_name(i_pod.metadata.name or "", pod_uid=i_pod.metadata.uid)
+                self._remote_index.add(pod_namespace, i_pod.metadata.uid, "Pod", pod_name, jid=result.pod_jid)
+                for created_object in created:
+                    if created_object.kind != "Pod":
+                        self._remote_index.add(
+                            created_object.namespace, i_pod.metadata.uid, created_object.kind, created_object.name
+                        )
         except Exception as exc:
             self.logger.error("Got an exception while creating Pod (trigger rollback): %s", exc)
-            await self.delete_pod(i_pod_with_volumes.pod, rollback=True)
+            # The namespace could have been deleted in the meanwhile, check it again on next creation
+            self._known_namespaces.discard(self._scope_ns_name(i_pod.metadata.namespace or ""))
+            with self._timed_stage(stage_timings, "rollback"):
+                await self._rollback_created_objects(created)
             raise exc
+        finally:
+            self._pods_in_flight.discard(in_flight_uid)
+            if self._status_cache is not None and i_pod.metadata.uid:
+                # Status read while creating the pod is outdated
+                self._status_cache.pop(i_pod.metadata.uid)
+            self.logger.info(
+                "Pod creation timings: %s",
+                ", ".join([f"{stage} {elapsed:.3f}s" for stage, elapsed in stage_timings.items()]),
+            )
 
         return result
 
+    def _guard_namespace(self, scoped_ns: str) -> AbstractAsyncContextManager[None]:
+        """Prevent the namespace from being reaped (see `KubernetesNamespaceReaper.guard`)"""
+        return self._namespace_reaper.guard(scoped_ns) if self._namespace_reaper else nullcontext()
+
+    async def _find_created_pod(self, i_pod: i.PodRequest) -> i.CreateStruct | None:
+        """Find the creation result of an already offloaded pod, by its source pod uid.
+        Look up the pods created by this service first, then the pod informer (if enabled and fresh), without
+        remote calls; then the remote index (if enabled), confirming a hit by reading the remote pod, since the
+        pod could have been deleted by others since the index was last rebuilt."""
+        if not (i_pod.metadata.namespace and i_pod.metadata.uid):
+            return None
+        pod_namespace = self._scope_ns_name(i_pod.metadata.namespace)
+        if create_result := self._created_pods.get((pod_namespace, i_pod.metadata.uid)):
+            return create_result
+        if self._pod_informer and (remote_pod_state := self._pod_informer.get(pod_namespace, i_pod.metadata.uid)):
+            return i.CreateStruct(pod_uid=i_pod.metadata.uid, pod_jid=remote_pod_state.uid)
+        if self._remote_index and (record := self._remote_index.get(pod_namespace, i_pod.metadata.uid)):
+            if record.pod_name and record.pod_jid:
+                try:
+                    remote_pod: k.V1Pod = await self._k_core_client.read_namespaced_pod(record.pod_name, pod_namespace)
+                except k_exceptions.ApiException as api_exception:
+                    if api_exception.status != HTTPStatus.NOT_FOUND:
+                        self.logger.error(f"{api_exception.status} {api_exception.reason}: {api_exception.body}")
+                    return None  # create it (again)
+                if remote_pod.metadata and remote_pod.metadata.uid:
+                    return i.CreateStruct(pod_uid=i_pod.metadata.uid, pod_jid=remote_pod.metadata.uid)
+        return None
+
     async def delete_pod(self, i_pod: i.PodRequest, rollback=False) -> str:
         self.logger.info(f"Deleting Pod (rollback={rollback})")
         assert i_pod.metadata.uid and i_pod.metadata.name and i_pod.metadata.namespace
 
-        pod_name = self._scope_obj_name(i_pod.metadata.name, pod_uid=i_pod.metadata.uid)
         pod_namespace = self._scope_ns_name(i_pod.metadata.namespace)
+        self._created_pods.pop((pod_namespace, i_pod.metadata.uid))
+        if self._status_cache is not None:
+            self._status_cache.pop(i_pod.metadata.uid)
+        self._status_revisions.forget(i_pod.metadata.uid)
+
+        if self._delete_queue is not None and not rollback:
+            # Duplicated requests for a pod whose teardown is still pending are coalesced
+            self._delete_queue.put((pod_namespace, i_pod.metadata.uid), lambda: self._delete_pod_objects(i_pod))
+            return f"Pod '{i_pod.metadata.uid}' deletion enqueued"
 
-        if not rollback:
-            self.logger.info("Delete Pod '%s' in '%s'", pod_name, pod_namespace)
         try:
-            self._k_core_client.delete_namespaced_pod(name=pod_name, namespace=pod_namespace)
-        except k_exceptions.ApiException as api_exception:
-            if not rollback:
-                self.logger.error(f"{api_exception.status} {api_exception.reason}: {api_exception.body}")
+            await self._delete_pod_objects(i_pod, rollback=rollback)
+        except k_exceptions.ApiException:
+            pass  # already logged
+
+        return f"Pod '{i_pod.metadata.uid}' deleted"
+
+    async def _delete_pod_objects(self, i_pod: i.PodRequest, rollback=False) -> None:
+        """Delete the remote pod and the objects created for it, concurrently.
+        Wait for all deletions to complete, then raise the first `ApiException`, if any."""
+        assert i_pod.metadata.uid and i_pod.metadata.name and i_pod.metadata.namespace
+
+        pod_name = self._scope_obj_name(i_pod.metadata.name, pod_uid=i_pod.metadata.uid)
+        pod_namespace = self._scope_ns_name(i_pod.metadata.namespace)
+        pvc_names: set[str] = set()
+        if self._remote_index and (record := self._remote_index.get(pod_namespace, i_pod.metadata.uid)):
+            pvc_names.update(record.objects.get("PersistentVolumeClaim", set()))
+            self._remote_index.discard(pod_namespace, i_pod.metadata.uid)
+
+        # Every object created for the pod is labelled with its source uid (see `_scope_metadata`),
+        # so they can be deleted in bulk, even if not listed in the request
+        label_selector = self._label_selector({_I_SRC_POD_UID_KEY: i_pod.metadata.uid})
+        if not rollback:
+            self.logger.info("Delete Pod '%s' and its ConfigMaps and Secrets in '%s'", pod_name, pod_namespace)
+        deletions: list[Coroutine[Any, Any, None]] = [
+            self._delete_collection(
+                self._k_core_client.delete_collection_namespaced_pod, pod_namespace, label_selector, rollback=rollback
+            ),
+            self._delete_collection(
+                self._k_core_client.delete_collection_namespaced_config_map,
+                pod_namespace,
+                label_selector,
+                rollback=rollback,
+            ),
+            self._delete_collection(
+                self._k_core_client.delete_collection_namespaced_secret,
+                pod_namespace,
+                label_selector,
+                rollback=rollback,
+            ),
+        ]
 
         if self.config.get(Option.TCP_TUNNEL_ENABLED):
-            await self._install_bastion_release(i_pod, uninstall=True, rollback=rollback)
+            deletions.append(self._install_bastion_release(i_pod, uninstall=True, rollback=rollback))
 
+        # PVCs are not scoped to the pod (they could be shared), delete them by name according to retention policy
         if i_pod.spec and i_pod.spec.volumes:
             for volume in i_pod.spec.volumes:
-                if volume.config_map:
-                    cm_name = self._scope_obj_name(volume.config_map.name, pod_uid=i_pod.metadata.uid)
-                    if not rollback:
-                        self.logger.info("Delete ConfigMap '%s' in '%s'", cm_name, pod_namespace)
-                    try:
-                        self._k_core_client.delete_namespaced_config_map(cm_name, pod_namespace)
-                    except k_exceptions.ApiException as api_exception:
-                        if not rollback:
-                            self.logger.error(f"{api_exception.status} {api_exception.reason}: {api_exception.body}")
-                if volume.secret:
-                    secret_name = self._scope_obj_name(volume.secret.secret_name, pod_uid=i_pod.metadata.uid)
-                    if not rollback:
-                        self.logger.info("Delete Secret '%s' in '%s'", secret_name, pod_namespace)
-                    try:
-                        self._k_core_client.delete_namespaced_secret(secret_name, pod_namespace)
-                    except k_exceptions.ApiException as api_exception:
-                        if not rollback:
-                            self.logger.error(f"{api_exception.status} {api_exception.reason}: {api_exception.body}")
                 if volume.persistent_volume_claim:
-                    pvc_name = volume.persistent_volume_claim.claim_name  # PVC name is not scoped to POD uid
-                    if remote_pvc := self._find_namespaced_pvc(pvc_name, pod_namespace):
-                        assert remote_pvc.metadata
-                        to_be_deleted = self._check_annotation_value(
-                            remote_pvc.metadata.annotations, _I_RMT_PVC_RETENTION_POLICY_KEY, "delete"
-                        )
-                        if to_be_deleted:
-                            if not rollback:
-                                self.logger.info("Delete PVC '%s' in '%s'", pvc_name, pod_namespace)
-                            try:
-                                self._k_core_client.delete_namespaced_persistent_volume_claim(pvc_name, pod_namespace)
-                            except k_exceptions.ApiException as api_exception:
-                                if not rollback:
-                                    self.logger.error(
-                                        f"{api_exception.status} {api_exception.reason}: {api_exception.body}"
-                                    )
+                    pvc_names.add(volume.persistent_volume_claim.claim_name)
+        for pvc_name in pvc_names:
+            deletions.append(self._delete_pvc(pvc_name, pod_namespace, rollback=rollback))
 
-        return f"Pod '{i_pod.metadata.uid}' deleted"
+        await gather_settled(*deletions)
+
+    async def _delete_collection(
+        self, delete_collection: Callable[..., Awaitable[Any]], namespace: str, label_selector: str, *, rollback=False
+    ) -> None:
+        """Delete the objects matching the label selector with the given `delete_collection_namespaced_*` call"""
+        try:
+            await delete_collection(namespace, label_selector=label_selector)
+        except k_exceptions.ApiException as api_exception:
+            if not rollback:
+                self.logger.error(f"{api_exception.status} {api_exception.reason}: {api_exception.body}")
+            raise
 
-    def _create_offloading_namespace(self, name: str):
+    async def _delete_pvc(self, pvc_name: str, pvc_namespace: str, *, rollback=False) -> None:
+        """Delete the PVC if its retention policy is "delete"."""
+        try:
+            remote_pvc = await self._find_namespaced_pvc(pvc_name, pvc_namespace)
+            if not remote_pvc:
+                return
+            assert remote_pvc.metadata
+            if self._check_annotation_value(remote_pvc.metadata.annotations, _I_RMT_PVC_RETENTION_POLICY_KEY, "delete"):
+                if not rollback:
+                    self.logger.info("Delete PVC '%s' in '%s'", pvc_name, pvc_namespace)
+                self._pvc_cache.pop((pvc_namespace, pvc_name))
+                await self._k_core_client.delete_namespaced_persistent_volume_claim(pvc_name, pvc_namespace)
+        except k_exceptions.ApiException as api_exception:
+            if api_exception.status == HTTPStatus.NOT_FOUND:
+                return
+            if not rollback:
+                self.logger.error(f"{api_exception.status} {api_exception.reason}: {api_exception.body}")
+            raise
+
+    async def _create_offloading_namespace(self, name: str):
+        """Create the offloading namespace, unless it is already known to exist.
+
+        Known namespaces are cached in-memory, so that the remote cluster is only queried on first use.
+        Notice that the offloading namespace could be a preexisting one, e.g. if excluded from prefixing.
+        """
         scoped_ns = self._scope_ns_name(name)
-        # Check whether we need to create the offloading namepsace
-        # Notice that we list them all, as the offloading namespace could be a preexisting one.
-        namespaces: k.V1NamespaceList = self._k_core_client.list_namespace()
-        # namespaces: k.V1NamespaceList = self._k_core_client.list_namespace(
-        #     label_selector=",".join([f"{key}={value}" for key, value in _I_COMMON_LABELS.items()])
-        # )
-        assert isinstance(namespaces.items, list)
-        if _.find(namespaces.items, lambda item: item.metadata.name == scoped_ns if item.metadata else False):
-            self.logger.info("Namespace '%s' already exists", scoped_ns)
-        else:
-            self._k_core_client.create_namespace(
+        if scoped_ns in self._known_namespaces:
+            return
+        try:
+            await self._k_core_client.create_namespace(
                 k.V1Namespace(
                     api_version="v1",
                     kind="Namespace",
@@ -235,43 +835,80 @@ class KubernetesPluginService(BaseService):
                 )
             )
             self.logger.info("Namespace '%s' created", scoped_ns)
+        except k_exceptions.ApiException as api_exception:
+            if api_exception.status == HTTPStatus.CONFLICT:
+                self.logger.info("Namespace '%s' already exists", scoped_ns)
+            elif api_exception.status == HTTPStatus.FORBIDDEN:
+                # Not allowed to create namespaces, check whether it is a preexisting one (raise if missing)
+                await self._k_core_client.read_namespace(scoped_ns)
+                self.logger.info("Namespace '%s' already exists", scoped_ns)
+            else:
+                raise
+        self._known_namespaces.add(scoped_ns)
+
+    async def _rollback_created_objects(self, created: list[_CreatedObject]) -> None:
+        """Delete concurrently the objects created by a failed creation attempt, in no particular order.
+        Preexisting objects (e.g., a Pod that got a `409 Conflict` on a retried creation) are never touched.
+        Errors are logged and not rethrown."""
+        self.logger.info("Rollback %d created objects", len(created))
+        await asyncio.gather(*[self._delete_created_object(created_object) for created_object in created])
+
+    async def _delete_created_object(self, created_object: _CreatedObject) -> None:
+        kind, name, namespace = created_object
+        try:
+            match kind:
+                case "Pod":
+                    await self._k_core_client.delete_namespaced_pod(name, namespace)
+                case "ConfigMap":
+                    await self._k_core_client.delete_namespaced_config_map(name, namespace)
+                case "Secret":
+                    await self._k_core_client.delete_namespaced_secret(name, namespace)
+                case "PersistentVolumeClaim":
+                    self._pvc_cache.pop((namespace, name))
+                    await self._k_core_client.delete_namespaced_persistent_volume_claim(name, namespace)
+                case "Service":
+                    await self._k_core_client.delete_namespaced_service(name, namespace)
+                case "HelmRelease":
+                    await self._h_client.uninstall_release(name, namespace=namespace, wait=False, timeout="60s")
+            self.logger.info("Rolled back %s '%s' in '%s'", kind, name, namespace)
+        except k_exceptions.ApiException as api_exception:
+            if api_exception.status != HTTPStatus.NOT_FOUND:
+                self.logger.error(f"{api_exception.status} {api_exception.reason}: {api_exception.body}")
+        except HelmError as helm_error:
+            self.logger.error(helm_error)
 
-    async def _create_pod(self, i_pod: i.PodRequest) -> i.CreateStruct:
+    async def _create_pod(self, i_pod: i.PodRequest, *, created: list[_CreatedObject]) -> i.CreateStruct:
         assert i_pod.metadata.uid
 
-        metadata: k.V1ObjectMeta = mappers.map_i_model_to_k_model(self._k_api_client, i_pod.metadata, k.V1ObjectMeta)
-        self._scope_metadata(metadata, metadata, pod_uid=i_pod.metadata.uid)
-
-        pod_spec: k.V1PodSpec = mappers.map_i_model_to_k_model(self._k_api_client, i_pod.spec, k.V1PodSpec)
-        self._filter_volumes(pod_spec, metadata, pod_uid=i_pod.metadata.uid)
-
-        if self._offloading_params["node_selector"]:
-            pod_spec.node_selector = self._offloading_params["node_selector"]
-        if self._offloading_params["node_tolerations"]:
-            pod_spec.tolerations = [k.V1Toleration(**t) for t in self._offloading_params["node_tolerations"]]
-
-        if metadata.annotations and _I_PRE_EXEC_KEY in metadata.annotations:
-            pre_exec = metadata.annotations[_I_PRE_EXEC_KEY]
-            self._add_pre_exec_init_container(pod_spec, metadata, pre_exec)
-            # Debug: run pod with privileged containers
-            # for container in pod_spec.containers or []:
-            #     container.security_context = k.V1SecurityContext(privileged=True)
-
-        pod = k.V1Pod(
-            api_version="v1",
-            kind="Pod",
-            metadata=metadata,
-            spec=pod_spec,
-        )
+        pod: k.V1Pod | dict[str, Any]
+        if self._offloading_params["create_raw_json"]:
+            pod = self._build_pod_dict(i_pod)
+            pod_name, pod_namespace = pod["metadata"]["name"], pod["metadata"]["namespace"]
+        else:
+            pod = self._build_pod_model(i_pod)
+            assert pod.metadata
+            pod_name, pod_namespace = pod.metadata.name, pod.metadata.namespace
 
         if str(self.config.get(Option.TCP_TUNNEL_ENABLED, "False")).lower() == "true":
-            await self._install_bastion_release(i_pod)
+            await self._install_bastion_release(i_pod, created=created)
 
-        assert metadata.name and metadata.namespace
-        remote_pod: k.V1Pod = self._k_core_client.create_namespaced_pod(namespace=metadata.namespace, body=pod)
+        assert pod_name and pod_namespace
+        try:
+            remote_pod: k.V1Pod = await self._k_core_client.create_namespaced_pod(namespace=pod_namespace, body=pod)
+            created.append(_CreatedObject("Pod", pod_name, pod_namespace))
+        except k_exceptions.ApiException as api_exception:
+            if api_exception.status != HTTPStatus.CONFLICT:
+                raise
+            # Pod already exists: it is the same pod if offloaded from the same source pod
+            remote_pod = await self._k_core_client.read_namespaced_pod(pod_name, pod_namespace)
+            assert remote_pod.metadata
+            if (remote_pod.metadata.labels or {}).get(_I_SRC_POD_UID_KEY) != i_pod.metadata.uid:
+                raise
+            self.logger.info("Pod '%s' in '%s' already exists", pod_name, pod_namespace)
 
         assert i_pod.metadata.uid and remote_pod.metadata and remote_pod.metadata.uid
         create_result = i.CreateStruct(pod_uid=i_pod.metadata.uid, pod_jid=remote_pod.metadata.uid)
+        self._created_pods.set((pod_namespace, i_pod.metadata.uid), create_result)
         self.logger.info(
             "Pod '%s' in '%s' created, with result: %s",
             remote_pod.metadata.name,
@@ -280,9 +917,16 @@ class KubernetesPluginService(BaseService):
         )
         return create_result
 
-    async def _install_bastion_release(self, i_pod: i.PodRequest, uninstall=False, rollback=False):
+    async def _install_bastion_release(
+        self,
+        i_pod: i.PodRequest,
+        uninstall=False,
+        rollback=False,
+        created: list[_CreatedObject] | None = None,
+    ):
         """
         Install/uninstall Bastion release for the given `PodRequest`.
+        On install, the created Service and release are appended to `created`, if provided.
 
         Raises:
             `HelmError`,
@@ -326,7 +970,7 @@ class KubernetesPluginService(BaseService):
                 if not rollback:
                     self.logger.info("Delete Headless Service '%s' in '%s'", pod_name, pod_ns)
                 try:
-                    self._k_core_client.delete_namespaced_service(pod_name, pod_ns)
+                    await self._k_core_client.delete_namespaced_service(pod_name, pod_ns)
                 except k_exceptions.ApiException as api_exception:
                     if not rollback:
                         self.logger.error(f"{api_exception.status} {api_exception.reason}: {api_exception.body}")
@@ -335,7 +979,11 @@ class KubernetesPluginService(BaseService):
             else:
                 self.logger.info("Create Headless Service '%s' in '%s'", pod_name, pod_ns)
                 service = k.V1Service(
-                    metadata=k.V1ObjectMeta(name=pod_name, namespace=pod_ns),
+                    metadata=k.V1ObjectMeta(
+                        name=pod_name,
+                        namespace=pod_ns,
+                        labels={**_I_COMMON_LABELS, _I_SRC_POD_UID_KEY: i_pod.metadata.uid},
+                    ),
                     spec=k.V1ServiceSpec(
                         selector={
                             **_I_COMMON_LABELS,
@@ -345,7 +993,9 @@ class KubernetesPluginService(BaseService):
                         ports=[k.V1ServicePort(port=port, target_port=port)],
                     ),
                 )
-                self._k_core_client.create_namespaced_service(pod_ns, service)
+                await self._k_core_client.create_namespaced_service(pod_ns, service)
+                if created is not None:
+                    created.append(_CreatedObject("Service", pod_name, pod_ns))
 
                 bastion_chart_path = self.config.get(Option.TCP_TUNNEL_BASTION_CHART_PATH)
                 bastion_chart = await self._h_client.get_chart(bastion_chart_path)
@@ -388,8 +1038,76 @@ class KubernetesPluginService(BaseService):
                         command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, check=True
                     )
                     self.logger.debug(result.stdout)
+                if created is not None:
+                    created.append(_CreatedObject("HelmRelease", bastion_rel_name, bastion_rel_ns))
             # endregion / install
 
+    def _build_pod_model(self, i_pod: i.PodRequest) -> k.V1Pod:
+        assert i_pod.metadata.uid
+
+        metadata: k.V1ObjectMeta = mappers.map_i_model_to_k_model(self._k_api_client, i_pod.metadata, k.V1ObjectMeta)
+        self._scope_metadata(metadata, metadata, pod_uid=i_pod.metadata.uid)
+
+        pod_spec: k.V1PodSpec = mappers.map_i_model_to_k_model(self._k_api_client, i_pod.spec, k.V1PodSpec)
+        self._filter_volumes(pod_spec, metadata, pod_uid=i_pod.metadata.uid)
+
+        if self._offloading_params["node_selector"]:
+            pod_spec.node_selector = self._offloading_params["node_selector"]
+        if self._offloading_params["node_tolerations"]:
+            pod_spec.tolerations = [k.V1Toleration(**t) for t in self._offloading_params["node_tolerations"]]
+
+        if metadata.annotations and _I_PRE_EXEC_KEY in metadata.annotations:
+            pre_exec = metadata.annotations[_I_PRE_EXEC_KEY]
+            self._add_pre_exec_init_container(pod_spec, metadata, pre_exec)
+            # Debug: run pod with privileged containers
+            # for container in pod_spec.containers or []:
+            #     container.security_context = k.V1SecurityContext(privileged=True)
+
+        return k.V1Pod(
+            api_version="v1",
+            kind="Pod",
+            metadata=metadata,
+            spec=pod_spec,
+        )
+
+    def _build_pod_dict(self, i_pod: i.PodRequest) -> dict[str, Any]:
+        """Like `_build_pod_model`, but build the request body directly in dict representation (camelCase keys),
+        skipping the deserialization to Kubernetes models and their serialization on send.
+        As with models, keys outside of the Kubernetes schema are dropped."""
+        assert i_pod.metadata.uid
+
+        metadata: dict[str, Any] = i_pod.metadata.model_dump(exclude_none=True, by_alias=True)
+        self._scope_metadata_dict(metadata, pod_uid=i_pod.metadata.uid)
+
+        pod_spec: dict[str, Any] = i_pod.spec.model_dump(exclude_none=True, by_alias=True)
+        self._filter_volumes_dict(pod_spec, metadata, pod_uid=i_pod.metadata.uid)
+
+        if self._offloading_params["node_selector"]:
+            pod_spec["nodeSelector"] = self._offloading_params["node_selector"]
+        if self._offloading_params["node_tolerations"]:
+            pod_spec["tolerations"] = mappers.serialize_k_model_to_dict(
+                self._k_api_client, [k.V1Toleration(**t) for t in self._offloading_params["node_tolerations"]]
+            )
+
+        if _I_PRE_EXEC_KEY in metadata["annotations"]:
+            self._add_pre_exec_init_container_dict(pod_spec, metadata["annotations"][_I_PRE_EXEC_KEY])
+
+        return mappers.prune_dict_to_k_model(
+            {"apiVersion": "v1", "kind": "Pod", "metadata": metadata, "spec": pod_spec}, k.V1Pod
+        )
+
+    def _add_pre_exec_init_container_dict(self, pod_spec: dict[str, Any], pre_exec: str) -> None:
+        """Like `_add_pre_exec_init_container`, for a pod spec in dict representation"""
+        mesh_spec = k.V1PodSpec(containers=[])
+        self._add_pre_exec_init_container(mesh_spec, k.V1ObjectMeta(), pre_exec)
+        for key, k_objects in [
+            ("volumes", mesh_spec.volumes),
+            ("initContainers", mesh_spec.init_containers),
+            ("containers", mesh_spec.containers),
+        ]:
+            if k_objects:
+                pod_spec.setdefault(key, []).extend(mappers.serialize_k_model_to_dict(self._k_api_client, k_objects))
+
     def _add_pre_exec_init_container(self, pod_spec: k.V1PodSpec, metadata: k.V1ObjectMeta, pre_exec: str) -> None:
         """
         Extract mesh.sh from heredoc in pre-exec annotation and add an init container to execute it
@@ -565,10 +1283,18 @@ class KubernetesPluginService(BaseService):
         # Remove the heredoc section
         return text[:start_idx] + text[end_idx + 1 :]
 
-    def _create_config_maps(self, i_config_maps: list[i.ConfigMap], *, pod_uid: str) -> list[k.V1ConfigMap]:
-        results = []
-
-        for i_config_map in i_config_maps:
+    async def _create_config_map(
+        self, i_config_map: i.ConfigMap, *, pod_uid: str, created: list[_CreatedObject]
+    ) -> k.V1ConfigMap:
+        config_map: k.V1ConfigMap | dict[str, Any]
+        if self._offloading_params["create_raw_json"]:
+            config_map = mappers.prune_dict_to_k_model(
+                {"apiVersion": "v1", "kind": "ConfigMap", **i_config_map.model_dump(exclude_none=True, by_alias=True)},
+                k.V1ConfigMap,
+            )
+            self._scope_metadata_dict(config_map["metadata"], pod_uid=pod_uid)
+            cm_name, cm_namespace = config_map["metadata"]["name"], config_map["metadata"]["namespace"]
+        else:
             cm_metadata = mappers.map_i_model_to_k_model(self._k_api_client, i_config_map.metadata, k.V1ObjectMeta)
             self._scope_metadata(cm_metadata, cm_metadata, pod_uid=pod_uid)
 
@@ -580,21 +1306,28 @@ class KubernetesPluginService(BaseService):
                 binary_data=i_config_map.binary_data,
                 immutable=i_config_map.immutable,
             )
+            cm_name, cm_namespace = cm_metadata.name, cm_metadata.namespace
 
-            assert cm_metadata.namespace and cm_metadata.name
-
-            remote_config_map: k.V1ConfigMap = self._k_core_client.create_namespaced_config_map(
-                namespace=cm_metadata.namespace, body=config_map
-            )
+        assert cm_namespace and cm_name
 
-            self.logger.info("ConfigMap '%s' in '%s' created", cm_metadata.name, cm_metadata.namespace)
-            results.append(remote_config_map)
-        return results
+        remote_config_map: k.V1ConfigMap = await self._k_core_client.create_namespaced_config_map(
+            namespace=cm_namespace, body=config_map
+        )
 
-    def _create_secrets(self, i_secrets: list[i.Secret], *, pod_uid: str) -> list[k.V1Secret]:
-        results = []
+        created.append(_CreatedObject("ConfigMap", cm_name, cm_namespace))
+        self.logger.info("ConfigMap '%s' in '%s' created", cm_name, cm_namespace)
+        return remote_config_map
 
-        for i_secret in i_secrets:
+    async def _create_secret(self, i_secret: i.Secret, *, pod_uid: str, created: list[_CreatedObject]) -> k.V1Secret:
+        secret: k.V1Secret | dict[str, Any]
+        if self._offloading_params["create_raw_json"]:
+            secret = mappers.prune_dict_to_k_model(
+                {"apiVersion": "v1", "kind": "Secret", **i_secret.model_dump(exclude_none=True, by_alias=True)},
+                k.V1Secret,
+            )
+            self._scope_metadata_dict(secret["metadata"], pod_uid=pod_uid)
+            secret_name, secret_namespace = secret["metadata"]["name"], secret["metadata"]["namespace"]
+        else:
             secret_metadata = mappers.map_i_model_to_k_model(self._k_api_client, i_secret.metadata, k.V1ObjectMeta)
             self._scope_metadata(secret_metadata, secret_metadata, pod_uid=pod_uid)
 
@@ -607,64 +1340,97 @@ class KubernetesPluginService(BaseService):
                 immutable=i_secret.immutable,
                 type=i_secret.type,
             )
+            secret_name, secret_namespace = secret_metadata.name, secret_metadata.namespace
 
-            assert secret_metadata.namespace and secret_metadata.name
+        assert secret_namespace and secret_name
 
-            remote_secret: k.V1Secret = self._k_core_client.create_namespaced_secret(
-                namespace=secret_metadata.namespace, body=secret
-            )
-
-            self.logger.info("Secret '%s' in '%s' created", secret_metadata.name, secret_metadata.namespace)
-            results.append(remote_secret)
-        return results
-
-    def _create_pvcs(
-        self, i_pvcs: list[i.PersistentVolumeClaim], *, pod_uid: str, pod_metadata: i.Metadata
-    ) -> list[k.V1PersistentVolumeClaim]:
-        results = []
-
-        for i_pvc in i_pvcs:
-            assert i_pvc.metadata.name
-            if not self._check_annotation_value(pod_metadata.annotations, _I_RMT_PVC_KEY, i_pvc.metadata.name):
-                continue
+        remote_secret: k.V1Secret = await self._k_core_client.create_namespaced_secret(
+            namespace=secret_namespace, body=secret
+        )
 
+        created.append(_CreatedObject("Secret", secret_name, secret_namespace))
+        self.logger.info("Secret '%s' in '%s' created", secret_name, secret_namespace)
+        return remote_secret
+
+    async def _create_pvc(
+        self, i_pvc: i.PersistentVolumeClaim, *, pod_uid: str, pod_metadata: i.Metadata, created: list[_CreatedObject]
+    ) -> k.V1PersistentVolumeClaim | None:
+        """Create the PVC if it is listed in the pod's `interlink.io/remote-pvc` annotation and does not exist yet,
+        return `None` if not created.
+        As on Pod deletion, the created PVC is rolled back only if its retention policy is "delete"."""
+        assert i_pvc.metadata.name
+        if not self._check_annotation_value(pod_metadata.annotations, _I_RMT_PVC_KEY, i_pvc.metadata.name):
+            return None
+
+        pvc: k.V1PersistentVolumeClaim | dict[str, Any]
+        if self._offloading_params["create_raw_json"]:
+            pvc = mappers.prune_dict_to_k_model(
+                {
+                    "apiVersion": "v1",
+                    "kind": "PersistentVolumeClaim",
+                    **i_pvc.model_dump(exclude_none=True, by_alias=True),
+                },
+                k.V1PersistentVolumeClaim,
+            )
+            self._scope_metadata_dict(pvc["metadata"], pod_uid=pod_uid, scope_name_by_pod_uid=False)
+            pvc_name, pvc_namespace = pvc["metadata"]["name"], pvc["metadata"]["namespace"]
+            pvc_annotations = pvc["metadata"]["annotations"]
+        else:
             pvc_metadata = mappers.map_i_model_to_k_model(self._k_api_client, i_pvc.metadata, k.V1ObjectMeta)
             self._scope_metadata(pvc_metadata, pvc_metadata, pod_uid=pod_uid, scope_name_by_pod_uid=False)
             pvc_spec = mappers.map_i_model_to_k_model(self._k_api_client, i_pvc.spec, k.V1PersistentVolumeClaimSpec)
 
-            assert pvc_metadata.name and pvc_metadata.namespace
-
-            if self._find_namespaced_pvc(pvc_metadata.name, pvc_metadata.namespace):
-                self.logger.info(
-                    "PVC '%s' in '%s' already exists, skip creation", pvc_metadata.name, pvc_metadata.namespace
-                )
-                continue
-
             pvc = k.V1PersistentVolumeClaim(
                 api_version="v1",
                 kind="PersistentVolumeClaim",
                 metadata=pvc_metadata,
                 spec=pvc_spec,
             )
-
-            remote_pvc: k.V1PersistentVolumeClaim = self._k_core_client.create_namespaced_persistent_volume_claim(
-                namespace=pvc_metadata.namespace, body=pvc
+            pvc_name, pvc_namespace, pvc_annotations = (
+                pvc_metadata.name,
+                pvc_metadata.namespace,
+                pvc_metadata.annotations,
             )
 
-            self.logger.info("PVC '%s' in '%s' created", pvc_metadata.name, pvc_metadata.namespace)
-            results.append(remote_pvc)
-        return results
+        assert pvc_name and pvc_namespace
 
-    def _find_namespaced_pvc(self, pvc_name: str, pvc_namespace: str) -> k.V1PersistentVolumeClaim | None:
-        """Find a PVC by name and namespace"""
-        remote_pvcs: k.V1PersistentVolumeClaimList = self._k_core_client.list_namespaced_persistent_volume_claim(
-            namespace=pvc_namespace
-        )
-        return _.find(
-            remote_pvcs.items,
-            lambda remote_pvc: (remote_pvc.metadata.name == pvc_name if remote_pvc.metadata else False),
+        if await self._find_namespaced_pvc(pvc_name, pvc_namespace):
+            self.logger.info("PVC '%s' in '%s' already exists, skip creation", pvc_name, pvc_namespace)
+            return None
+
+        remote_pvc: k.V1PersistentVolumeClaim = await self._k_core_client.create_namespaced_persistent_volume_claim(
+            namespace=pvc_namespace, body=pvc
         )
 
+        if self._check_annotation_value(pvc_annotations, _I_RMT_PVC_RETENTION_POLICY_KEY, "delete"):
+            created.append(_CreatedObject("PersistentVolumeClaim", pvc_name, pvc_namespace))
+        self.logger.info("PVC '%s' in '%s' created", pvc_name, pvc_namespace)
+        self._pvc_cache.set((pvc_namespace, pvc_name), remote_pvc)
+        return remote_pvc
+
+    async def _find_namespaced_pvc(self, pvc_name: str, pvc_namespace: str) -> k.V1PersistentVolumeClaim | None:
+        """Find a PVC by name and namespace, return `None` if not found.
+        Found PVCs are cached for `offloading.pvc_cache_ttl_seconds`."""
+        if remote_pvc := self._pvc_cache.get((pvc_namespace, pvc_name)):
+            return remote_pvc
+        try:
+            remote_pvc = await self._k_core_client.read_namespaced_persistent_volume_claim(pvc_name, pvc_namespace)
+        except k_exceptions.ApiException as api_exception:
+            if api_exception.status == HTTPStatus.NOT_FOUND:
+                return None
+            raise
+        self._pvc_cache.set((pvc_namespace, pvc_name), remote_pvc)
+        return remote_pvc
+
+    @contextmanager
+    def _timed_stage(self, stage_timings: dict[str, float], stage: str) -> Iterator[None]:
+        """Record in `stage_timings` the seconds elapsed in the given stage"""
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            stage_timings[stage] = time.perf_counter() - started_at
+
     def _check_annotation_value(self, annotations: dict[str, str] | None, key: str, value: str) -> bool:
         if annotations and key in annotations:
             values = annotations[key].split(",")
@@ -740,6 +1506,53 @@ class KubernetesPluginService(BaseService):
                             env_from.secret_ref.name = self._scope_obj_name(env_from.secret_ref.name, pod_uid=pod_uid)
         # endregion
 
+    def _filter_volumes_dict(self, pod_spec: dict[str, Any], metadata: dict[str, Any], *, pod_uid: str):
+        """Like `_filter_volumes`, for a pod spec and metadata in dict representation (camelCase keys)"""
+        # region spec.volumes
+        filtered_volumes: list[dict[str, Any]] = []
+        for volume in pod_spec.get("volumes") or []:
+            if (config_map := volume.get("configMap")) is not None:
+                assert config_map.get("name")
+                config_map["name"] = self._scope_obj_name(config_map["name"], pod_uid=pod_uid)
+                filtered_volumes.append(volume)
+            if (secret := volume.get("secret")) is not None:
+                assert secret.get("secretName")
+                secret["secretName"] = self._scope_obj_name(secret["secretName"], pod_uid=pod_uid)
+                filtered_volumes.append(volume)
+            if volume.get("emptyDir") is not None:
+                filtered_volumes.append(volume)
+            if (pvc := volume.get("persistentVolumeClaim")) is not None and self._check_annotation_value(
+                metadata.get("annotations"), _I_RMT_PVC_KEY, pvc.get("claimName")
+            ):
+                filtered_volumes.append(volume)
+        if filtered_volumes:
+            pod_spec["volumes"] = filtered_volumes
+        else:
+            pod_spec.pop("volumes", None)
+        # endregion
+        filtered_volume_names = {volume["name"] for volume in filtered_volumes}
+        for container in [*(pod_spec.get("containers") or []), *(pod_spec.get("initContainers") or [])]:
+            # region spec.containers[*].volumeMounts
+            filtered_volume_mounts = [
+                vm for vm in container.get("volumeMounts") or [] if vm["name"] in filtered_volume_names
+            ]
+            if filtered_volume_mounts:
+                container["volumeMounts"] = filtered_volume_mounts
+            else:
+                container.pop("volumeMounts", None)
+            # endregion
+            # region spec.containers[*].env[*].valueFrom, spec.containers[*].envFrom
+            for env_var in container.get("env") or []:
+                if value_from := env_var.get("valueFrom"):
+                    for key_ref in [value_from.get("configMapKeyRef"), value_from.get("secretKeyRef")]:
+                        if key_ref and key_ref.get("name"):
+                            key_ref["name"] = self._scope_obj_name(key_ref["name"], pod_uid=pod_uid)
+            for env_from in container.get("envFrom") or []:
+                for ref in [env_from.get("configMapRef"), env_from.get("secretRef")]:
+                    if ref and ref.get("name"):
+                        ref["name"] = self._scope_obj_name(ref["name"], pod_uid=pod_uid)
+            # endregion
+
     def _scope_ns_name(self, name: str) -> str:
         """Scope a K8s namespace name to the configuration option `offloading.namespace_prefix`,
         provided it is not in the exclusion list"""
@@ -786,6 +1599,25 @@ class KubernetesPluginService(BaseService):
             else source_metadata.name
         )
 
+    def _scope_metadata_dict(self, metadata: dict[str, Any], *, pod_uid: str, scope_name_by_pod_uid: bool = True):
+        """Like `_scope_metadata`, for metadata in dict representation, scoped with respect to itself"""
+        assert metadata.get("uid") and metadata.get("name") and metadata.get("namespace")
+
+        metadata.setdefault("labels", {}).update({**_I_COMMON_LABELS, _I_SRC_POD_UID_KEY: pod_uid})
+        metadata.setdefault("annotations", {}).update(
+            {
+                _I_SRC_UID_KEY: metadata["uid"],
+                _I_SRC_NAME_KEY: metadata["name"],
+                _I_SRC_NS_KEY: metadata["namespace"],
+            }
+        )
+        metadata["namespace"] = self._scope_ns_name(metadata["namespace"])
+        if scope_name_by_pod_uid:
+            metadata["name"] = self._scope_obj_name(metadata["name"], pod_uid=pod_uid)
+
+    def _label_selector(self, labels: dict[str, str]) -> str:
+        return ",".join([f"{key}={value}" for key, value in labels.items()])
+
     def _ensure_subdomain_compliance(self, name: str) -> str:
         """A lowercase RFC 1123 subdomain must consist of lower case alphanumeric characters, '-' or '.',
         and must start and end with an alphanumeric character.
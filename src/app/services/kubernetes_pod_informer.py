@@ -0,0 +1,228 @@
+import asyncio
+import threading
+import time
+from logging import Logger
+from typing import Final
+
+import kubernetes.client.exceptions as k_exceptions
+from kubernetes import client as k
+from kubernetes import watch as k_watch
+from kubernetes.client.api import CoreV1Api
+
+from app.entities.remote_pod_state import RemotePodState
+
+_HTTP_STATUS_GONE: Final = 410
+_MIN_WATCH_TIMEOUT_SECONDS: Final = 1
+_WATCH_REQUEST_TIMEOUT_MARGIN_SECONDS: Final = 10
+_RETRY_DELAY_SECONDS: Final = 5
+
+
+class KubernetesPodInformer:
+    """Keep an in-memory index of remote Pods matching a label selector, fed by a background list+watch loop.
+
+    Pods are indexed by `(namespace, <index_label_key> label value)`, and kept as compact `RemotePodState` records
+    (see `test/benchmarks/benchmark_remote_pod_state.py` for the memory saved over keeping `V1Pod` objects).
+    The index is refreshed by a full list every `resync_seconds`, and the watch is resumed from the last seen
+    `resourceVersion` (a relist is triggered on `410 Gone`). Coroutines can wait for the next change of the index
+    with `wait_for_change`, instead of polling it.
+
+    Staleness is bounded by `max_staleness_seconds`: watch requests are closed by the API server at half
+    that interval, and every clean close, event or bookmark marks the index as synced. If no sync happened
+    within `max_staleness_seconds` (e.g., the API server is unreachable), `is_fresh` is `False` and lookups
+    return `None`, so that callers fall back to direct API calls.
+    """
+
+    _logger: Logger
+    _k_core_client: CoreV1Api
+    _label_selector: str
+    _index_label_key: str
+    _resync_seconds: float
+    _max_staleness_seconds: float
+
+    _index: dict[tuple[str, str], RemotePodState]
+    _lock: threading.Lock
+    _changes: int  # bumped whenever the index changes
+    _change_waiters: set[tuple[asyncio.AbstractEventLoop, asyncio.Event]]
+    _resource_version: str | None
+    _synced_at: float | None  # monotonic time of last successful sync
+    _listed_at: float | None  # monotonic time of last full list
+    _stop_event: threading.Event
+    _watch: k_watch.Watch | None
+    _thread: threading.Thread | None
+
+    def __init__(
+        self,
+        logger: Logger,
+        k_core_client: CoreV1Api,
+        *,
+        label_selector: str,
+        index_label_key: str,
+        resync_seconds: float,
+        max_staleness_seconds: float,
+    ):
+        self._logger = logger
+        self._k_core_client = k_core_client
+        self._label_selector = label_selector
+        self._index_label_key = index_label_key
+        self._resync_seconds = resync_seconds
+        self._max_staleness_seconds = max_staleness_seconds
+
+        self._index = {}
+        self._lock = threading.Lock()
+        self._changes = 0
+        self._change_waiters = set()
+        self._resource_version = None
+        self._synced_at = None
+        self._listed_at = None
+        self._stop_event = threading.Event()
+        self._watch = None
+        self._thread = None
+
+    async def __aenter__(self):
+        self.start()
+        return self
+
+    async def __aexit__(self, *_exc_info):
+        await asyncio.to_thread(self.stop)
+
+    @property
+    def is_fresh(self) -> bool:
+        """Whether the index was synced with the API server within `max_staleness_seconds`"""
+        synced_at = self._synced_at
+        return synced_at is not None and time.monotonic() - synced_at <= self._max_staleness_seconds
+
+    def get(self, namespace: str, index_label_value: str) -> RemotePodState | None:
+        """Get the indexed Pod, or `None` if missing or if the index is not fresh"""
+        if not self.is_fresh:
+            return None
+        with self._lock:
+            return self._index.get((namespace, index_label_value))
+
+    @property
+    def changes(self) -> int:
+        """Number of changes of the index so far, to be passed to `wait_for_change`"""
+        return self._changes
+
+    async def wait_for_change(self, changes: int, timeout_seconds: float) -> bool:
+        """Wait until the index changed since `changes` was read, for at most `timeout_seconds`.
+        Return whether the index changed."""
+        waiter = (asyncio.get_running_loop(), asyncio.Event())
+        with self._lock:
+            if self._changes != changes:
+                return True
+            self._change_waiters.add(waiter)
+        try:
+            await asyncio.wait_for(waiter[1].wait(), timeout_seconds)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            with self._lock:
+                self._change_waiters.discard(waiter)
+
+    def _set(self, key: tuple[str, str], pod_state: RemotePodState | None) -> None:
+        """Index the pod state, or drop the key if `None`, and wake up the coroutines waiting for a change"""
+        with self._lock:
+            if pod_state is None:
+                self._index.pop(key, None)
+            else:
+                self._index[key] = pod_state
+            self._notify_change()
+
+    def _notify_change(self) -> None:
+        """To be called holding the lock"""
+        self._changes += 1
+        for loop, event in self._change_waiters:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                pass  # the loop is closed
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="k8s-pod-informer", daemon=True)
+        self._thread.start()
+        self._logger.info("Pod informer started (label selector '%s')", self._label_selector)
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._watch:
+            self._watch.stop()
+        if self._thread:
+            self._thread.join(timeout=self._watch_timeout_seconds() + _WATCH_REQUEST_TIMEOUT_MARGIN_SECONDS)
+            self._thread = None
+        self._logger.info("Pod informer stopped")
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                if self._resource_version is None or self._resync_due():
+                    self._relist()
+                self._watch_once()
+            except k_exceptions.ApiException as api_exception:
+                if api_exception.status == _HTTP_STATUS_GONE:
+                    self._logger.debug("Pod informer resourceVersion expired, relist")
+                    self._resource_version = None
+                    continue
+                self._logger.error(f"Pod informer: {api_exception.status} {api_exception.reason}: {api_exception.body}")
+                self._stop_event.wait(_RETRY_DELAY_SECONDS)
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                self._logger.error("Pod informer: %s", exc)
+                self._resource_version = None
+                self._stop_event.wait(_RETRY_DELAY_SECONDS)
+
+    def _relist(self) -> None:
+        pods: k.V1PodList = self._k_core_client.list_pod_for_all_namespaces(label_selector=self._label_selector)
+        index: dict[tuple[str, str], RemotePodState] = {}
+        for pod in pods.items:
+            if key := self._index_key(pod):
+                index[key] = RemotePodState(pod, source_pod_uid=key[1])
+        with self._lock:
+            self._index = index
+            self._notify_change()
+        assert pods.metadata
+        self._resource_version = pods.metadata.resource_version
+        self._listed_at = self._synced_at = time.monotonic()
+        self._logger.debug("Pod informer listed %d pods (resourceVersion %s)", len(index), self._resource_version)
+
+    def _watch_once(self) -> None:
+        """Watch until the API server closes the request, i.e. at most `_watch_timeout_seconds()`"""
+        timeout_seconds = self._watch_timeout_seconds()
+        self._watch = k_watch.Watch()
+        for event in self._watch.stream(
+            self._k_core_client.list_pod_for_all_namespaces,
+            label_selector=self._label_selector,
+            resource_version=self._resource_version,
+            allow_watch_bookmarks=True,
+            timeout_seconds=timeout_seconds,
+            _request_timeout=timeout_seconds + _WATCH_REQUEST_TIMEOUT_MARGIN_SECONDS,
+        ):
+            if event["type"] == "BOOKMARK":
+                self._resource_version = event["raw_object"]["metadata"]["resourceVersion"]
+            else:
+                pod: k.V1Pod = event["object"]
+                if key := self._index_key(pod):
+                    deleted = event["type"] == "DELETED"
+                    self._set(key, None if deleted else RemotePodState(pod, source_pod_uid=key[1]))
+                assert pod.metadata
+                self._resource_version = pod.metadata.resource_version
+            self._synced_at = time.monotonic()
+            if self._stop_event.is_set() or self._resync_due():
+                self._watch.stop()
+        if not self._stop_event.is_set():
+            # A watch closed by the API server delivered every event up to now
+            self._synced_at = time.monotonic()
+
+    def _index_key(self, pod: k.V1Pod) -> tuple[str, str] | None:
+        if pod.metadata and pod.metadata.namespace and pod.metadata.labels:
+            if index_label_value := pod.metadata.labels.get(self._index_label_key):
+                return (pod.metadata.namespace, index_label_value)
+        return None
+
+    def _resync_due(self) -> bool:
+        return self._listed_at is None or time.monotonic() - self._listed_at >= self._resync_seconds
+
+    def _watch_timeout_seconds(self) -> int:
+        return max(_MIN_WATCH_TIMEOUT_SECONDS, int(self._max_staleness_seconds / 2))
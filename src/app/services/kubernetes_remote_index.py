@@ -0,0 +1,135 @@
+import asyncio
+import time
+from logging import Logger
+from typing import Any
+
+from app.utilities.kubernetes_async_client import AsyncCoreV1Api, list_all
+
+
+class RemotePodRecord:
+    """Names of the remote objects created for an offloaded pod"""
+
+    __slots__ = ("pod_name", "pod_jid", "objects")
+
+    pod_name: str | None
+    pod_jid: str | None  # uid of the remote pod
+    objects: dict[str, set[str]]  # object names by kind, e.g. "ConfigMap"
+
+    def __init__(self):
+        self.pod_name = None
+        self.pod_jid = None
+        self.objects = {}
+
+    def add(self, kind: str, name: str) -> None:
+        self.objects.setdefault(kind, set()).add(name)
+
+
+class KubernetesRemoteIndex:
+    """In-memory index of the remote objects created for offloaded pods, by `(namespace, source pod uid)`.
+
+    The index is rebuilt on startup from the labels written by `_scope_metadata` (`label_selector` and
+    `<source_pod_uid_key>`), with a few paginated list calls per kind, then kept up to date by the service on pod
+    creation and deletion, and rebuilt periodically to catch up with changes made by others (e.g., other replicas,
+    external deletions, partially failed creations). Until `is_built`, lookups must fall back to API calls; since
+    the index may miss objects created by others, misses should fall back to API calls as well.
+    """
+
+    _logger: Logger
+    _k_core_client: AsyncCoreV1Api
+    _label_selector: str
+    _source_pod_uid_key: str
+
+    _records: dict[tuple[str, str], RemotePodRecord]
+    _is_built: bool
+    _changed_during_rebuild: set[tuple[str, str]] | None  # records added or discarded while rebuilding
+
+    def __init__(self, logger: Logger, k_core_client: AsyncCoreV1Api, *, label_selector: str, source_pod_uid_key: str):
+        self._logger = logger
+        self._k_core_client = k_core_client
+        self._label_selector = label_selector
+        self._source_pod_uid_key = source_pod_uid_key
+
+        self._records = {}
+        self._is_built = False
+        self._changed_during_rebuild = None
+
+    @property
+    def is_built(self) -> bool:
+        return self._is_built
+
+    def get(self, namespace: str, source_pod_uid: str) -> RemotePodRecord | None:
+        return self._records.get((namespace, source_pod_uid))
+
+    def add(self, namespace: str, source_pod_uid: str, kind: str, name: str, *, jid: str | None = None) -> None:
+        """Record a remote object of the given kind; for pods, `jid` is the remote pod uid"""
+        if self._changed_during_rebuild is not None:
+            self._changed_during_rebuild.add((namespace, source_pod_uid))
+        self._add(self._records, namespace, source_pod_uid, kind, name, jid=jid)
+
+    def discard(self, namespace: str, source_pod_uid: str) -> None:
+        if self._changed_during_rebuild is not None:
+            self._changed_during_rebuild.add((namespace, source_pod_uid))
+        self._records.pop((namespace, source_pod_uid), None)
+
+    @staticmethod
+    def _add(
+        records: dict[tuple[str, str], RemotePodRecord],
+        namespace: str,
+        source_pod_uid: str,
+        kind: str,
+        name: str,
+        *,
+        jid: str | None = None,
+    ) -> None:
+        record = records.setdefault((namespace, source_pod_uid), RemotePodRecord())
+        if kind == "Pod":
+            record.pod_name = name
+            record.pod_jid = jid
+        else:
+            record.add(kind, name)
+
+    async def rebuild(self) -> None:
+        """Rebuild the index from the remote objects; records added or discarded meanwhile are kept as they are,
+        since the listed objects may predate them"""
+        started_at = time.perf_counter()
+        self._changed_during_rebuild = set()
+        kinds_and_lists = [
+            ("Pod", self._k_core_client.list_pod_for_all_namespaces),
+            ("ConfigMap", self._k_core_client.list_config_map_for_all_namespaces),
+            ("Secret", self._k_core_client.list_secret_for_all_namespaces),
+            ("Service", self._k_core_client.list_service_for_all_namespaces),
+            ("PersistentVolumeClaim", self._k_core_client.list_persistent_volume_claim_for_all_namespaces),
+        ]
+        try:
+            object_lists: list[list[Any]] = await asyncio.gather(
+                *[list_all(list_method, label_selector=self._label_selector) for _kind, list_method in kinds_and_lists]
+            )
+
+            records: dict[tuple[str, str], RemotePodRecord] = {}
+            for (kind, _list_method), objects in zip(kinds_and_lists, object_lists):
+                for obj in objects:
+                    if source_pod_uid := (obj.metadata.labels or {}).get(self._source_pod_uid_key):
+                        self._add(
+                            records,
+                            obj.metadata.namespace,
+                            source_pod_uid,
+                            kind,
+                            obj.metadata.name,
+                            jid=obj.metadata.uid,
+                        )
+            for key in self._changed_during_rebuild:
+                if key in self._records:
+                    records[key] = self._records[key]
+                else:
+                    records.pop(key, None)
+            self._records = records
+            self._is_built = True
+        finally:
+            self._changed_during_rebuild = None
+
+        self._logger.info(
+            "Remote index rebuilt in %.3fs: %d pods, %d objects",
+            time.perf_counter() - started_at,
+            len(object_lists[0]),
+            sum(len(objects) for objects in object_lists),
+        )
@@ -1,4 +1,12 @@
+import asyncio
+import functools
 from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from logging import Logger
+from typing import Any, AsyncIterator, Awaitable, Callable, Hashable, Iterable, TypeVar
+
+from app.common import metrics
+
+T = TypeVar("T")
 
 
 @asynccontextmanager
@@ -12,3 +20,138 @@ async def manage_contexts(managers: list[AbstractAsyncContextManager]):
     finally:
         for manager, context in reversed(contexts):
             await manager.__aexit__(None, None, None)
+
+
+async def gather_with_concurrency(limit: int, *aws: Awaitable[T]) -> list[T]:
+    """Like `asyncio.gather`, but run at most `limit` awaitables at a time (no limit if `limit` < 1).
+    Results are returned in the order of `aws`."""
+    if limit < 1:
+        return list(await asyncio.gather(*aws))
+
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(aw: Awaitable[T]) -> T:
+        async with semaphore:
+            return await aw
+
+    return list(await asyncio.gather(*[run(aw) for aw in aws]))
+
+
+async def as_completed_with_concurrency(limit: int, aws: Iterable[Awaitable[T]]) -> AsyncIterator[T]:
+    """Run at most `limit` awaitables at a time (no limit if `limit` < 1), yielding results as they complete.
+    Awaitables are taken from `aws` only when there is room for them, e.g. a generator keeps memory flat.
+    On error or when the iteration is closed early, awaitables still running are cancelled."""
+    aws_iterator = iter(aws)
+    pending: set[asyncio.Future[T]] = set()
+    try:
+        while True:
+            for aw in aws_iterator:
+                pending.add(asyncio.ensure_future(aw))
+                if 0 < limit <= len(pending):
+                    break
+            if not pending:
+                return
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+async def gather_settled(*aws: Awaitable[T]) -> list[T]:
+    """Like `asyncio.gather`, but wait for all awaitables to complete before raising the first exception, if any.
+    Results are returned in the order of `aws`."""
+    results = await asyncio.gather(*aws, return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return results  # type: ignore
+
+
+class PeriodicTask:
+    """Run `fn` every `interval_seconds` in a background task, within an async context.
+    Exceptions raised by `fn` are logged and do not stop the task.
+
+    Usage:
+        async with PeriodicTask(logger, reconcile, name="reconciler", interval_seconds=600):
+            ...
+    """
+
+    _logger: Logger
+    _fn: Callable[[], Awaitable[Any]]
+    _name: str
+    _interval_seconds: float
+    _task: asyncio.Task | None
+
+    def __init__(self, logger: Logger, fn: Callable[[], Awaitable[Any]], *, name: str, interval_seconds: float):
+        self._logger = logger
+        self._fn = fn
+        self._name = name
+        self._interval_seconds = interval_seconds
+        self._task = None
+
+    async def __aenter__(self):
+        self._task = asyncio.create_task(self._run(), name=self._name)
+        return self
+
+    async def __aexit__(self, *_exc_info):
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval_seconds)
+            try:
+                await self._fn()
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                self._logger.error("%s: %s", self._name, exc)
+
+
+class _Flight:
+    __slots__ = ("future", "saved_calls")
+
+    def __init__(self, future: asyncio.Future):
+        self.future = future
+        self.saved_calls = 0
+
+
+class SingleFlight:
+    """Merge concurrent calls with the same `(operation, key)`: while a call is in flight, later callers await
+    its outcome (result or exception) instead of calling again, and share the same result object.
+    A caller being cancelled does not cancel the shared call. Saved calls are counted by the metric
+    `<name>_<operation>_saved`, and logged by key at debug level.
+
+    Usage:
+        pod = await single_flight.run("read_pod", (namespace, name), lambda: read_pod(namespace, name))
+    """
+
+    _logger: Logger
+    _name: str
+    _flights: dict[tuple[str, Hashable], _Flight]
+
+    def __init__(self, logger: Logger, *, name: str):
+        self._logger = logger
+        self._name = name
+        self._flights = {}
+
+    async def run(self, operation: str, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        flight_key = (operation, key)
+        flight = self._flights.get(flight_key)
+        if flight is None:
+            flight = self._flights[flight_key] = _Flight(asyncio.ensure_future(fn()))
+            flight.future.add_done_callback(functools.partial(self._land, flight_key, flight))
+        else:
+            flight.saved_calls += 1
+            metrics.increment(f"{self._name}_{operation}_saved")
+        return await asyncio.shield(flight.future)
+
+    def _land(self, flight_key: tuple[str, Hashable], flight: _Flight, future: asyncio.Future) -> None:
+        if self._flights.get(flight_key) is flight:
+            del self._flights[flight_key]
+        if not future.cancelled():
+            future.exception()  # retrieved, even if all callers were cancelled
+        if flight.saved_calls:
+            self._logger.debug("%s: %d calls saved for %s", self._name, flight.saved_calls, flight_key)
@@ -0,0 +1,89 @@
+""" Collection of cache utilities """
+
+import time
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """In-memory cache whose entries expire `ttl_seconds` after being set.
+    When `maxsize` entries are exceeded, or `maxbytes` if set (as estimated by `sizeof(value)`, in bytes),
+    the least recently used entries are evicted. Lookups are counted in `hits` and `misses`."""
+
+    _ttl_seconds: float
+    _maxsize: int
+    _maxbytes: int | None
+    _sizeof: Callable[[V], int] | None
+    _entries: OrderedDict[K, tuple[float, V, int]]  # key -> (expiration monotonic time, value, size in bytes)
+    _nbytes: int
+    hits: int
+    misses: int
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        maxsize: int = 1024,
+        *,
+        maxbytes: int | None = None,
+        sizeof: Callable[[V], int] | None = None,
+    ):
+        assert maxbytes is None or sizeof is not None, "sizeof is required to bound the cache size in bytes"
+        self._ttl_seconds = ttl_seconds
+        self._maxsize = maxsize
+        self._maxbytes = maxbytes
+        self._sizeof = sizeof
+        self._entries = OrderedDict()
+        self._nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def nbytes(self) -> int:
+        """Estimated size of the cached values in bytes, if `sizeof` is set"""
+        return self._nbytes
+
+    def __contains__(self, key: K) -> bool:
+        """Whether the key is cached and not expired, without counting a lookup nor refreshing its recency"""
+        entry = self._entries.get(key)
+        return entry is not None and entry[0] > time.monotonic()
+
+    def get(self, key: K) -> V | None:
+        """Get the cached value, or `None` if missing or expired"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, value, _size = entry
+        if expires_at <= time.monotonic():
+            self.pop(key)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        if self._ttl_seconds <= 0:
+            return
+        self.pop(key)
+        size = self._sizeof(value) if self._sizeof else 0
+        self._entries[key] = (time.monotonic() + self._ttl_seconds, value, size)
+        self._nbytes += size
+        while len(self._entries) > self._maxsize or (self._maxbytes is not None and self._nbytes > self._maxbytes):
+            _key, (_expires_at, _value, evicted_size) = self._entries.popitem(last=False)
+            self._nbytes -= evicted_size
+
+    def pop(self, key: K) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._nbytes -= entry[2]
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._nbytes = 0
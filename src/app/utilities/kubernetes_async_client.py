@@ -0,0 +1,78 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Coroutine
+
+from kubernetes.client.api import CoreV1Api
+from kubernetes.client.api_client import ApiClient
+
+
+class AsyncCoreV1Api:
+    """Awaitable facade of `CoreV1Api`: every API method is exposed as a coroutine function with the same signature.
+
+    If an executor is provided, calls run on its worker threads, so that awaiting them never blocks the event loop.
+    The underlying `ApiClient` keeps a pool of keep-alive connections to the API server, whose size should match
+    the executor's `max_workers` (see `Configuration.connection_pool_maxsize`).
+    Without an executor, calls run synchronously in the event loop thread (i.e., the plain sync client behaviour).
+
+    Usage:
+        pod = await async_core_api.read_namespaced_pod(name, namespace)
+    """
+
+    _k_core_client: CoreV1Api
+    _executor: ThreadPoolExecutor | None
+
+    def __init__(self, k_core_client: CoreV1Api, executor: ThreadPoolExecutor | None = None):
+        self._k_core_client = k_core_client
+        self._executor = executor
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_exc_info):
+        self.close()
+
+    @property
+    def api_client(self) -> ApiClient:
+        return self._k_core_client.api_client  # type: ignore
+
+    @property
+    def sync_client(self) -> CoreV1Api:
+        """The wrapped sync client, e.g. to run watches in a dedicated thread"""
+        return self._k_core_client
+
+    def close(self) -> None:
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def __getattr__(self, name: str) -> Callable[..., Coroutine[Any, Any, Any]]:
+        method = getattr(self._k_core_client, name)
+        if not callable(method):
+            raise AttributeError(name)
+
+        @functools.wraps(method)
+        async def call(*args, **kwargs):
+            if self._executor is None:
+                return method(*args, **kwargs)
+            return await asyncio.get_running_loop().run_in_executor(
+                self._executor, functools.partial(method, *args, **kwargs)
+            )
+
+        self.__dict__[name] = call  # cache the wrapper, `__getattr__` is only called for missing attributes
+        return call
+
+
+async def list_all(list_method: Callable[..., Awaitable[Any]], *args, limit: int = 500, **kwargs) -> list[Any]:
+    """Call a `list_*` API method page by page, i.e. with at most `limit` items per call, and return all items.
+
+    Usage:
+        pods = await list_all(async_core_api.list_pod_for_all_namespaces, label_selector="app=test")
+    """
+    items: list[Any] = []
+    _continue: str | None = None
+    while True:
+        page = await list_method(*args, limit=limit, _continue=_continue, **kwargs)
+        items.extend(page.items)
+        _continue = page.metadata._continue if page.metadata else None  # pylint: disable=protected-access
+        if not _continue:
+            return items
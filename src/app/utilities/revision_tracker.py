@@ -0,0 +1,47 @@
+""" Track changes of keyed values by revision """
+
+import uuid
+from typing import Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+
+
+class RevisionTracker(Generic[K]):
+    """Assign a revision to keyed values: the global revision is bumped, and assigned to the key, whenever
+    the fingerprint of its value changes.
+
+    Cursors issued by `cursor()` are opaque tokens, valid only for this tracker (i.e., this process): a cursor
+    issued by another instance, e.g. before a restart, is not recognized by `parse_cursor`.
+    """
+
+    _epoch: str
+    _revision: int
+    _entries: dict[K, tuple[int, int]]  # key -> (fingerprint, revision)
+
+    def __init__(self):
+        self._epoch = uuid.uuid4().hex[:12]
+        self._revision = 0
+        self._entries = {}
+
+    def update(self, key: K, fingerprint: int) -> int:
+        """Record the fingerprint of the key's value, return the key's revision"""
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == fingerprint:
+            return entry[1]
+        self._revision += 1
+        self._entries[key] = (fingerprint, self._revision)
+        return self._revision
+
+    def forget(self, key: K) -> None:
+        self._entries.pop(key, None)
+
+    def cursor(self) -> str:
+        """Issue a cursor for the current revision"""
+        return f"{self._epoch}-{self._revision}"
+
+    def parse_cursor(self, cursor: str | None) -> int | None:
+        """Return the revision of the cursor, or `None` if missing or not issued by this tracker"""
+        epoch, _sep, revision = (cursor or "").partition("-")
+        if epoch != self._epoch or not revision.isdigit():
+            return None
+        return int(revision)
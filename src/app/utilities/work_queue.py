@@ -0,0 +1,93 @@
+import asyncio
+from logging import Logger
+from typing import Any, Awaitable, Callable, Hashable
+
+import backoff
+
+from app.common import metrics
+
+Job = Callable[[], Awaitable[Any]]
+
+
+class KeyedWorkQueue:
+    """In-process queue of keyed jobs, drained by `workers` background tasks within an async context.
+
+    A job enqueued while another job with the same key is pending or running is coalesced, i.e. dropped.
+    A failed job is retried with exponential backoff, up to `max_tries` attempts, then dropped.
+    On exit, pending jobs are given up to `drain_timeout_seconds` to complete.
+
+    Metrics (prefixed by `name`): `<name>_depth` gauge, `<name>_coalesced` and `<name>_failed` counters.
+
+    Usage:
+        async with KeyedWorkQueue(logger, name="delete_queue", workers=8, max_tries=5) as queue:
+            queue.put(key, lambda: delete(key))
+    """
+
+    _logger: Logger
+    _name: str
+    _workers: int
+    _max_tries: int
+    _drain_timeout_seconds: float
+
+    _jobs: dict[Hashable, Job]  # pending or running jobs by key
+    _queue: asyncio.Queue[Hashable]
+    _tasks: list[asyncio.Task]
+
+    def __init__(self, logger: Logger, *, name: str, workers: int, max_tries: int, drain_timeout_seconds: float = 30):
+        self._logger = logger
+        self._name = name
+        self._workers = max(1, workers)
+        self._max_tries = max(1, max_tries)
+        self._drain_timeout_seconds = drain_timeout_seconds
+
+        self._jobs = {}
+        self._queue = asyncio.Queue()
+        self._tasks = []
+        metrics.register_gauge(f"{name}_depth", self.__len__)
+
+    def __len__(self) -> int:
+        """Number of pending or running jobs"""
+        return len(self._jobs)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._jobs
+
+    async def __aenter__(self):
+        self._tasks = [asyncio.create_task(self._work(), name=f"{self._name}-worker-{n}") for n in range(self._workers)]
+        return self
+
+    async def __aexit__(self, *_exc_info):
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=self._drain_timeout_seconds)
+        except asyncio.TimeoutError:
+            self._logger.warning("%s: %d jobs not completed on exit", self._name, len(self._jobs))
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def put(self, key: Hashable, job: Job) -> bool:
+        """Enqueue the job, return `False` if coalesced with a pending or running one"""
+        if key in self._jobs:
+            metrics.increment(f"{self._name}_coalesced")
+            return False
+        self._jobs[key] = job
+        self._queue.put_nowait(key)
+        return True
+
+    async def _work(self) -> None:
+        while True:
+            key = await self._queue.get()
+            job = self._jobs[key]
+
+            async def run_job() -> Any:
+                return await job()  # pylint: disable=cell-var-from-loop
+
+            try:
+                await backoff.on_exception(backoff.expo, Exception, max_tries=self._max_tries, max_value=60)(run_job)()
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                metrics.increment(f"{self._name}_failed")
+                self._logger.error("%s: job '%s' failed after %d attempts: %s", self._name, key, self._max_tries, exc)
+            finally:
+                del self._jobs[key]
+                self._queue.task_done()
@@ -0,0 +1,106 @@
+"""
+Benchmark the compiled mappers of `app.entities.mappers` against the generic conversions provided by `ApiClient`:
+- Interlink -> Kubernetes: `ApiClient.__deserialize_model` vs compiled deserializers;
+- Kubernetes -> Interlink: `sanitize_for_serialization(model.to_dict())` vs compiled serializers.
+
+Usage (from the repository root):
+    PYTHONPATH=src python test/benchmarks/benchmark_mappers.py [iterations]
+"""
+
+import sys
+import timeit
+from datetime import datetime, timezone
+
+import interlink as i
+from kubernetes import client as k
+
+from app.entities import mappers
+
+_METADATA = {
+    "name": "test-pod",
+    "namespace": "default",
+    "uid": "0c4d7b3e-1b6a-4a0e-9d8f-5f1e2d3c4b5a",
+    "labels": {"app": "test", "tier": "backend"},
+    "annotations": {"interlink.io/remote-pvc": "test-pvc", "description": "benchmark"},
+}
+
+_I_POD = i.PodRequest(
+    **{
+        "metadata": _METADATA,
+        "spec": {
+            "containers": [
+                {
+                    "name": f"container-{n}",
+                    "image": "busybox",
+                    "command": ["sh", "-c", "sleep infinity"],
+                    "env": [{"name": f"ENV_{e}", "value": str(e)} for e in range(10)],
+                    "resources": {"limits": {"cpu": "10m", "memory": "32Mi"}},
+                    "volumeMounts": [{"name": "data", "mountPath": "/data"}],
+                }
+                for n in range(4)
+            ],
+            "volumes": [{"name": "data", "emptyDir": {}}],
+            "nodeName": "virtual-kubelet",
+        },
+    }
+)
+
+_I_CONFIG_MAP = i.ConfigMap(**{"metadata": _METADATA, "data": {f"key-{n}": "value" * 10 for n in range(20)}})
+
+_I_SECRET = i.Secret(**{"metadata": _METADATA, "data": {f"key-{n}": "dmFsdWU=" * 10 for n in range(20)}})
+
+_K_CONTAINER_STATUS = k.V1ContainerStatus(
+    name="container-0",
+    image="busybox:latest",
+    image_id="docker.io/library/busybox@sha256:0123456789abcdef",
+    container_id="containerd://0123456789abcdef",
+    ready=True,
+    started=True,
+    restart_count=0,
+    state=k.V1ContainerState(running=k.V1ContainerStateRunning(started_at=datetime.now(timezone.utc))),
+    last_state=k.V1ContainerState(),
+)
+
+
+def _generic_i_to_k(api_client: k.ApiClient, model, k_ref_type):
+    data = model.model_dump(exclude_none=True, by_alias=True)
+    return api_client._ApiClient__deserialize_model(data, k_ref_type)  # pylint: disable=protected-access
+
+
+def _generic_k_to_i(api_client: k.ApiClient, model, i_ref_type):
+    return i_ref_type(**api_client.sanitize_for_serialization(model.to_dict()))
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    api_client = k.ApiClient()
+
+    cases = [
+        ("ObjectMeta", _I_POD.metadata, k.V1ObjectMeta, True),
+        ("PodSpec", _I_POD.spec, k.V1PodSpec, True),
+        ("ConfigMap", _I_CONFIG_MAP, k.V1ConfigMap, True),
+        ("Secret", _I_SECRET, k.V1Secret, True),
+        ("ContainerStatus", _K_CONTAINER_STATUS, i.ContainerStatus, False),
+    ]
+
+    print(f"{iterations} iterations")
+    for label, model, ref_type, to_k in cases:
+        if to_k:
+            generic = lambda: _generic_i_to_k(api_client, model, ref_type)  # noqa: E731
+            compiled = lambda: mappers.map_i_model_to_k_model(api_client, model, ref_type)  # noqa: E731
+            assert generic() == compiled(), f"{label}: mappers are not equivalent"
+        else:
+            generic = lambda: _generic_k_to_i(api_client, model, ref_type)  # noqa: E731
+            compiled = lambda: mappers.map_k_model_to_i_model(api_client, model, ref_type)  # noqa: E731
+            assert generic().model_dump() == compiled().model_dump(), f"{label}: mappers are not equivalent"
+
+        generic_elapsed = min(timeit.repeat(generic, number=iterations, repeat=3)) / iterations
+        compiled_elapsed = min(timeit.repeat(compiled, number=iterations, repeat=3)) / iterations
+        print(
+            f"{label:>16}: generic {generic_elapsed * 1e6:8.1f} us, compiled {compiled_elapsed * 1e6:8.1f} us"
+            f" ({generic_elapsed / compiled_elapsed:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""
+Benchmark the memory footprint of the remote pods kept by the pod informer (`offloading.pod_informer_enabled`):
+- "V1Pod": the deserialized `V1Pod` objects, as returned by list and watch calls;
+- "RemotePodState": the compact records kept in the informer index instead.
+Memory is measured with `tracemalloc`, i.e. every Python object reachable from the kept pods only.
+
+Usage (from the repository root):
+    PYTHONPATH=src python test/benchmarks/benchmark_remote_pod_state.py [pods] [containers]
+"""
+
+import gc
+import json
+import sys
+import tracemalloc
+from typing import Any, Callable
+
+import interlink as i
+from kubernetes import client as k
+
+from app.entities import mappers
+from app.entities.remote_pod_state import STARTED_AT_FORMAT, RemotePodState
+
+_SOURCE_POD_UID_KEY = "interlink.io/source.pod_uid"
+
+
+class _RawResponse:
+    def __init__(self, data: str):
+        self.data = data
+
+
+def _raw_pod(n: int, containers: int) -> str:
+    """A remote pod as sent by the API server, including the fields set by the kubelet and the control plane"""
+    source_pod_uid = f"0c4d7b3e-1b6a-4a0e-9d8f-{n:012d}"
+    return json.dumps(
+        {
+            "apiVersion": "v1",
+            "kind": "Pod",
+            "metadata": {
+                "name": f"test-pod-{n}-{source_pod_uid}",
+                "namespace": "offloading-default",
+                "uid": f"5f1e2d3c-4b5a-4a0e-9d8f-{n:012d}",
+                "resourceVersion": str(1000 + n),
+                "creationTimestamp": "2024-09-20T09:26:30Z",
+                "labels": {"interlink.io/managed-by": "interlink", _SOURCE_POD_UID_KEY: source_pod_uid},
+                "managedFields": [
+                    {
+                        "manager": manager,
+                        "operation": "Update",
+                        "apiVersion": "v1",
+                        "time": "2024-09-20T09:26:33Z",
+                        "fieldsType": "FieldsV1",
+                        "fieldsV1": {"f:status": {"f:conditions": {}, "f:containerStatuses": {}, "f:phase": {}}},
+                    }
+                    for manager in ["interlink-kubernetes-plugin", "kubelet"]
+                ],
+            },
+            "spec": {
+                "containers": [
+                    {
+                        "name": f"c{c}",
+                        "image": "busybox",
+                        "command": ["sh", "-c", "sleep infinity"],
+                        "env": [{"name": f"ENV_{e}", "value": str(e)} for e in range(5)],
+                        "resources": {"limits": {"cpu": "100m", "memory": "64Mi"}},
+                        "volumeMounts": [{"name": "data", "mountPath": "/data"}],
+                        "terminationMessagePath": "/dev/termination-log",
+                        "terminationMessagePolicy": "File",
+                        "imagePullPolicy": "Always",
+                    }
+                    for c in range(containers)
+                ],
+                "volumes": [{"name": "data", "emptyDir": {}}],
+                "restartPolicy": "Always",
+                "dnsPolicy": "ClusterFirst",
+                "serviceAccountName": "default",
+                "nodeName": "worker-1",
+                "schedulerName": "default-scheduler",
+                "tolerations": [
+                    {"key": key, "operator": "Exists", "effect": "NoExecute", "tolerationSeconds": 300}
+                    for key in ["node.kubernetes.io/not-ready", "node.kubernetes.io/unreachable"]
+                ],
+            },
+            "status": {
+                "phase": "Running",
+                "conditions": [
+                    {"type": condition, "status": "True", "lastTransitionTime": "2024-09-20T09:26:33Z"}
+                    for condition in ["Initialized", "Ready", "ContainersReady", "PodScheduled"]
+                ],
+                "hostIP": "10.0.0.1",
+                "podIP": "10.244.1.23",
+                "podIPs": [{"ip": "10.244.1.23"}],
+                "startTime": "2024-09-20T09:26:31Z",
+                "qosClass": "Guaranteed",
+                "containerStatuses": [
+                    {
+                        "name": f"c{c}",
+                        "image": "docker.io/library/busybox:latest",
+                        "imageID": "docker.io/library/busybox@sha256:0123456789abcdef",
+                        "containerID": f"containerd://{c:064d}",
+                        "ready": True,
+                        "started": True,
+                        "restartCount": 0,
+                        "state": {"running": {"startedAt": "2024-09-20T09:26:33Z"}},
+                        "lastState": {},
+                    }
+                    for c in range(containers)
+                ],
+            },
+        }
+    )
+
+
+def _container_statuses_from_pod(api_client: k.ApiClient, pod: k.V1Pod) -> list[i.ContainerStatus]:
+    """Same mapping as the service, for pods read from the API server"""
+    i_container_statuses = []
+    for cs in pod.status.container_statuses or []:
+        i_cs = mappers.map_k_model_to_i_model(api_client, cs, i.ContainerStatus)
+        if cs.state and cs.state.running and cs.state.running.started_at:
+            i_cs.state.running.started_at = cs.state.running.started_at.strftime(STARTED_AT_FORMAT)
+        i_container_statuses.append(i_cs)
+    return i_container_statuses
+
+
+def _measure(build: Callable[[], list[Any]]) -> tuple[list[Any], int]:
+    """Build the objects, return them along with the memory they keep allocated, in bytes"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        objects = build()
+        gc.collect()
+        allocated, _peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return objects, allocated
+
+
+def main():
+    pods = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    containers = int(sys.argv[2]) if len(sys.argv) > 2 else 2
+    api_client = k.ApiClient()
+    raw_pods = [_raw_pod(n, containers) for n in range(pods)]
+
+    def deserialize(raw_pod: str) -> k.V1Pod:
+        return api_client.deserialize(_RawResponse(raw_pod), "V1Pod")
+
+    def to_pod_state(pod: k.V1Pod) -> RemotePodState:
+        return RemotePodState(pod, source_pod_uid=pod.metadata.labels[_SOURCE_POD_UID_KEY])
+
+    k_pods, k_pods_bytes = _measure(lambda: [deserialize(raw_pod) for raw_pod in raw_pods])
+    # Deserialized pods are dropped as soon as converted, as in the informer
+    pod_states, pod_states_bytes = _measure(lambda: [to_pod_state(deserialize(raw_pod)) for raw_pod in raw_pods])
+
+    for pod, pod_state in zip(k_pods, pod_states):
+        assert [cs.model_dump() for cs in _container_statuses_from_pod(api_client, pod)] == [
+            cs.to_i_container_status().model_dump() for cs in pod_state.containers
+        ], "container statuses are not equivalent"
+
+    print(f"{pods} pods, {containers} containers per pod")
+    for label, allocated in [("V1Pod", k_pods_bytes), ("RemotePodState", pod_states_bytes)]:
+        print(f"{label:>15}: {allocated / pods:10.0f} bytes/pod, {allocated / 2**20:8.1f} MiB")
+    print(f"{'':>15}  {k_pods_bytes / pod_states_bytes:.1f}x less memory")
+
+
+if __name__ == "__main__":
+    main()
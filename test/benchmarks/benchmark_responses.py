@@ -0,0 +1,66 @@
+"""
+Benchmark the rendering of `/status` responses:
+- "FastAPI": the default path for endpoints returning models (validation against the response model,
+  `jsonable_encoder`-like conversion to Python objects, `JSONResponse` rendering with `json.dumps`);
+- "pydantic": `PydanticJSONResponse`, dumping the models straight to JSON bytes.
+
+Usage (from the repository root):
+    PYTHONPATH=src python test/benchmarks/benchmark_responses.py [pods] [iterations]
+"""
+
+import asyncio
+import json
+import sys
+import timeit
+
+import interlink as i
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from app.controllers.common.responses import PydanticJSONResponse
+
+
+def _pod_statuses(pods: int) -> list[i.PodStatus]:
+    return [
+        i.PodStatus(
+            name=f"test-pod-{n}",
+            uid=f"0c4d7b3e-1b6a-4a0e-9d8f-{n:012d}",
+            namespace="default",
+            JID=f"5f1e2d3c-4b5a-4a0e-9d8f-{n:012d}",
+            containers=[
+                i.ContainerStatus(
+                    name=f"container-{c}",
+                    state=i.ContainerStates(running=i.StateRunning(startedAt="2024-09-20T09:26:33Z")),
+                )
+                for c in range(2)
+            ],
+        )
+        for n in range(pods)
+    ]
+
+
+def main():
+    pods = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    pod_statuses = _pod_statuses(pods)
+    loop = asyncio.new_event_loop()
+    response_field = create_model_field(name="Response_get_status", type_=list[i.PodStatus], mode="serialization")
+
+    def render_fastapi() -> bytes:
+        content = loop.run_until_complete(serialize_response(field=response_field, response_content=pod_statuses))
+        return JSONResponse(content).body
+
+    def render_pydantic() -> bytes:
+        return PydanticJSONResponse(pod_statuses, list[i.PodStatus]).body
+
+    assert json.loads(render_fastapi()) == json.loads(render_pydantic()), "responses are not equivalent"
+
+    print(f"{pods} pods per response, {iterations} iterations")
+    for label, render in [("FastAPI", render_fastapi), ("pydantic", render_pydantic)]:
+        elapsed = min(timeit.repeat(render, number=iterations, repeat=3)) / iterations
+        print(f"{label:>10}: {elapsed * 1e3:8.2f} ms/response")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Benchmark the mapping of a remote pod status to Interlink `ContainerStatus` models:
+- "models": deserialize `V1Pod`, then map each `V1ContainerStatus` (default status path);
+- "raw JSON": parse the raw JSON and map only the container statuses (`offloading.status_raw_json`).
+
+Usage (from the repository root):
+    PYTHONPATH=src python test/benchmarks/benchmark_status_mapping.py [containers] [iterations]
+"""
+
+import json
+import sys
+import timeit
+from datetime import datetime
+
+import interlink as i
+from kubernetes import client as k
+
+from app.entities import mappers
+
+_STARTED_AT_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+
+class _RawResponse:
+    def __init__(self, data: str):
+        self.data = data
+
+
+def _raw_pod(containers: int) -> str:
+    return json.dumps(
+        {
+            "apiVersion": "v1",
+            "kind": "Pod",
+            "metadata": {"name": "test-pod", "namespace": "offloading-default", "uid": "remote-uid"},
+            "spec": {"containers": [{"name": f"c{n}", "image": "busybox"} for n in range(containers)]},
+            "status": {
+                "phase": "Running",
+                "containerStatuses": [
+                    {
+                        "name": f"c{n}",
+                        "image": "busybox:latest",
+                        "imageID": "docker.io/library/busybox@sha256:0123456789abcdef",
+                        "containerID": f"containerd://{n:064d}",
+                        "ready": True,
+                        "started": True,
+                        "restartCount": 0,
+                        "state": {"running": {"startedAt": "2024-09-20T09:26:33Z"}},
+                        "lastState": {},
+                    }
+                    for n in range(containers)
+                ],
+            },
+        }
+    )
+
+
+def map_models(api_client: k.ApiClient, raw_pod: str) -> list[i.ContainerStatus]:
+    remote_pod: k.V1Pod = api_client.deserialize(_RawResponse(raw_pod), "V1Pod")
+    i_container_statuses = []
+    for cs in remote_pod.status.container_statuses or []:
+        i_cs = mappers.map_k_model_to_i_model(api_client, cs, i.ContainerStatus)
+        if cs.state and cs.state.running and cs.state.running.started_at:
+            i_cs.state.running.started_at = cs.state.running.started_at.strftime(_STARTED_AT_FORMAT)
+        i_container_statuses.append(i_cs)
+    return i_container_statuses
+
+
+def map_raw_json(raw_pod: str) -> list[i.ContainerStatus]:
+    i_container_statuses = []
+    for raw_cs in (json.loads(raw_pod).get("status") or {}).get("containerStatuses") or []:
+        running = (raw_cs.get("state") or {}).get("running")
+        if running and running.get("startedAt"):
+            running["startedAt"] = datetime.fromisoformat(running["startedAt"]).strftime(_STARTED_AT_FORMAT)
+        i_container_statuses.append(mappers.map_k_dict_to_i_model(raw_cs, i.ContainerStatus))
+    return i_container_statuses
+
+
+def main():
+    containers = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    api_client = k.ApiClient()
+    raw_pod = _raw_pod(containers)
+
+    assert [cs.model_dump() for cs in map_models(api_client, raw_pod)] == [
+        cs.model_dump() for cs in map_raw_json(raw_pod)
+    ], "paths are not equivalent"
+
+    print(f"{containers} containers per pod, {iterations} iterations")
+    for label, run in [
+        ("models", lambda: map_models(api_client, raw_pod)),
+        ("raw JSON", lambda: map_raw_json(raw_pod)),
+    ]:
+        elapsed = min(timeit.repeat(run, number=iterations, repeat=3))
+        print(f"{label:>10}: {elapsed / iterations * 1e6:8.1f} us/pod")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+# pylint: disable=redefined-outer-name
+import logging
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from fastapi_router_controller import Controller
+from kubernetes import client as k
+
+from app import controllers
+from app.common.config import Config
+from app.dependencies import get_kubernetes_plugin_service
+from app.services.kubernetes_plugin_service import KubernetesPluginService
+from app.utilities.kubernetes_async_client import AsyncCoreV1Api
+
+
+@pytest.fixture()
+def k_core_client() -> MagicMock:
+    """Mock of the synchronous `CoreV1Api`, serializing with a real `ApiClient`.
+    Test modules override this fixture to set up the remote cluster."""
+    k_core_client = MagicMock()
+    k_core_client.api_client = k.ApiClient()
+    return k_core_client
+
+
+@pytest.fixture()
+def helm_client() -> MagicMock:
+    return MagicMock()
+
+
+@pytest.fixture()
+def service(k_core_client: MagicMock, helm_client: MagicMock) -> KubernetesPluginService:
+    return KubernetesPluginService(Config(), logging.getLogger(__name__), AsyncCoreV1Api(k_core_client), helm_client)
+
+
+@pytest.fixture(scope="session")
+def app() -> FastAPI:
+    """App publishing all api versions; controllers are loaded once per session"""
+    controllers.load(iter(["v1", "v2"]))
+    app = FastAPI()
+    for router in Controller.routers():
+        app.include_router(router)
+    return app
+
+
+@pytest.fixture()
+def client(app: FastAPI, service: KubernetesPluginService) -> TestClient:
+    app.dependency_overrides[get_kubernetes_plugin_service] = lambda: service
+    return TestClient(app)
@@ -0,0 +1,191 @@
+# pylint: disable=redefined-outer-name,protected-access
+"""
+Check that the request bodies built in dict representation (`offloading.create_raw_json`) are equivalent
+to the ones built from Kubernetes models, once serialized.
+"""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import interlink as i
+import pytest
+from kubernetes import client as k
+
+from app.services.kubernetes_plugin_service import KubernetesPluginService
+
+_POD_UID = "0c4d7b3e-1b6a-4a0e-9d8f-5f1e2d3c4b5a"
+
+_PRE_EXEC = """
+cat <<'EOFMESH' > $TMPDIR/mesh.sh
+#!/bin/bash
+echo "mesh setup"
+EOFMESH
+"""
+
+_I_POD = i.PodRequest(
+    **{
+        "metadata": {
+            "name": "test-pod",
+            "namespace": "default",
+            "uid": _POD_UID,
+            "labels": {"app": "test"},
+            "annotations": {
+                "interlink.io/remote-pvc": "test-pvc",
+                "slurm-job.vk.io/pre-exec": _PRE_EXEC,
+            },
+        },
+        "spec": {
+            "containers": [
+                {
+                    "name": "test-container",
+                    "image": "busybox",
+                    "command": ["sh", "-c", "sleep infinity"],
+                    "env": [
+                        {"name": "PLAIN", "value": "value"},
+                        {
+                            "name": "FROM_CM",
+                            "valueFrom": {"configMapKeyRef": {"name": "test-cm", "key": "key"}},
+                        },
+                        {
+                            "name": "FROM_SECRET",
+                            "valueFrom": {"secretKeyRef": {"name": "test-secret", "key": "key"}},
+                        },
+                    ],
+                    "envFrom": [{"configMapRef": {"name": "test-cm"}}, {"secretRef": {"name": "test-secret"}}],
+                    "volumeMounts": [
+                        {"name": "kube-api-access", "mountPath": "/var/run/secrets/kubernetes.io/serviceaccount"},
+                        {"name": "cm-volume", "mountPath": "/etc/cm"},
+                        {"name": "secret-volume", "mountPath": "/etc/secret"},
+                        {"name": "scratch", "mountPath": "/scratch"},
+                        {"name": "pvc-volume", "mountPath": "/data"},
+                        {"name": "other-pvc-volume", "mountPath": "/other"},
+                    ],
+                }
+            ],
+            "initContainers": [
+                {
+                    "name": "test-init-container",
+                    "image": "busybox",
+                    "volumeMounts": [{"name": "kube-api-access", "mountPath": "/token"}],
+                }
+            ],
+            "volumes": [
+                {"name": "kube-api-access", "projected": {"sources": []}},
+                {"name": "cm-volume", "configMap": {"name": "test-cm"}},
+                {"name": "secret-volume", "secret": {"secretName": "test-secret"}},
+                {"name": "scratch", "emptyDir": {}},
+                {"name": "pvc-volume", "persistentVolumeClaim": {"claimName": "test-pvc"}},
+                {"name": "other-pvc-volume", "persistentVolumeClaim": {"claimName": "other-pvc"}},
+            ],
+            "nodeName": "virtual-kubelet",
+        },
+    }
+)
+
+_SOURCE_METADATA = {"namespace": "default", "uid": _POD_UID}
+
+_I_CONFIG_MAP = i.ConfigMap(
+    **{"metadata": {"name": "test-cm", **_SOURCE_METADATA}, "data": {"key": "value"}, "immutable": True}
+)
+
+_I_SECRET = i.Secret(
+    **{"metadata": {"name": "test-secret", **_SOURCE_METADATA}, "data": {"key": "dmFsdWU="}, "type": "Opaque"}
+)
+
+_I_PVC = i.PersistentVolumeClaim(
+    **{
+        "metadata": {
+            "name": "test-pvc",
+            "annotations": {"interlink.io/pvc-retention-policy": "delete"},
+            **_SOURCE_METADATA,
+        },
+        "spec": {"accessModes": ["ReadWriteOnce"], "resources": {"requests": {"storage": "1Gi"}}},
+    }
+)
+
+
+@pytest.fixture()
+def k_core_client(k_core_client: MagicMock) -> MagicMock:
+    k_core_client.read_namespaced_persistent_volume_claim.side_effect = k.ApiException(status=404)
+    return k_core_client
+
+
+def _create_bodies(service: KubernetesPluginService, k_core_client: MagicMock, *, create_raw_json: bool) -> list:
+    """Create the volumes and build the pod body, return the serialized request bodies"""
+    service._offloading_params["create_raw_json"] = create_raw_json
+    service._pvc_cache.clear()
+    k_core_client.reset_mock()
+
+    async def create_volumes():
+        await service._create_config_map(_I_CONFIG_MAP, pod_uid=_POD_UID, created=[])
+        await service._create_secret(_I_SECRET, pod_uid=_POD_UID, created=[])
+        await service._create_pvc(_I_PVC, pod_uid=_POD_UID, pod_metadata=_I_POD.metadata, created=[])
+
+    asyncio.run(create_volumes())
+    bodies = [
+        k_core_client.create_namespaced_config_map.call_args.kwargs["body"],
+        k_core_client.create_namespaced_secret.call_args.kwargs["body"],
+        k_core_client.create_namespaced_persistent_volume_claim.call_args.kwargs["body"],
+        (
+            service._build_pod_dict(_I_POD.model_copy(deep=True))
+            if create_raw_json
+            else service._build_pod_model(_I_POD.model_copy(deep=True))
+        ),
+    ]
+    return [k_core_client.api_client.sanitize_for_serialization(body) for body in bodies]
+
+
+def test_create_bodies_parity(service: KubernetesPluginService, k_core_client: MagicMock):
+    from_models = _create_bodies(service, k_core_client, create_raw_json=False)
+    from_dicts = _create_bodies(service, k_core_client, create_raw_json=True)
+
+    for from_model, from_dict in zip(from_models, from_dicts):
+        assert from_dict == from_model
+
+
+def test_create_pod_body(service: KubernetesPluginService, k_core_client: MagicMock):
+    config_map, secret, pvc, pod = _create_bodies(service, k_core_client, create_raw_json=True)
+
+    assert config_map["metadata"]["name"] == f"test-cm-{_POD_UID}"
+    assert secret["metadata"]["name"] == f"test-secret-{_POD_UID}"
+    assert pvc["metadata"]["name"] == "test-pvc"
+    assert pod["metadata"]["name"] == f"test-pod-{_POD_UID}"
+    assert pod["metadata"]["labels"]["interlink.io/source.pod_uid"] == _POD_UID
+    assert [volume["name"] for volume in pod["spec"]["volumes"]] == [
+        "cm-volume",
+        "secret-volume",
+        "scratch",
+        "pvc-volume",
+        "interlink-scratch",
+    ]
+    assert [vm["name"] for vm in pod["spec"]["containers"][0]["volumeMounts"]] == [
+        "cm-volume",
+        "secret-volume",
+        "scratch",
+        "pvc-volume",
+    ]
+    assert "volumeMounts" not in pod["spec"]["initContainers"][0]
+    assert pod["spec"]["initContainers"][-1]["name"] == "mesh-setup"
+
+
+def test_create_bodies_drop_keys_outside_k8s_schema(
+    service: KubernetesPluginService, k_core_client: MagicMock, monkeypatch: pytest.MonkeyPatch
+):
+    """Interlink models may declare fields outside of the Kubernetes schema: they are dropped by both paths"""
+    from_models = _create_bodies(service, k_core_client, create_raw_json=False)
+
+    for i_model in [_I_POD.spec, _I_POD.metadata, _I_CONFIG_MAP, _I_SECRET, _I_PVC]:
+        model_dump = type(i_model).model_dump
+
+        def model_dump_with_extra_keys(self, *args, model_dump=model_dump, **kwargs):
+            data = model_dump(self, *args, **kwargs)
+            for container in data.get("containers", []):
+                container["interlinkOnly"] = {"key": "value"}
+            return {**data, "interlinkOnly": "value"}
+
+        monkeypatch.setattr(type(i_model), "model_dump", model_dump_with_extra_keys)
+    from_dicts = _create_bodies(service, k_core_client, create_raw_json=True)
+
+    assert "interlinkOnly" in _I_POD.spec.model_dump()
+    for from_model, from_dict in zip(from_models, from_dicts):
+        assert from_dict == from_model
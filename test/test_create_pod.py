@@ -0,0 +1,201 @@
+# pylint: disable=redefined-outer-name,protected-access
+"""
+Check `KubernetesPluginService.create_pod` on retried creations (the remote pod is created once, and the result
+of the existing remote pod is returned), and on failed creations (only the objects created are rolled back).
+"""
+
+import asyncio
+import logging
+import time
+from unittest.mock import MagicMock
+
+import interlink as i
+import pytest
+from kubernetes import client as k
+
+from app.entities.remote_pod_state import RemotePodState
+from app.services.kubernetes_plugin_service import KubernetesPluginService
+from app.services.kubernetes_pod_informer import KubernetesPodInformer
+from app.services.kubernetes_remote_index import KubernetesRemoteIndex
+
+_POD_UID = "uid-0"
+
+_I_POD = {
+    "pod": {
+        "metadata": {"name": "test-pod", "namespace": "default", "uid": _POD_UID},
+        "spec": {"containers": [{"name": "test-container", "image": "busybox"}]},
+    },
+    "container": [],
+}
+
+_I_VOLUMES = [
+    {
+        "name": "test-container",
+        "configMaps": [{"metadata": {"name": "test-cm", "namespace": "default", "uid": _POD_UID}}],
+        "secrets": [{"metadata": {"name": "test-secret", "namespace": "default", "uid": _POD_UID}}],
+    }
+]
+
+
+@pytest.fixture()
+def k_core_client(k_core_client: MagicMock) -> MagicMock:
+    def create_namespaced_pod(namespace: str, body, **_kwargs) -> k.V1Pod:
+        name = body["metadata"]["name"] if isinstance(body, dict) else body.metadata.name
+        jid = f"jid-{k_core_client.create_namespaced_pod.call_count}"
+        return k.V1Pod(metadata=k.V1ObjectMeta(name=name, namespace=namespace, uid=jid))
+
+    k_core_client.create_namespaced_pod.side_effect = create_namespaced_pod
+    return k_core_client
+
+
+@pytest.fixture()
+def remote_index(service: KubernetesPluginService) -> KubernetesRemoteIndex:
+    service._remote_index = KubernetesRemoteIndex(
+        logging.getLogger(__name__),
+        service._k_core_client,
+        label_selector="interlink.io=offloading",
+        source_pod_uid_key="interlink.io/source.pod_uid",
+    )
+    return service._remote_index
+
+
+def _create(service: KubernetesPluginService, volumes: list[dict] | None = None) -> i.CreateStruct:
+    return asyncio.run(service.create_pod(i.Pod.model_validate({**_I_POD, "container": volumes or []})))
+
+
+def _index_pod(service: KubernetesPluginService, remote_index: KubernetesRemoteIndex, jid: str) -> tuple[str, str]:
+    """Index the remote pod as if created by another replica, return its namespace and name"""
+    pod_namespace = service._scope_ns_name("default")
+    pod_name = service._scope_obj_name("test-pod", pod_uid=_POD_UID)
+    remote_index.add(pod_namespace, _POD_UID, "Pod", pod_name, jid=jid)
+    return pod_namespace, pod_name
+
+
+def test_index_hit_confirmed_by_reading_remote_pod(
+    service: KubernetesPluginService, remote_index: KubernetesRemoteIndex, k_core_client: MagicMock
+):
+    pod_namespace, pod_name = _index_pod(service, remote_index, "jid-indexed")
+    k_core_client.read_namespaced_pod.return_value = k.V1Pod(
+        metadata=k.V1ObjectMeta(name=pod_name, namespace=pod_namespace, uid="jid-indexed")
+    )
+
+    result = _create(service)
+
+    assert result.pod_jid == "jid-indexed"
+    k_core_client.read_namespaced_pod.assert_called_once_with(pod_name, pod_namespace)
+    k_core_client.create_namespaced_pod.assert_not_called()
+
+
+def test_stale_index_hit_pod_created_again(
+    service: KubernetesPluginService, remote_index: KubernetesRemoteIndex, k_core_client: MagicMock
+):
+    """The indexed pod was deleted by others since the index was rebuilt"""
+    pod_namespace, _pod_name = _index_pod(service, remote_index, "jid-deleted")
+    k_core_client.read_namespaced_pod.side_effect = k.ApiException(status=404)
+
+    result = _create(service)
+
+    assert result.pod_jid == "jid-1"
+    k_core_client.create_namespaced_pod.assert_called_once()
+    assert (record := remote_index.get(pod_namespace, _POD_UID)) and record.pod_jid == "jid-1"
+
+
+def test_retried_creation_returns_created_pod(service: KubernetesPluginService, k_core_client: MagicMock):
+    first = _create(service)
+    retried = _create(service)
+
+    assert retried == first
+    k_core_client.create_namespaced_pod.assert_called_once()
+
+
+def test_retried_creation_returns_pod_indexed_by_fresh_informer(
+    service: KubernetesPluginService, k_core_client: MagicMock
+):
+    informer = KubernetesPodInformer(
+        logging.getLogger(__name__),
+        MagicMock(),
+        label_selector="interlink.io=offloading",
+        index_label_key="interlink.io/source.pod_uid",
+        resync_seconds=300,
+        max_staleness_seconds=30,
+    )
+    pod_namespace = service._scope_ns_name("default")
+    remote_pod = k.V1Pod(metadata=k.V1ObjectMeta(name="test-pod", namespace=pod_namespace, uid="jid-watched"))
+    informer._set((pod_namespace, _POD_UID), RemotePodState(remote_pod, source_pod_uid=_POD_UID))
+    service._pod_informer = informer
+
+    informer._synced_at = time.monotonic()
+    assert _create(service).pod_jid == "jid-watched"
+    k_core_client.create_namespaced_pod.assert_not_called()
+
+    informer._synced_at = time.monotonic() - 60  # stale: not trusted
+    assert _create(service).pod_jid == "jid-1"
+
+
+def test_conflicting_pod_of_same_source_pod_returned(service: KubernetesPluginService, k_core_client: MagicMock):
+    """E.g., created by a previous attempt whose response was lost"""
+    k_core_client.create_namespaced_pod.side_effect = k.ApiException(status=409)
+    k_core_client.read_namespaced_pod.return_value = k.V1Pod(
+        metadata=k.V1ObjectMeta(uid="jid-existing", labels={"interlink.io/source.pod_uid": _POD_UID})
+    )
+
+    result = _create(service, _I_VOLUMES)
+
+    assert result.pod_jid == "jid-existing"
+    k_core_client.delete_namespaced_pod.assert_not_called()
+    assert _create(service).pod_jid == "jid-existing"
+    k_core_client.create_namespaced_pod.assert_called_once()
+
+
+def _deleted(k_core_client: MagicMock) -> list[tuple[str, str]]:
+    """Kinds and names of the deleted objects"""
+    return sorted(
+        (kind, call.args[0])
+        for kind, delete in [
+            ("Pod", k_core_client.delete_namespaced_pod),
+            ("ConfigMap", k_core_client.delete_namespaced_config_map),
+            ("Secret", k_core_client.delete_namespaced_secret),
+        ]
+        for call in delete.call_args_list
+    )
+
+
+def test_volumes_rolled_back_when_pod_creation_fails(service: KubernetesPluginService, k_core_client: MagicMock):
+    k_core_client.create_namespaced_pod.side_effect = k.ApiException(status=500)
+
+    with pytest.raises(k.ApiException):
+        _create(service, _I_VOLUMES)
+
+    assert _deleted(k_core_client) == [
+        ("ConfigMap", f"test-cm-{_POD_UID}"),
+        ("Secret", f"test-secret-{_POD_UID}"),
+    ]
+    k_core_client.delete_namespace.assert_not_called()
+    assert service._created_pods.get((service._scope_ns_name("default"), _POD_UID)) is None
+
+
+def test_only_created_volumes_rolled_back(service: KubernetesPluginService, k_core_client: MagicMock):
+    """The secret could not be created: the config map created meanwhile is rolled back, the pod is not created"""
+    k_core_client.create_namespaced_secret.side_effect = k.ApiException(status=403)
+
+    with pytest.raises(k.ApiException):
+        _create(service, _I_VOLUMES)
+
+    assert _deleted(k_core_client) == [("ConfigMap", f"test-cm-{_POD_UID}")]
+    k_core_client.create_namespaced_pod.assert_not_called()
+
+
+def test_preexisting_pod_not_rolled_back(service: KubernetesPluginService, k_core_client: MagicMock):
+    """The pod name is taken by a pod offloaded from another source pod"""
+    k_core_client.create_namespaced_pod.side_effect = k.ApiException(status=409)
+    k_core_client.read_namespaced_pod.return_value = k.V1Pod(
+        metadata=k.V1ObjectMeta(uid="jid-other", labels={"interlink.io/source.pod_uid": "uid-other"})
+    )
+
+    with pytest.raises(k.ApiException):
+        _create(service, _I_VOLUMES)
+
+    assert _deleted(k_core_client) == [
+        ("ConfigMap", f"test-cm-{_POD_UID}"),
+        ("Secret", f"test-secret-{_POD_UID}"),
+    ]
@@ -0,0 +1,116 @@
+# pylint: disable=redefined-outer-name,protected-access
+"""
+Check that `KubernetesPluginService.delete_pod` deletes the remote pod, config maps and secrets in bulk by the
+source pod uid label, and the PVCs by name according to their retention policy.
+"""
+
+import asyncio
+import logging
+from unittest.mock import MagicMock
+
+import interlink as i
+import pytest
+from kubernetes import client as k
+
+from app.services.kubernetes_plugin_service import KubernetesPluginService
+from app.services.kubernetes_remote_index import KubernetesRemoteIndex
+
+_POD_UID = "uid-0"
+
+_LABEL_SELECTOR = f"interlink.io/source.pod_uid={_POD_UID}"
+
+_I_POD = {
+    "metadata": {"name": "test-pod", "namespace": "default", "uid": _POD_UID},
+    "spec": {
+        "containers": [{"name": "test-container", "image": "busybox"}],
+        "volumes": [
+            {"name": "cm-volume", "configMap": {"name": "test-cm"}},
+            {"name": "pvc-volume", "persistentVolumeClaim": {"claimName": "test-pvc"}},
+            {"name": "kept-pvc-volume", "persistentVolumeClaim": {"claimName": "kept-pvc"}},
+        ],
+    },
+}
+
+
+@pytest.fixture()
+def k_core_client(k_core_client: MagicMock) -> MagicMock:
+    def read_namespaced_persistent_volume_claim(name: str, namespace: str, **_kwargs):
+        retention_policy = "retain" if name == "kept-pvc" else "delete"
+        return k.V1PersistentVolumeClaim(
+            metadata=k.V1ObjectMeta(
+                name=name,
+                namespace=namespace,
+                annotations={"interlink.io/pvc-retention-policy": retention_policy},
+            )
+        )
+
+    k_core_client.read_namespaced_persistent_volume_claim.side_effect = read_namespaced_persistent_volume_claim
+    return k_core_client
+
+
+@pytest.fixture()
+def service(service: KubernetesPluginService) -> KubernetesPluginService:
+    service._delete_queue = None  # objects deleted within the request, not in background
+    return service
+
+
+def _delete(service: KubernetesPluginService) -> str:
+    return asyncio.run(service.delete_pod(i.PodRequest.model_validate(_I_POD)))
+
+
+def test_pod_objects_deleted_by_label_selector(service: KubernetesPluginService, k_core_client: MagicMock):
+    pod_namespace = service._scope_ns_name("default")
+
+    assert _delete(service) == f"Pod '{_POD_UID}' deleted"
+
+    for delete_collection in [
+        k_core_client.delete_collection_namespaced_pod,
+        k_core_client.delete_collection_namespaced_config_map,
+        k_core_client.delete_collection_namespaced_secret,
+    ]:
+        delete_collection.assert_called_once_with(pod_namespace, label_selector=_LABEL_SELECTOR)
+    k_core_client.delete_namespaced_pod.assert_not_called()
+    k_core_client.delete_namespaced_config_map.assert_not_called()
+    k_core_client.delete_namespaced_secret.assert_not_called()
+    k_core_client.delete_namespace.assert_not_called()
+
+
+def test_pvcs_deleted_by_retention_policy(service: KubernetesPluginService, k_core_client: MagicMock):
+    pod_namespace = service._scope_ns_name("default")
+
+    _delete(service)
+
+    k_core_client.delete_namespaced_persistent_volume_claim.assert_called_once_with("test-pvc", pod_namespace)
+
+
+def test_indexed_pvcs_deleted(service: KubernetesPluginService, k_core_client: MagicMock):
+    """PVCs recorded in the remote index are deleted, even if no longer listed in the request"""
+    service._remote_index = KubernetesRemoteIndex(
+        logging.getLogger(__name__),
+        service._k_core_client,
+        label_selector="interlink.io=offloading",
+        source_pod_uid_key="interlink.io/source.pod_uid",
+    )
+    pod_namespace = service._scope_ns_name("default")
+    service._remote_index.add(pod_namespace, _POD_UID, "PersistentVolumeClaim", "indexed-pvc")
+
+    _delete(service)
+
+    assert sorted(call.args[0] for call in k_core_client.delete_namespaced_persistent_volume_claim.call_args_list) == [
+        "indexed-pvc",
+        "test-pvc",
+    ]
+    assert service._remote_index.get(pod_namespace, _POD_UID) is None
+
+
+def test_all_deletions_attempted_when_one_fails(service: KubernetesPluginService, k_core_client: MagicMock):
+    k_core_client.delete_collection_namespaced_pod.side_effect = k.ApiException(status=500)
+    i_pod = i.PodRequest.model_validate(_I_POD)
+
+    with pytest.raises(k.ApiException):
+        asyncio.run(service._delete_pod_objects(i_pod))
+
+    k_core_client.delete_collection_namespaced_config_map.assert_called_once()
+    k_core_client.delete_collection_namespaced_secret.assert_called_once()
+    k_core_client.delete_namespaced_persistent_volume_claim.assert_called_once()
+    assert _delete(service) == f"Pod '{_POD_UID}' deleted"  # already logged
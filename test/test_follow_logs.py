@@ -0,0 +1,134 @@
+# pylint: disable=redefined-outer-name,protected-access
+"""
+Check followed logs (`/getLogs` with `opts.follow`): chunks streamed as read, at most
+`offloading.log_follow_max_streams` streams at once, slots and connections released in every case.
+"""
+
+import asyncio
+import time
+from unittest.mock import MagicMock
+
+import interlink as i
+import pytest
+from fastapi.testclient import TestClient
+from kubernetes import client as k
+
+from app.common.error_types import TooManyRequestsError
+from app.controllers.v1.kubernetes_plugin_controller import _logs_response
+from app.services.kubernetes_plugin_service import KubernetesPluginService
+
+_LOG_REQUEST = {
+    "Namespace": "default",
+    "PodUID": "uid-0",
+    "PodName": "test-pod",
+    "ContainerName": "test-container",
+    "Opts": {"Follow": True},
+}
+
+
+class _FakeLogResponse:
+    """Stand-in for the `urllib3.HTTPResponse` of a followed log"""
+
+    def __init__(self, chunks: list[bytes]):
+        self.chunks = chunks
+        self.streamed = False
+        self.released = False
+        self.closed = False
+
+    def stream(self, _amt: int):
+        self.streamed = True
+        yield from self.chunks
+
+    def release_conn(self):
+        self.released = True
+
+    def shutdown(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture()
+def log_responses() -> list[_FakeLogResponse]:
+    return []
+
+
+@pytest.fixture()
+def k_core_client(k_core_client: MagicMock, log_responses: list[_FakeLogResponse]) -> MagicMock:
+    def read_namespaced_pod_log(**_kwargs) -> _FakeLogResponse:
+        time.sleep(0.05)  # opening the stream takes a while, as concurrent requests may overlap
+        log_responses.append(_FakeLogResponse([b"line 1\n", b"line 2\n"]))
+        return log_responses[-1]
+
+    k_core_client.read_namespaced_pod_log.side_effect = read_namespaced_pod_log
+    return k_core_client
+
+
+def test_logs_streamed(client: TestClient, service: KubernetesPluginService, log_responses: list[_FakeLogResponse]):
+    with client.stream("POST", "/getLogs", json=_LOG_REQUEST) as response:
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert response.read() == b"line 1\nline 2\n"
+
+    assert [(r.released, r.closed) for r in log_responses] == [(True, False)]
+    assert service._log_follow_streams == 0
+
+
+def test_concurrent_follows_limited(service: KubernetesPluginService, log_responses: list[_FakeLogResponse]):
+    service._log_follow_max_streams = 3
+    i_log_req = i.LogRequest.model_validate(_LOG_REQUEST)
+
+    async def run():
+        return await asyncio.gather(*[service.follow_logs(i_log_req) for _ in range(4)], return_exceptions=True)
+
+    results = asyncio.run(run())
+
+    rejected = [result for result in results if isinstance(result, TooManyRequestsError)]
+    assert len(rejected) == 1
+    assert rejected[0].status_code == 429
+    assert len(log_responses) == 3
+    assert service._log_follow_streams == 3
+
+
+def test_slot_released_when_stream_cannot_be_opened(service: KubernetesPluginService, k_core_client: MagicMock):
+    k_core_client.read_namespaced_pod_log.side_effect = k.ApiException(status=404)
+
+    with pytest.raises(k.ApiException):
+        asyncio.run(service.follow_logs(i.LogRequest.model_validate(_LOG_REQUEST)))
+
+    assert service._log_follow_streams == 0
+
+
+def test_slot_and_connection_released_when_body_never_iterated(
+    service: KubernetesPluginService, log_responses: list[_FakeLogResponse]
+):
+    """The client disconnects before the response body is sent"""
+
+    async def receive():
+        return {"type": "http.disconnect"}
+
+    async def send(_message):
+        await asyncio.Event().wait()  # never sent
+
+    async def run():
+        response = await _logs_response(i.LogRequest.model_validate(_LOG_REQUEST), service)
+        assert service._log_follow_streams == 1
+        await response({"type": "http", "asgi": {"spec_version": "2.3"}}, receive, send)
+
+    asyncio.run(run())
+
+    assert [(r.streamed, r.closed) for r in log_responses] == [(False, True)]
+    assert service._log_follow_streams == 0
+
+
+def test_stream_closed_once(service: KubernetesPluginService, log_responses: list[_FakeLogResponse]):
+    async def run():
+        log_stream = await service.follow_logs(i.LogRequest.model_validate(_LOG_REQUEST))
+        chunks = [chunk async for chunk in log_stream]
+        await log_stream.aclose()  # e.g., the background task of the response
+        return chunks
+
+    assert asyncio.run(run()) == [b"line 1\n", b"line 2\n"]
+    assert [(r.released, r.closed) for r in log_responses] == [(True, False)]
+    assert service._log_follow_streams == 0
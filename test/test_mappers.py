@@ -0,0 +1,96 @@
+"""
+Check that the compiled mappers of `app.entities.mappers` support the container type formats declared in
+`openapi_types` by the supported Kubernetes clients, and fall back to the generic conversions otherwise.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+from kubernetes import client as k
+
+from app.entities import mappers
+
+
+def _model_type(openapi_types: dict[str, str]) -> type:
+    """A Kubernetes-like model type with the given attribute types"""
+
+    def __init__(self, local_vars_configuration=None, **kwargs):
+        for attr in openapi_types:
+            setattr(self, attr, kwargs.get(attr))
+
+    def to_dict(self):
+        return {
+            attr: [item.to_dict() for item in value] if isinstance(value, list) else value
+            for attr in openapi_types
+            for value in [getattr(self, attr)]
+        }
+
+    return type(
+        "V1Test",
+        (),
+        {
+            "openapi_types": openapi_types,
+            "attribute_map": {attr: attr.replace("_", "") for attr in openapi_types},
+            "__init__": __init__,
+            "to_dict": to_dict,
+        },
+    )
+
+
+@pytest.mark.parametrize(
+    "labels_type, env_type",
+    [
+        ("dict(str, str)", "list[V1EnvVar]"),  # kubernetes client <= 34
+        ("Dict[str, str]", "List[V1EnvVar]"),  # newer kubernetes clients
+    ],
+)
+def test_container_type_formats(labels_type: str, env_type: str):
+    api_client = k.ApiClient()
+    model_type = _model_type({"labels": labels_type, "env_vars": env_type, "count": "int"})
+    data = {"labels": {"app": "test"}, "envvars": [{"name": "PLAIN", "value": "value"}], "count": 1}
+
+    model = mappers.deserialize_dict_to_k_model(api_client, data, model_type)
+
+    assert model.labels == {"app": "test"}
+    assert model.env_vars == [k.V1EnvVar(name="PLAIN", value="value")]
+    assert model.count == 1
+    assert mappers._K_SERIALIZERS[model_type](model, api_client) == {  # pylint: disable=protected-access
+        "labels": {"app": "test"},
+        "env_vars": [{"name": "PLAIN", "value": "value", "value_from": None}],
+        "count": 1,
+    }
+
+
+def test_unsupported_type_falls_back_to_generic_conversions():
+    api_client = MagicMock()
+    model_type = _model_type({"labels": "dict(str, str)", "ports": "Tuple[int, int]"})
+    model = model_type(labels={"app": "test"}, ports=(80, 443))
+
+    deserialized = mappers.deserialize_dict_to_k_model(api_client, {"labels": {}}, model_type)
+    serialized = mappers._K_SERIALIZERS[model_type](model, api_client)  # pylint: disable=protected-access
+
+    assert deserialized is api_client._ApiClient__deserialize_model.return_value
+    api_client._ApiClient__deserialize_model.assert_called_once_with({"labels": {}}, model_type)
+    assert serialized is api_client.sanitize_for_serialization.return_value
+    api_client.sanitize_for_serialization.assert_called_once_with({"labels": {"app": "test"}, "ports": (80, 443)})
+
+
+def test_prune_dict_to_k_model():
+    data = {
+        "apiVersion": "v1",
+        "kind": "Pod",
+        "metadata": {"name": "test-pod", "labels": {"app": "test"}, "unknown": "value"},
+        "spec": {
+            "containers": [{"name": "test-container", "env": [{"name": "PLAIN", "value": "value", "unknown": 1}]}],
+            "unknown": {"key": "value"},
+            "nodeName": None,
+        },
+        "unknown": "value",
+    }
+
+    assert mappers.prune_dict_to_k_model(data, k.V1Pod) == {
+        "apiVersion": "v1",
+        "kind": "Pod",
+        "metadata": {"name": "test-pod", "labels": {"app": "test"}},
+        "spec": {"containers": [{"name": "test-container", "env": [{"name": "PLAIN", "value": "value"}]}]},
+    }
@@ -0,0 +1,112 @@
+# pylint: disable=redefined-outer-name,protected-access
+"""
+Check that `KubernetesNamespaceReaper` never deletes namespaces holding PVCs or where pods are being created.
+"""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable
+
+import pytest
+from kubernetes import client as k
+
+from app.services.kubernetes_namespace_reaper import KubernetesNamespaceReaper
+
+_NAMESPACE = "offloading-default"
+
+
+class _FakeCoreV1Api:
+    """Awaitable API with an empty offloading namespace; `on_list_pods` runs while pods are being listed"""
+
+    def __init__(self):
+        self.pvcs: list[k.V1PersistentVolumeClaim] = []
+        self.deleted: list[str] = []
+        self.on_list_pods: Callable[[], Awaitable[None]] | None = None
+
+    async def list_namespace(self, **_kwargs) -> k.V1NamespaceList:
+        return k.V1NamespaceList(
+            items=[k.V1Namespace(metadata=k.V1ObjectMeta(name=_NAMESPACE))], metadata=k.V1ListMeta()
+        )
+
+    async def list_pod_for_all_namespaces(self, **_kwargs) -> k.V1PodList:
+        if self.on_list_pods:
+            await self.on_list_pods()
+        return k.V1PodList(items=[], metadata=k.V1ListMeta())
+
+    async def list_namespaced_persistent_volume_claim(self, namespace: str, **_kwargs):
+        return k.V1PersistentVolumeClaimList(items=self.pvcs, metadata=k.V1ListMeta())
+
+    async def delete_namespace(self, name: str) -> None:
+        self.deleted.append(name)
+        raise k.ApiException(status=404)  # i.e., gone at once
+
+
+@pytest.fixture()
+def k_core_client() -> _FakeCoreV1Api:
+    return _FakeCoreV1Api()
+
+
+@pytest.fixture()
+def reaper(k_core_client: _FakeCoreV1Api) -> KubernetesNamespaceReaper:
+    return KubernetesNamespaceReaper(
+        logging.getLogger(__name__),
+        k_core_client,  # type: ignore
+        label_selector="interlink.io=offloading",
+        grace_period_seconds=0,
+        forget_namespace=lambda _name: None,
+    )
+
+
+def test_reap_empty_namespace(reaper: KubernetesNamespaceReaper, k_core_client: _FakeCoreV1Api):
+    assert asyncio.run(reaper.reap()) == [_NAMESPACE]
+    assert k_core_client.deleted == [_NAMESPACE]
+
+
+def test_namespace_holding_pvcs_not_reaped(reaper: KubernetesNamespaceReaper, k_core_client: _FakeCoreV1Api):
+    k_core_client.pvcs = [k.V1PersistentVolumeClaim(metadata=k.V1ObjectMeta(name="retained", namespace=_NAMESPACE))]
+
+    assert asyncio.run(reaper.reap()) == []
+    assert k_core_client.deleted == []
+
+
+def test_namespace_guarded_while_creating_not_reaped(reaper: KubernetesNamespaceReaper, k_core_client: _FakeCoreV1Api):
+    async def reap_while_creating():
+        async with reaper.guard(_NAMESPACE):
+            return await reaper.reap()
+
+    assert asyncio.run(reap_while_creating()) == []
+    assert k_core_client.deleted == []
+
+
+def test_creation_completed_while_listing_pods_not_reaped(
+    reaper: KubernetesNamespaceReaper, k_core_client: _FakeCoreV1Api
+):
+    async def create_pod():
+        # The whole creation runs while pods are listed: the created pod is missing from the listed pods
+        async with reaper.guard(_NAMESPACE):
+            await asyncio.sleep(0)
+
+    k_core_client.on_list_pods = create_pod
+
+    assert asyncio.run(reaper.reap()) == []
+    assert k_core_client.deleted == []
+
+    # The next reaping lists the pods after the creation, so the namespace is reaped if still empty
+    k_core_client.on_list_pods = None
+    assert asyncio.run(reaper.reap()) == [_NAMESPACE]
+
+
+def test_creation_started_while_listing_pvcs_not_reaped(
+    reaper: KubernetesNamespaceReaper, k_core_client: _FakeCoreV1Api
+):
+    list_pvcs = k_core_client.list_namespaced_persistent_volume_claim
+
+    async def list_pvcs_while_creating(namespace: str, **kwargs):
+        async with reaper.guard(_NAMESPACE):
+            await asyncio.sleep(0)
+        return await list_pvcs(namespace, **kwargs)
+
+    k_core_client.list_namespaced_persistent_volume_claim = list_pvcs_while_creating  # type: ignore
+
+    assert asyncio.run(reaper.reap()) == []
+    assert k_core_client.deleted == []
@@ -0,0 +1,106 @@
+# pylint: disable=redefined-outer-name,protected-access
+"""
+Check that `KubernetesPodInformer` applies watch events to its index, and relists when the watched
+`resourceVersion` expired (`410 Gone`).
+"""
+
+import logging
+from typing import Any, Iterator
+from unittest.mock import MagicMock
+
+import pytest
+from kubernetes import client as k
+
+from app.services import kubernetes_pod_informer
+from app.services.kubernetes_pod_informer import KubernetesPodInformer
+
+_NAMESPACE = "offloading-default"
+_INDEX_LABEL_KEY = "interlink.io/source.pod_uid"
+
+
+def _pod(source_pod_uid: str, resource_version: str = "1") -> k.V1Pod:
+    return k.V1Pod(
+        metadata=k.V1ObjectMeta(
+            name=f"pod-{source_pod_uid}",
+            namespace=_NAMESPACE,
+            uid=f"jid-{source_pod_uid}",
+            labels={_INDEX_LABEL_KEY: source_pod_uid},
+            resource_version=resource_version,
+        )
+    )
+
+
+def _pod_list(pods: list[k.V1Pod], resource_version: str) -> k.V1PodList:
+    return k.V1PodList(items=pods, metadata=k.V1ListMeta(resource_version=resource_version))
+
+
+class _FakeWatch:
+    """Stand-in for `kubernetes.watch.Watch`: each `stream` call plays the next scripted watch, i.e. a list of
+    events or an exception; the informer is stopped once the script is over"""
+
+    script: list[list[dict[str, Any]] | Exception] = []
+    informer: KubernetesPodInformer | None = None
+    resource_versions: list[str | None] = []
+
+    def stream(self, _func, **kwargs) -> Iterator[dict[str, Any]]:
+        _FakeWatch.resource_versions.append(kwargs.get("resource_version"))
+        if not _FakeWatch.script:
+            assert _FakeWatch.informer
+            _FakeWatch.informer._stop_event.set()
+            return
+        events = _FakeWatch.script.pop(0)
+        if isinstance(events, Exception):
+            raise events
+        yield from events
+
+    def stop(self) -> None:
+        pass
+
+
+@pytest.fixture()
+def informer(monkeypatch: pytest.MonkeyPatch) -> KubernetesPodInformer:
+    informer = KubernetesPodInformer(
+        logging.getLogger(__name__),
+        MagicMock(),
+        label_selector="interlink.io=offloading",
+        index_label_key=_INDEX_LABEL_KEY,
+        resync_seconds=300,
+        max_staleness_seconds=30,
+    )
+    monkeypatch.setattr(kubernetes_pod_informer.k_watch, "Watch", _FakeWatch)
+    monkeypatch.setattr(_FakeWatch, "script", [])
+    monkeypatch.setattr(_FakeWatch, "informer", informer)
+    monkeypatch.setattr(_FakeWatch, "resource_versions", [])
+    return informer
+
+
+def test_watch_events_applied(informer: KubernetesPodInformer):
+    informer._k_core_client.list_pod_for_all_namespaces.return_value = _pod_list([_pod("a")], "10")
+    _FakeWatch.script = [
+        [
+            {"type": "ADDED", "object": _pod("b", "11")},
+            {"type": "DELETED", "object": _pod("a", "12")},
+        ]
+    ]
+
+    informer._run()
+
+    assert informer.get(_NAMESPACE, "a") is None
+    assert (pod_state := informer.get(_NAMESPACE, "b")) and pod_state.uid == "jid-b"
+    assert _FakeWatch.resource_versions == ["10", "12"]  # resumed from the last event
+    assert informer.changes == 3
+
+
+def test_relist_on_expired_resource_version(informer: KubernetesPodInformer):
+    informer._k_core_client.list_pod_for_all_namespaces.side_effect = [
+        _pod_list([_pod("a")], "10"),
+        _pod_list([_pod("b")], "20"),  # "a" was deleted while the resource version expired
+    ]
+    _FakeWatch.script = [k.ApiException(status=410)]
+
+    informer._run()
+
+    assert informer._k_core_client.list_pod_for_all_namespaces.call_count == 2
+    assert informer.get(_NAMESPACE, "a") is None
+    assert informer.get(_NAMESPACE, "b") is not None
+    assert _FakeWatch.resource_versions == ["10", "20"]
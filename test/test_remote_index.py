@@ -0,0 +1,113 @@
+# pylint: disable=redefined-outer-name,protected-access
+"""
+Check that `KubernetesRemoteIndex.rebuild` catches up with remote changes, without losing the changes recorded
+by the service while rebuilding, and that the service starts even if the index cannot be rebuilt.
+"""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable
+
+import pytest
+from kubernetes import client as k
+from urllib3.exceptions import MaxRetryError
+
+from app.services.kubernetes_plugin_service import KubernetesPluginService
+from app.services.kubernetes_remote_index import KubernetesRemoteIndex
+
+_NAMESPACE = "offloading-default"
+_SOURCE_POD_UID_KEY = "interlink.io/source.pod_uid"
+
+
+def _pod(source_pod_uid: str) -> k.V1Pod:
+    return k.V1Pod(
+        metadata=k.V1ObjectMeta(
+            name=f"pod-{source_pod_uid}",
+            namespace=_NAMESPACE,
+            uid=f"jid-{source_pod_uid}",
+            labels={_SOURCE_POD_UID_KEY: source_pod_uid},
+        )
+    )
+
+
+class _FakeCoreV1Api:
+    """Awaitable API listing `pods` only; `on_list_pods` runs while pods are being listed"""
+
+    def __init__(self):
+        self.pods: list[k.V1Pod] = []
+        self.on_list_pods: Callable[[], Awaitable[None]] | None = None
+
+    async def list_pod_for_all_namespaces(self, **_kwargs) -> k.V1PodList:
+        pods = list(self.pods)
+        if self.on_list_pods:
+            await self.on_list_pods()
+        return k.V1PodList(items=pods, metadata=k.V1ListMeta())
+
+    def __getattr__(self, _name: str):
+        async def list_nothing(**_kwargs):
+            return k.V1ConfigMapList(items=[], metadata=k.V1ListMeta())
+
+        return list_nothing
+
+
+@pytest.fixture()
+def fake_core_client() -> _FakeCoreV1Api:
+    return _FakeCoreV1Api()
+
+
+@pytest.fixture()
+def remote_index(fake_core_client: _FakeCoreV1Api) -> KubernetesRemoteIndex:
+    return KubernetesRemoteIndex(
+        logging.getLogger(__name__),
+        fake_core_client,  # type: ignore
+        label_selector="interlink.io=offloading",
+        source_pod_uid_key=_SOURCE_POD_UID_KEY,
+    )
+
+
+def test_rebuild_catches_up(remote_index: KubernetesRemoteIndex, fake_core_client: _FakeCoreV1Api):
+    fake_core_client.pods = [_pod("a")]
+    asyncio.run(remote_index.rebuild())
+    assert remote_index.is_built
+    assert (record := remote_index.get(_NAMESPACE, "a")) and record.pod_jid == "jid-a"
+
+    # Pod "a" deleted and pod "b" created by others
+    fake_core_client.pods = [_pod("b")]
+    asyncio.run(remote_index.rebuild())
+    assert remote_index.get(_NAMESPACE, "a") is None
+    assert (record := remote_index.get(_NAMESPACE, "b")) and record.pod_jid == "jid-b"
+
+
+def test_rebuild_keeps_changes_recorded_meanwhile(
+    remote_index: KubernetesRemoteIndex, fake_core_client: _FakeCoreV1Api
+):
+    fake_core_client.pods = [_pod("a")]
+    asyncio.run(remote_index.rebuild())
+
+    async def create_and_delete():
+        remote_index.add(_NAMESPACE, "b", "Pod", "pod-b", jid="jid-b")
+        remote_index.discard(_NAMESPACE, "a")
+
+    fake_core_client.on_list_pods = create_and_delete
+    asyncio.run(remote_index.rebuild())  # listed pods predate the changes
+
+    assert remote_index.get(_NAMESPACE, "a") is None
+    assert (record := remote_index.get(_NAMESPACE, "b")) and record.pod_jid == "jid-b"
+
+
+def test_service_started_when_api_server_unreachable(
+    service: KubernetesPluginService, remote_index: KubernetesRemoteIndex, fake_core_client: _FakeCoreV1Api
+):
+    async def unreachable():
+        raise MaxRetryError(None, "/api/v1/pods", "Connection refused")  # type: ignore
+
+    fake_core_client.on_list_pods = unreachable
+    service._remote_index = remote_index
+
+    async def start_and_stop():
+        async with service:
+            pass
+
+    asyncio.run(start_and_stop())
+
+    assert not remote_index.is_built
@@ -0,0 +1,131 @@
+"""
+Check `SingleFlight`: concurrent identical calls share one call and its outcome, cancelled callers do not
+cancel the shared call.
+"""
+
+import asyncio
+import logging
+
+import pytest
+
+from app.common import metrics
+from app.utilities.async_utilities import SingleFlight
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class _Call:
+    """Counted call, completing once `release` is set"""
+
+    def __init__(self, result=None, exception: Exception | None = None):
+        self.calls = 0
+        self.release = asyncio.Event()
+        self._result = result
+        self._exception = exception
+
+    async def __call__(self):
+        self.calls += 1
+        await self.release.wait()
+        if self._exception:
+            raise self._exception
+        return self._result
+
+
+def test_concurrent_callers_share_result():
+    async def run():
+        single_flight = SingleFlight(_LOGGER, name="test_share")
+        call = _Call(result={"status": "running"})
+        callers = [asyncio.create_task(single_flight.run("read", "key", call)) for _ in range(5)]
+        await asyncio.sleep(0)
+        call.release.set()
+        return call, await asyncio.gather(*callers)
+
+    call, results = asyncio.run(run())
+
+    assert call.calls == 1
+    assert all(result is results[0] for result in results)
+    assert metrics.snapshot()["test_share_read_saved"] == 4
+
+
+def test_concurrent_callers_share_exception():
+    error = RuntimeError("remote error")
+
+    async def run():
+        single_flight = SingleFlight(_LOGGER, name="test_share_exception")
+        call = _Call(exception=error)
+        callers = [asyncio.create_task(single_flight.run("read", "key", call)) for _ in range(3)]
+        await asyncio.sleep(0)
+        call.release.set()
+        return call, await asyncio.gather(*callers, return_exceptions=True)
+
+    call, results = asyncio.run(run())
+
+    assert call.calls == 1
+    assert results == [error, error, error]
+
+
+def test_different_keys_and_operations_not_shared():
+    async def run():
+        single_flight = SingleFlight(_LOGGER, name="test_keys")
+        call = _Call()
+        callers = [
+            asyncio.create_task(single_flight.run(operation, key, call))
+            for operation, key in [("read", "a"), ("read", "b"), ("logs", "a")]
+        ]
+        await asyncio.sleep(0)
+        call.release.set()
+        await asyncio.gather(*callers)
+        return call
+
+    assert asyncio.run(run()).calls == 3
+
+
+def test_sequential_calls_not_shared():
+    async def run():
+        single_flight = SingleFlight(_LOGGER, name="test_sequential")
+        call = _Call()
+        call.release.set()
+        await single_flight.run("read", "key", call)
+        await single_flight.run("read", "key", call)
+        return call
+
+    assert asyncio.run(run()).calls == 2
+
+
+def test_cancelled_caller_does_not_cancel_shared_call():
+    async def run():
+        single_flight = SingleFlight(_LOGGER, name="test_cancel")
+        call = _Call(result="done")
+        first = asyncio.create_task(single_flight.run("read", "key", call))
+        second = asyncio.create_task(single_flight.run("read", "key", call))
+        await asyncio.sleep(0)
+        first.cancel()  # i.e., the caller who started the call
+        await asyncio.sleep(0)
+        call.release.set()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return call, await second
+
+    call, result = asyncio.run(run())
+
+    assert call.calls == 1
+    assert result == "done"
+
+
+def test_all_callers_cancelled_call_still_completes():
+    async def run():
+        single_flight = SingleFlight(_LOGGER, name="test_cancel_all")
+        call = _Call(exception=RuntimeError("nobody waits"))
+        caller = asyncio.create_task(single_flight.run("read", "key", call))
+        await asyncio.sleep(0)
+        caller.cancel()
+        call.release.set()
+        await asyncio.sleep(0.01)
+        # The landed call is forgotten: a new caller calls again
+        call.release = asyncio.Event()
+        call.release.set()
+        with pytest.raises(RuntimeError):
+            await single_flight.run("read", "key", call)
+        return call
+
+    assert asyncio.run(run()).calls == 2
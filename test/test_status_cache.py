@@ -0,0 +1,244 @@
+# pylint: disable=redefined-outer-name,protected-access
+"""
+Check `TTLCache` (TTL expiry, LRU eviction, entry and byte bounds, hits and misses) and its use as the
+status cache of `KubernetesPluginService`: status served from the cache, invalidated on pod creation and deletion.
+"""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import interlink as i
+import pytest
+from kubernetes import client as k
+
+from app.services.kubernetes_plugin_service import KubernetesPluginService, _sizeof_pod_status
+from app.utilities import cache_utilities
+from app.utilities.cache_utilities import TTLCache
+
+
+class _Clock:
+    """Stand-in for `time.monotonic`, advanced by hand"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture()
+def clock(monkeypatch: pytest.MonkeyPatch) -> _Clock:
+    clock = _Clock()
+    monkeypatch.setattr(cache_utilities.time, "monotonic", clock.monotonic)
+    return clock
+
+
+# region TTLCache
+
+
+def test_entry_expires_after_ttl(clock: _Clock):
+    cache: TTLCache[str, str] = TTLCache(10)
+    cache.set("a", "value")
+
+    clock.now += 9.9
+    assert cache.get("a") == "value"
+    assert "a" in cache
+
+    clock.now += 0.1
+    assert "a" not in cache
+    assert cache.get("a") is None
+    assert len(cache) == 0  # expired entry dropped on lookup
+
+
+def test_set_renews_ttl(clock: _Clock):
+    cache: TTLCache[str, str] = TTLCache(10)
+    cache.set("a", "old")
+    clock.now += 5
+    cache.set("a", "new")
+
+    clock.now += 9
+    assert cache.get("a") == "new"
+
+
+def test_disabled_with_zero_ttl():
+    cache: TTLCache[str, str] = TTLCache(0)
+    cache.set("a", "value")
+
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_evicted():
+    cache: TTLCache[str, int] = TTLCache(60, maxsize=3)
+    for n, key in enumerate("abc"):
+        cache.set(key, n)
+    cache.get("a")  # "b" becomes the least recently used
+
+    cache.set("d", 3)
+
+    assert len(cache) == 3
+    assert "b" not in cache
+    assert [cache.get(key) for key in "acd"] == [0, 2, 3]
+
+
+def test_contains_does_not_refresh_recency():
+    cache: TTLCache[str, int] = TTLCache(60, maxsize=2)
+    cache.set("a", 0)
+    cache.set("b", 1)
+    assert "a" in cache
+
+    cache.set("c", 2)
+
+    assert "a" not in cache
+    assert "b" in cache and "c" in cache
+
+
+def test_entries_bounded_by_maxsize():
+    cache: TTLCache[int, int] = TTLCache(60, maxsize=100)
+    for n in range(1000):
+        cache.set(n, n)
+
+    assert len(cache) == 100
+    assert cache.get(899) is None
+    assert cache.get(900) == 900
+
+
+def test_bytes_bounded_by_maxbytes():
+    cache: TTLCache[str, str] = TTLCache(60, maxsize=100, maxbytes=10, sizeof=len)
+    cache.set("a", "xxxx")
+    cache.set("b", "xxxx")
+    assert cache.nbytes == 8
+
+    cache.set("c", "xxxx")  # 12 bytes: "a" evicted
+
+    assert cache.nbytes == 8
+    assert "a" not in cache
+    assert "b" in cache and "c" in cache
+
+
+def test_value_larger_than_maxbytes_not_kept():
+    cache: TTLCache[str, str] = TTLCache(60, maxbytes=10, sizeof=len)
+    cache.set("a", "xxxx")
+
+    cache.set("b", "x" * 11)
+
+    assert len(cache) == 0
+    assert cache.nbytes == 0
+
+
+def test_nbytes_tracked_on_replace_pop_and_clear():
+    cache: TTLCache[str, str] = TTLCache(60, maxbytes=100, sizeof=len)
+    cache.set("a", "xxxx")
+    cache.set("b", "xx")
+    cache.set("a", "x")  # replaced
+    assert cache.nbytes == 3
+
+    cache.pop("b")
+    cache.pop("missing")
+    assert cache.nbytes == 1
+
+    cache.clear()
+    assert cache.nbytes == 0
+    assert len(cache) == 0
+
+
+def test_maxbytes_requires_sizeof():
+    with pytest.raises(AssertionError):
+        TTLCache(60, maxbytes=10)
+
+
+def test_hits_and_misses_counted(clock: _Clock):
+    cache: TTLCache[str, str] = TTLCache(10)
+    cache.get("a")
+    cache.set("a", "value")
+    cache.get("a")
+    cache.get("a")
+    assert "a" in cache  # not counted
+    clock.now += 10
+    cache.get("a")
+
+    assert (cache.hits, cache.misses) == (2, 2)
+
+
+# endregion
+
+# region KubernetesPluginService
+
+_POD_REQUEST = {"metadata": {"name": "test-pod", "namespace": "default", "uid": "uid-0"}}
+
+
+@pytest.fixture()
+def k_core_client(k_core_client: MagicMock) -> MagicMock:
+    k_core_client.read_namespaced_pod_status.side_effect = lambda name, namespace, **_kwargs: k.V1Pod(
+        metadata=k.V1ObjectMeta(name=name, namespace=namespace, uid="jid-0"), status=k.V1PodStatus()
+    )
+    k_core_client.create_namespaced_pod.return_value = k.V1Pod(metadata=k.V1ObjectMeta(uid="jid-0"))
+    return k_core_client
+
+
+@pytest.fixture()
+def service(service: KubernetesPluginService) -> KubernetesPluginService:
+    service._status_cache = TTLCache(60)  # regardless of the configured TTL
+    return service
+
+
+def _get_status(service: KubernetesPluginService) -> list[i.PodStatus]:
+    return asyncio.run(service.get_status([i.PodRequest.model_validate(_POD_REQUEST)]))
+
+
+def test_status_served_from_cache(service: KubernetesPluginService, k_core_client: MagicMock):
+    first = _get_status(service)
+    second = _get_status(service)
+
+    assert [pod_status.uid for pod_status in second] == ["uid-0"]
+    assert second == first
+    assert k_core_client.read_namespaced_pod_status.call_count == 1
+    assert service._status_cache is not None and service._status_cache.hits == 1
+
+
+def test_status_cache_invalidated_on_delete(service: KubernetesPluginService, k_core_client: MagicMock):
+    _get_status(service)
+
+    asyncio.run(service.delete_pod(i.PodRequest.model_validate(_POD_REQUEST)))
+
+    assert service._status_cache is not None and "uid-0" not in service._status_cache
+    _get_status(service)
+    assert k_core_client.read_namespaced_pod_status.call_count == 2
+
+
+def test_status_cache_invalidated_on_create(service: KubernetesPluginService, k_core_client: MagicMock):
+    _get_status(service)
+    i_pod = i.Pod(
+        pod={**_POD_REQUEST, "spec": {"containers": [{"name": "test-container", "image": "busybox"}]}},
+        container=[],
+    )
+
+    asyncio.run(service.create_pod(i_pod))
+
+    assert service._status_cache is not None and "uid-0" not in service._status_cache
+    _get_status(service)
+    assert k_core_client.read_namespaced_pod_status.call_count == 2
+
+
+def test_pod_status_size_estimated_without_serializing(monkeypatch: pytest.MonkeyPatch):
+    def pod_status(containers: int) -> i.PodStatus:
+        return i.PodStatus(
+            name="test-pod",
+            uid="uid-0",
+            namespace="default",
+            JID="jid-0",
+            containers=[
+                i.ContainerStatus(name=f"test-container-{n}", state={"running": {}}) for n in range(containers)
+            ],
+        )
+
+    def model_dump_json(*_args, **_kwargs):
+        raise AssertionError("serialized")
+
+    small, large = pod_status(1), pod_status(3)
+    monkeypatch.setattr(i.PodStatus, "model_dump_json", model_dump_json)
+
+    assert 0 < _sizeof_pod_status(small) < _sizeof_pod_status(large)
+
+
+# endregion
@@ -0,0 +1,243 @@
+# pylint: disable=redefined-outer-name,protected-access
+"""
+Check the cursors issued by `RevisionTracker` and the `/v2/status/changes` endpoint: full response without
+a (known) cursor, deltas and empty deltas with a cursor, long polling up to the timeout, with backoff or woken
+by the pod informer.
+"""
+
+import asyncio
+import logging
+import re
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+from kubernetes import client as k
+
+from app.entities.pod_status_request import PodStatusRequest
+from app.entities.remote_pod_state import RemotePodState
+from app.services import kubernetes_plugin_service
+from app.services.kubernetes_plugin_service import KubernetesPluginService
+from app.services.kubernetes_pod_informer import KubernetesPodInformer
+from app.utilities.revision_tracker import RevisionTracker
+
+_PODS = [{"metadata": {"name": f"test-pod-{n}", "namespace": "default", "uid": f"uid-{n}"}} for n in range(3)]
+
+
+# region RevisionTracker
+
+
+def test_revision_bumped_on_fingerprint_change():
+    tracker: RevisionTracker[str] = RevisionTracker()
+
+    assert tracker.update("a", 1) == 1
+    assert tracker.update("b", 1) == 2
+    assert tracker.update("a", 1) == 1  # unchanged
+    assert tracker.update("a", 2) == 3
+    tracker.forget("b")
+    assert tracker.update("b", 1) == 4  # forgotten keys are new again
+
+
+def test_cursor_format():
+    tracker: RevisionTracker[str] = RevisionTracker()
+    tracker.update("a", 1)
+
+    cursor = tracker.cursor()
+
+    assert re.fullmatch(r"[0-9a-f]{12}-1", cursor)
+    assert tracker.parse_cursor(cursor) == 1
+
+
+@pytest.mark.parametrize("cursor", [None, "", "garbage", "-1", "0123456789ab-1", "0123456789ab-"])
+def test_unknown_cursor_not_parsed(cursor: str | None):
+    assert RevisionTracker().parse_cursor(cursor) is None
+
+
+def test_cursor_of_another_tracker_not_parsed():
+    """E.g., a cursor issued before a restart"""
+    assert RevisionTracker().parse_cursor(RevisionTracker().cursor()) is None
+
+
+# endregion
+
+# region /v2/status/changes
+
+
+@pytest.fixture()
+def waiting_reasons() -> dict[str, str]:
+    """Remote containers are running, unless waiting for the given reason (by remote pod name prefix)"""
+    return {}
+
+
+def _remote_pod(name: str, namespace: str, waiting_reason: str | None = None) -> k.V1Pod:
+    state = (
+        k.V1ContainerState(waiting=k.V1ContainerStateWaiting(reason=waiting_reason))
+        if waiting_reason
+        else k.V1ContainerState(running=k.V1ContainerStateRunning())
+    )
+    container_status = k.V1ContainerStatus(
+        name="test-container", image="busybox", image_id="", ready=not waiting_reason, restart_count=0, state=state
+    )
+    return k.V1Pod(
+        metadata=k.V1ObjectMeta(name=name, namespace=namespace, uid=f"jid-{name}"),
+        status=k.V1PodStatus(container_statuses=[container_status]),
+    )
+
+
+@pytest.fixture()
+def k_core_client(k_core_client: MagicMock, waiting_reasons: dict[str, str]) -> MagicMock:
+    def read_namespaced_pod_status(name: str, namespace: str, **_kwargs) -> k.V1Pod:
+        reason = next((reason for prefix, reason in waiting_reasons.items() if name.startswith(prefix)), None)
+        return _remote_pod(name, namespace, reason)
+
+    k_core_client.read_namespaced_pod_status.side_effect = read_namespaced_pod_status
+    return k_core_client
+
+
+def _uids(response_body: dict) -> list[str]:
+    return sorted(pod["uid"] for pod in response_body["pods"])
+
+
+def test_all_pods_without_cursor(client: TestClient):
+    body = client.post("/v2/status/changes", json=_PODS).json()
+
+    assert _uids(body) == ["uid-0", "uid-1", "uid-2"]
+    assert body["cursor"]
+
+
+def test_empty_delta_without_changes(client: TestClient):
+    cursor = client.post("/v2/status/changes", json=_PODS).json()["cursor"]
+
+    body = client.post("/v2/status/changes", params={"cursor": cursor}, json=_PODS).json()
+
+    assert _uids(body) == []
+    assert body["cursor"] == cursor
+
+
+def test_delta_with_changed_pods_only(client: TestClient, waiting_reasons: dict[str, str]):
+    cursor = client.post("/v2/status/changes", json=_PODS).json()["cursor"]
+    waiting_reasons["test-pod-1-"] = "CrashLoopBackOff"
+
+    body = client.post("/v2/status/changes", params={"cursor": cursor}, json=_PODS).json()
+
+    assert _uids(body) == ["uid-1"]
+    assert body["pods"][0]["containers"][0]["state"]["waiting"]["reason"] == "CrashLoopBackOff"
+    assert body["cursor"] != cursor
+    next_body = client.request("GET", "/v2/status/changes", params={"cursor": body["cursor"]}, json=_PODS).json()
+    assert _uids(next_body) == []
+
+
+@pytest.mark.parametrize("cursor", ["garbage", RevisionTracker().cursor()])
+def test_all_pods_with_unknown_or_stale_cursor(client: TestClient, cursor: str):
+    client.post("/v2/status/changes", json=_PODS)
+
+    body = client.post("/v2/status/changes", params={"cursor": cursor}, json=_PODS).json()
+
+    assert _uids(body) == ["uid-0", "uid-1", "uid-2"]
+
+
+def test_long_poll_returns_empty_delta_on_timeout(client: TestClient):
+    cursor = client.post("/v2/status/changes", json=_PODS).json()["cursor"]
+
+    started_at = time.monotonic()
+    body = client.post("/v2/status/changes", params={"cursor": cursor, "timeout_seconds": 0.5}, json=_PODS).json()
+
+    assert _uids(body) == []
+    assert body["cursor"] == cursor
+    assert 0.5 <= time.monotonic() - started_at < 2
+
+
+def test_long_poll_returns_on_change(service: KubernetesPluginService, waiting_reasons: dict[str, str]):
+    i_pods = [PodStatusRequest.model_validate(pod) for pod in _PODS]
+
+    async def run():
+        cursor, _pods_status = await service.get_status_changes(i_pods, None)
+        long_poll = asyncio.create_task(service.get_status_changes(i_pods, cursor, timeout_seconds=30))
+        await asyncio.sleep(0.1)
+        waiting_reasons["test-pod-2-"] = "ImagePullBackOff"
+        return await asyncio.wait_for(long_poll, timeout=5)
+
+    _cursor, pods_status = asyncio.run(run())
+
+    assert [pod_status.uid for pod_status in pods_status] == ["uid-2"]
+
+
+def test_timeout_out_of_range_rejected(client: TestClient):
+    response = client.post("/v2/status/changes", params={"timeout_seconds": 301}, json=_PODS)
+
+    assert response.status_code == 422
+
+
+def test_long_poll_backs_off_without_informer(
+    service: KubernetesPluginService, k_core_client: MagicMock, monkeypatch: pytest.MonkeyPatch
+):
+    """Status is read from the API server, less and less often"""
+    clock = [0.0]
+    sleep = asyncio.sleep
+
+    async def advance_clock(seconds: float, *args, **kwargs):
+        clock[0] += seconds
+        return await sleep(0, *args, **kwargs)
+
+    monkeypatch.setattr(kubernetes_plugin_service.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(asyncio, "sleep", advance_clock)
+    i_pods = [PodStatusRequest.model_validate(pod) for pod in _PODS]
+
+    async def run():
+        cursor, _pods_status = await service.get_status_changes(i_pods, None)
+        k_core_client.read_namespaced_pod_status.reset_mock()
+        return await service.get_status_changes(i_pods, cursor, timeout_seconds=60)
+
+    _cursor, pods_status = asyncio.run(run())
+
+    assert pods_status == []
+    # read at 0, 1, 3, 7, 15, 31, 47 seconds, then on timeout
+    assert k_core_client.read_namespaced_pod_status.call_count == 8 * len(_PODS)
+
+
+def test_long_poll_woken_by_informer(service: KubernetesPluginService, k_core_client: MagicMock):
+    """Status is read from the informer index, again only once it changes"""
+    informer = KubernetesPodInformer(
+        logging.getLogger(__name__),
+        MagicMock(),
+        label_selector="interlink.io=offloading",
+        index_label_key="interlink.io/source.pod_uid",
+        resync_seconds=300,
+        max_staleness_seconds=300,
+    )
+    informer._synced_at = time.monotonic()
+    service._pod_informer = informer
+    remote_pods = {}
+    for pod in _PODS:
+        name = service._scope_obj_name(pod["metadata"]["name"], pod_uid=pod["metadata"]["uid"])
+        remote_pods[pod["metadata"]["uid"]] = (service._scope_ns_name(pod["metadata"]["namespace"]), name)
+    for uid, (namespace, name) in remote_pods.items():
+        informer._set((namespace, uid), RemotePodState(_remote_pod(name, namespace), source_pod_uid=uid))
+    i_pods = [PodStatusRequest.model_validate(pod) for pod in _PODS]
+
+    async def run():
+        cursor, _pods_status = await service.get_status_changes(i_pods, None)
+        long_poll = asyncio.create_task(service.get_status_changes(i_pods, cursor, timeout_seconds=30))
+        await asyncio.sleep(0.1)
+        namespace, name = remote_pods["uid-1"]
+        remote_pod = _remote_pod(name, namespace, "CrashLoopBackOff")
+        await asyncio.to_thread(informer._set, (namespace, "uid-1"), RemotePodState(remote_pod, source_pod_uid="uid-1"))
+        return await asyncio.wait_for(long_poll, timeout=0.5)  # sooner than polling
+
+    _cursor, pods_status = asyncio.run(run())
+
+    assert [pod_status.uid for pod_status in pods_status] == ["uid-1"]
+    k_core_client.read_namespaced_pod_status.assert_not_called()
+
+
+def test_pods_without_uid_not_tracked(service: KubernetesPluginService, monkeypatch: pytest.MonkeyPatch):
+    forgotten: list[str | None] = []
+    monkeypatch.setattr(service._status_revisions, "forget", forgotten.append)
+    i_pods = [PodStatusRequest.model_validate({"metadata": {"name": "test-pod", "namespace": "default"}})]
+
+    assert service._track_status_changes(i_pods, [], None) == []
+    assert not forgotten
+
+
+# endregion
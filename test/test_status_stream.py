@@ -0,0 +1,126 @@
+# pylint: disable=redefined-outer-name,protected-access
+"""
+Check the `/v2/status` endpoint: one `PodStatus` per line (newline-delimited JSON), the same pods status
+as `/status`, pods not found omitted, at most `offloading.status_concurrency` reads in flight.
+"""
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+from kubernetes import client as k
+
+from app.services.kubernetes_plugin_service import KubernetesPluginService
+from app.utilities.kubernetes_async_client import AsyncCoreV1Api
+
+_PODS = [{"metadata": {"name": f"test-pod-{n}", "namespace": "default", "uid": f"uid-{n}"}} for n in range(8)]
+
+
+class _ReadsInFlight:
+    """Count the concurrent reads of the remote pods status"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.current = 0
+        self.max = 0
+
+    def __enter__(self):
+        with self._lock:
+            self.current += 1
+            self.max = max(self.max, self.current)
+
+    def __exit__(self, *_exc_info):
+        with self._lock:
+            self.current -= 1
+
+
+@pytest.fixture()
+def missing_pods() -> set[str]:
+    """Remote pods not found, by source pod name prefix"""
+    return set()
+
+
+@pytest.fixture()
+def reads_in_flight() -> _ReadsInFlight:
+    return _ReadsInFlight()
+
+
+@pytest.fixture()
+def k_core_client(k_core_client: MagicMock, missing_pods: set[str], reads_in_flight: _ReadsInFlight) -> MagicMock:
+    def read_namespaced_pod_status(name: str, namespace: str, **_kwargs) -> k.V1Pod:
+        with reads_in_flight:
+            time.sleep(0.01)
+            if any(name.startswith(prefix) for prefix in missing_pods):
+                raise k.ApiException(status=404, reason="Not Found")
+            container_status = k.V1ContainerStatus(
+                name="test-container",
+                image="busybox",
+                image_id="",
+                ready=True,
+                restart_count=0,
+                state=k.V1ContainerState(running=k.V1ContainerStateRunning()),
+            )
+            return k.V1Pod(
+                metadata=k.V1ObjectMeta(name=name, namespace=namespace, uid=f"jid-{name}"),
+                status=k.V1PodStatus(container_statuses=[container_status]),
+            )
+
+    k_core_client.read_namespaced_pod_status.side_effect = read_namespaced_pod_status
+    return k_core_client
+
+
+def _lines(client: TestClient, method: str = "POST") -> list[dict]:
+    response = client.request(method, "/v2/status", json=_PODS)
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert response.text.endswith("\n")
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+def _by_uid(pods_status: list[dict]) -> dict[str, dict]:
+    return {pod_status["uid"]: pod_status for pod_status in pods_status}
+
+
+@pytest.mark.parametrize("method", ["GET", "POST"])
+def test_one_pod_status_per_line(client: TestClient, method: str):
+    lines = _lines(client, method)
+
+    assert sorted(line["uid"] for line in lines) == sorted(pod["metadata"]["uid"] for pod in _PODS)
+    assert all(line["containers"][0]["state"]["running"] is not None for line in lines)
+
+
+def test_same_pods_status_as_v1(client: TestClient):
+    v1_pods_status = client.post("/status", json=_PODS).json()
+
+    assert _by_uid(_lines(client)) == _by_uid(v1_pods_status)
+
+
+def test_pods_not_found_omitted(client: TestClient, missing_pods: set[str]):
+    missing_pods.update({"test-pod-1-", "test-pod-6-"})
+
+    lines = _lines(client)
+
+    assert sorted(line["uid"] for line in lines) == ["uid-0", "uid-2", "uid-3", "uid-4", "uid-5", "uid-7"]
+
+
+def test_no_pods(client: TestClient):
+    response = client.post("/v2/status", json=[])
+
+    assert response.status_code == 200
+    assert response.text == ""
+
+
+def test_reads_in_flight_limited(
+    client: TestClient, service: KubernetesPluginService, k_core_client: MagicMock, reads_in_flight: _ReadsInFlight
+):
+    service._offloading_params["status_concurrency"] = 2
+    with ThreadPoolExecutor(len(_PODS)) as executor:
+        service._k_core_client = AsyncCoreV1Api(k_core_client, executor)  # reads not serialized by the event loop
+
+        assert len(_lines(client)) == len(_PODS)
+
+    assert reads_in_flight.max == 2
@@ -0,0 +1,134 @@
+"""
+Check `KeyedWorkQueue`: per-key coalescing, retries with backoff, and draining on exit.
+"""
+
+import asyncio
+import logging
+
+import pytest
+
+from app.common import metrics
+from app.utilities.work_queue import KeyedWorkQueue
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@pytest.fixture()
+def backoff_delays(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Record the delays waited by backoff between attempts, without actually waiting"""
+    delays: list[float] = []
+    sleep = asyncio.sleep
+
+    async def record_delay(seconds: float, *args, **kwargs):
+        if seconds:
+            delays.append(seconds)
+        return await sleep(0, *args, **kwargs)
+
+    monkeypatch.setattr(asyncio, "sleep", record_delay)
+    return delays
+
+
+def test_jobs_with_same_key_coalesced():
+    runs: list[str] = []
+
+    async def run():
+        release = asyncio.Event()
+
+        async def job(key: str):
+            await release.wait()
+            runs.append(key)
+
+        async with KeyedWorkQueue(_LOGGER, name="test_coalesce", workers=2, max_tries=1) as queue:
+            assert queue.put("a", lambda: job("a"))
+            assert not queue.put("a", lambda: job("a"))  # pending
+            assert queue.put("b", lambda: job("b"))
+            await asyncio.sleep(0)
+            assert not queue.put("a", lambda: job("a"))  # running
+            assert "a" in queue and len(queue) == 2
+            release.set()
+        assert len(queue) == 0
+
+        # A key can be enqueued again once its job completed
+        async with KeyedWorkQueue(_LOGGER, name="test_coalesce", workers=1, max_tries=1) as queue:
+            assert queue.put("a", lambda: job("a"))
+
+    asyncio.run(run())
+
+    assert sorted(runs) == ["a", "a", "b"]
+    assert metrics.snapshot()["test_coalesce_coalesced"] == 2
+
+
+def test_failed_job_retried_with_backoff(backoff_delays: list[float]):
+    attempts: list[int] = []
+
+    async def flaky_job():
+        attempts.append(len(attempts) + 1)
+        if len(attempts) < 3:
+            raise RuntimeError("transient")
+
+    async def run():
+        async with KeyedWorkQueue(_LOGGER, name="test_retry", workers=1, max_tries=5) as queue:
+            queue.put("a", flaky_job)
+
+    asyncio.run(run())
+
+    assert attempts == [1, 2, 3]
+    assert len(backoff_delays) == 2
+    assert all(0 <= delay <= 2**n for n, delay in enumerate(backoff_delays))  # exponential, with full jitter
+    assert "test_retry_failed" not in metrics.snapshot()
+
+
+def test_job_dropped_after_max_tries(backoff_delays: list[float]):
+    attempts: list[int] = []
+
+    async def failing_job():
+        attempts.append(len(attempts) + 1)
+        raise RuntimeError("permanent")
+
+    async def run():
+        async with KeyedWorkQueue(_LOGGER, name="test_give_up", workers=1, max_tries=3) as queue:
+            queue.put("a", failing_job)
+        return queue
+
+    queue = asyncio.run(run())
+
+    assert attempts == [1, 2, 3]
+    assert len(backoff_delays) == 2
+    assert len(queue) == 0
+    assert metrics.snapshot()["test_give_up_failed"] == 1
+
+
+def test_pending_jobs_drained_on_exit():
+    completed: list[int] = []
+
+    async def job(n: int):
+        await asyncio.sleep(0.01)
+        completed.append(n)
+
+    async def run():
+        async with KeyedWorkQueue(_LOGGER, name="test_drain", workers=2, max_tries=1) as queue:
+            for n in range(10):
+                queue.put(n, lambda n=n: job(n))
+
+    asyncio.run(run())
+
+    assert sorted(completed) == list(range(10))
+
+
+def test_jobs_not_completed_within_drain_timeout_cancelled():
+    completed: list[str] = []
+
+    async def slow_job():
+        await asyncio.sleep(10)
+        completed.append("slow")
+
+    async def run():
+        async with KeyedWorkQueue(
+            _LOGGER, name="test_drain_timeout", workers=1, max_tries=1, drain_timeout_seconds=0.05
+        ) as queue:
+            queue.put("slow", slow_job)
+        return queue
+
+    asyncio.run(asyncio.wait_for(run(), timeout=5))
+
+    assert not completed